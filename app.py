@@ -8,19 +8,27 @@ Three main sections:
 3. Test - Validate the installation
 
 Run:
-    python3 app.py
+    python3 app.py              # waitress if installed, else Flask's threaded server
+    FLASK_DEBUG=1 python3 app.py  # with reloader and debugger
 
 Then open: http://localhost:5001
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
+import os
 import sys
-import base64
-import tempfile
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template_string, request, jsonify
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from flask import Flask, request, jsonify, Response, url_for
+from flask.json.provider import DefaultJSONProvider
 import secrets
 import threading
 
@@ -29,1042 +37,345 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.agents.phased_interview_agent import PhasedInterviewAgent
 from src.schemas.implementation_spec import create_spec_from_interview, ImplementationSpec
-from src.builders.odoo_builder import OdooBuilder, BuildState, TaskStatus
-from src.builders.cloud_builder import CloudOdooBuilder, CloudProvider, CloudBuildState, get_available_providers
+# Builders are imported inside the build runners: most sessions never start a build
 
-app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
-
-# Global state
-sessions = {}  # Interview sessions
-builds = {}    # Build states
-builders = {}  # Active builders
-
-# Try to load whisper for transcription
 try:
-    from src.voice.speech_to_text import SpeechToText
-    WHISPER_AVAILABLE = True
-    whisper_model = None
+    import orjson
 except ImportError:
-    WHISPER_AVAILABLE = False
-
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Odoo Implementation Assistant</title>
-    <style>
-        * { box-sizing: border-box; margin: 0; padding: 0; }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-
-        .app-container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-
-        /* Navigation */
-        .nav-tabs {
-            display: flex;
-            gap: 4px;
-            margin-bottom: 20px;
-        }
-
-        .nav-tab {
-            padding: 14px 28px;
-            background: rgba(255,255,255,0.2);
-            border: none;
-            border-radius: 8px 8px 0 0;
-            color: white;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .nav-tab:hover { background: rgba(255,255,255,0.3); }
-        .nav-tab.active { background: white; color: #714B67; }
-        .nav-tab:disabled { opacity: 0.5; cursor: not-allowed; }
-
-        .nav-tab .step-num {
-            display: inline-block;
-            width: 24px;
-            height: 24px;
-            line-height: 24px;
-            text-align: center;
-            background: rgba(255,255,255,0.2);
-            border-radius: 50%;
-            margin-right: 8px;
-            font-size: 12px;
-        }
-
-        .nav-tab.active .step-num { background: #714B67; color: white; }
-        .nav-tab.completed .step-num { background: #4CAF50; }
-
-        /* Main Card */
-        .main-card {
-            background: white;
-            border-radius: 0 16px 16px 16px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            min-height: 600px;
-            overflow: hidden;
-        }
-
-        .card-header {
-            background: linear-gradient(135deg, #714B67 0%, #4A3347 100%);
-            color: white;
-            padding: 24px 30px;
-        }
-
-        .card-header h1 { font-size: 24px; margin-bottom: 4px; }
-        .card-header p { opacity: 0.9; font-size: 14px; }
-
-        .card-content {
-            padding: 30px;
-        }
-
-        /* Tab panels */
-        .tab-panel { display: none; }
-        .tab-panel.active { display: block; }
-
-        /* Common elements */
-        .btn {
-            background: linear-gradient(135deg, #714B67 0%, #4A3347 100%);
-            color: white;
-            border: none;
-            padding: 14px 28px;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-
-        .btn:hover { transform: translateY(-2px); box-shadow: 0 4px 12px rgba(113,75,103,0.4); }
-        .btn:disabled { opacity: 0.6; cursor: not-allowed; transform: none; }
-        .btn-secondary { background: #f0f0f0; color: #333; }
-        .btn-secondary:hover { background: #e0e0e0; box-shadow: none; }
-        .btn-success { background: #4CAF50; }
-        .btn-small { padding: 8px 16px; font-size: 13px; }
-
-        .form-group {
-            margin-bottom: 20px;
-        }
-
-        .form-group label {
-            display: block;
-            font-weight: 600;
-            color: #333;
-            margin-bottom: 8px;
-        }
-
-        .form-group input, .form-group select {
-            width: 100%;
-            padding: 12px 16px;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            font-size: 16px;
-        }
-
-        .form-group input:focus, .form-group select:focus {
-            outline: none;
-            border-color: #714B67;
-        }
-
-        /* Progress section */
-        .progress-section {
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-
-        .progress-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 12px;
-        }
-
-        .progress-bar-container {
-            background: #e0e0e0;
-            border-radius: 10px;
-            height: 12px;
-            overflow: hidden;
-        }
-
-        .progress-bar {
-            background: linear-gradient(90deg, #714B67 0%, #9B6B8F 100%);
-            height: 100%;
-            border-radius: 10px;
-            transition: width 0.5s ease;
-        }
-
-        /* Chat messages */
-        .chat-messages {
-            height: 300px;
-            overflow-y: auto;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }
-
-        .message {
-            margin-bottom: 16px;
-            display: flex;
-            gap: 12px;
-        }
-
-        .message.bot { flex-direction: row; }
-        .message.user { flex-direction: row-reverse; }
-
-        .message-avatar {
-            width: 36px;
-            height: 36px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 18px;
-            flex-shrink: 0;
-        }
-
-        .message.bot .message-avatar { background: linear-gradient(135deg, #714B67, #4A3347); }
-        .message.user .message-avatar { background: #e0e0e0; }
-
-        .message-content {
-            max-width: 75%;
-            padding: 12px 16px;
-            border-radius: 16px;
-            line-height: 1.5;
-            font-size: 14px;
-        }
-
-        .message.bot .message-content { background: white; border: 1px solid #e0e0e0; }
-        .message.user .message-content { background: linear-gradient(135deg, #714B67, #4A3347); color: white; }
-
-        .chat-input-container {
-            display: flex;
-            gap: 12px;
-        }
-
-        .chat-input {
-            flex: 1;
-            padding: 14px 18px;
-            border: 2px solid #e0e0e0;
-            border-radius: 24px;
-            font-size: 15px;
-        }
-
-        .chat-input:focus { outline: none; border-color: #714B67; }
-
-        /* Build tracker */
-        .build-tasks {
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }
-
-        .build-task {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            padding: 16px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border-left: 4px solid #e0e0e0;
-        }
-
-        .build-task.pending { border-left-color: #e0e0e0; }
-        .build-task.in_progress { border-left-color: #2196F3; background: #e3f2fd; }
-        .build-task.completed { border-left-color: #4CAF50; }
-        .build-task.failed { border-left-color: #f44336; background: #ffebee; }
-
-        .task-icon {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 20px;
-            background: white;
-        }
-
-        .task-info { flex: 1; }
-        .task-name { font-weight: 600; margin-bottom: 4px; }
-        .task-description { font-size: 13px; color: #666; }
-
-        .task-status {
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-
-        .task-status.pending { background: #e0e0e0; color: #666; }
-        .task-status.in_progress { background: #2196F3; color: white; }
-        .task-status.completed { background: #4CAF50; color: white; }
-        .task-status.failed { background: #f44336; color: white; }
-
-        /* Summary cards */
-        .summary-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 16px;
-            margin-bottom: 20px;
-        }
-
-        .summary-card {
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 12px;
-            text-align: center;
-        }
-
-        .summary-card h3 { font-size: 32px; color: #714B67; margin-bottom: 8px; }
-        .summary-card p { font-size: 14px; color: #666; }
-
-        /* Module tags */
-        .module-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-        }
-
-        .module-tag {
-            padding: 8px 14px;
-            border-radius: 20px;
-            font-size: 13px;
-            font-weight: 500;
-            background: #e8f5e9;
-            color: #2e7d32;
-        }
-
-        /* Test section */
-        .test-cards {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-        }
-
-        .test-card {
-            background: #f8f9fa;
-            padding: 24px;
-            border-radius: 12px;
-            text-align: center;
-        }
-
-        .test-card h3 { margin-bottom: 12px; }
-        .test-card p { font-size: 14px; color: #666; margin-bottom: 16px; }
-
-        .spinner {
-            width: 40px;
-            height: 40px;
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #714B67;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin: 0 auto;
-        }
-
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .hidden { display: none !important; }
-
-        /* Phase steps */
-        .phase-steps {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 16px;
-        }
-
-        .phase-step {
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            font-size: 12px;
-            color: #999;
-        }
-
-        .phase-step.active { color: #714B67; font-weight: 600; }
-        .phase-step.completed { color: #4CAF50; }
-
-        .phase-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            background: #e0e0e0;
-        }
-
-        .phase-step.active .phase-dot { background: #714B67; }
-        .phase-step.completed .phase-dot { background: #4CAF50; }
-
-        .domain-pill {
-            display: inline-block;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 500;
-            margin: 2px;
-        }
-
-        .domain-pill.active { background: #714B67; color: white; }
-        .domain-pill.completed { background: #4CAF50; color: white; }
-        .domain-pill.pending { background: #e0e0e0; color: #666; }
-
-        .logs-container {
-            background: #1e1e1e;
-            color: #0f0;
-            font-family: monospace;
-            font-size: 12px;
-            padding: 16px;
-            border-radius: 8px;
-            max-height: 200px;
-            overflow-y: auto;
-            margin-top: 20px;
-        }
-
-        .log-entry { margin-bottom: 4px; }
-    </style>
-</head>
-<body>
-    <div class="app-container">
-        <!-- Navigation Tabs -->
-        <div class="nav-tabs">
-            <button class="nav-tab active" id="tab-interview" onclick="switchTab('interview')">
-                <span class="step-num">1</span> Interview
-            </button>
-            <button class="nav-tab" id="tab-build" onclick="switchTab('build')" disabled>
-                <span class="step-num">2</span> Build
-            </button>
-            <button class="nav-tab" id="tab-test" onclick="switchTab('test')" disabled>
-                <span class="step-num">3</span> Test
-            </button>
-        </div>
-
-        <div class="main-card">
-            <!-- ==================== INTERVIEW TAB ==================== -->
-            <div class="tab-panel active" id="panel-interview">
-                <div class="card-header">
-                    <h1>🏢 Requirements Interview</h1>
-                    <p>Let's understand your business needs for Odoo</p>
-                </div>
-
-                <div class="card-content">
-                    <!-- Setup Form -->
-                    <div id="setup-form">
-                        <div class="form-group">
-                            <label>Company Name</label>
-                            <input type="text" id="client-name" placeholder="e.g., Acme Corporation">
-                        </div>
-                        <div class="form-group">
-                            <label>Industry</label>
-                            <select id="industry">
-                                <option value="E-commerce">E-commerce / Online Retail</option>
-                                <option value="Manufacturing">Manufacturing</option>
-                                <option value="Retail">Retail / Brick & Mortar</option>
-                                <option value="Services">Professional Services</option>
-                                <option value="Distribution">Distribution / Wholesale</option>
-                                <option value="Technology">Technology / Software</option>
-                                <option value="Other">Other</option>
-                            </select>
-                        </div>
-                        <button class="btn" onclick="startInterview()">Start Interview →</button>
-                    </div>
-
-                    <!-- Interview Chat -->
-                    <div id="interview-chat" class="hidden">
-                        <div class="progress-section">
-                            <div class="phase-steps">
-                                <div class="phase-step" id="phase-scoping">
-                                    <div class="phase-dot"></div>
-                                    <span>1. Scoping</span>
-                                </div>
-                                <div class="phase-step" id="phase-domains">
-                                    <div class="phase-dot"></div>
-                                    <span>2. Domain Expert</span>
-                                </div>
-                                <div class="phase-step" id="phase-summary">
-                                    <div class="phase-dot"></div>
-                                    <span>3. Summary</span>
-                                </div>
-                            </div>
-                            <div class="progress-header">
-                                <span id="current-phase">Phase: Scoping</span>
-                                <span id="progress-percent">0%</span>
-                            </div>
-                            <div class="progress-bar-container">
-                                <div class="progress-bar" id="progress-bar" style="width: 0%"></div>
-                            </div>
-                            <div id="domain-pills"></div>
-                        </div>
-
-                        <div class="chat-messages" id="chat-messages"></div>
-
-                        <div class="chat-input-container">
-                            <input type="text" class="chat-input" id="user-input" placeholder="Type your answer..." onkeypress="if(event.key==='Enter')sendMessage()">
-                            <button class="btn" onclick="sendMessage()">➤</button>
-                        </div>
-
-                        <div style="margin-top: 12px; display: flex; gap: 8px;">
-                            <button class="btn btn-secondary btn-small" onclick="skipQuestion()">Skip</button>
-                            <button class="btn btn-secondary btn-small" onclick="endInterview()">End & Continue to Build</button>
-                        </div>
-                    </div>
-
-                    <!-- Interview Complete -->
-                    <div id="interview-complete" class="hidden">
-                        <h2 style="margin-bottom: 20px;">✅ Interview Complete!</h2>
-
-                        <div class="summary-grid">
-                            <div class="summary-card">
-                                <h3 id="modules-count">0</h3>
-                                <p>Modules to Install</p>
-                            </div>
-                            <div class="summary-card">
-                                <h3 id="domains-count">0</h3>
-                                <p>Business Areas</p>
-                            </div>
-                            <div class="summary-card">
-                                <h3 id="est-time">~15</h3>
-                                <p>Minutes to Build</p>
-                            </div>
-                        </div>
-
-                        <h4 style="margin-bottom: 12px;">Recommended Modules:</h4>
-                        <div class="module-tags" id="recommended-modules"></div>
-
-                        <div style="margin-top: 30px;">
-                            <h4 style="margin-bottom: 16px;">Choose Deployment Method:</h4>
-                            <div style="display: flex; gap: 16px; flex-wrap: wrap;">
-                                <div style="flex: 1; min-width: 250px; background: #f8f9fa; padding: 20px; border-radius: 12px; border: 2px solid #e0e0e0;">
-                                    <h4>🐳 Local Docker</h4>
-                                    <p style="font-size: 13px; color: #666; margin: 12px 0;">Run Odoo on your machine. Requires Docker Desktop installed.</p>
-                                    <button class="btn" onclick="startBuild('docker')">Use Docker →</button>
-                                </div>
-                                <div style="flex: 1; min-width: 250px; background: #e8f5e9; padding: 20px; border-radius: 12px; border: 2px solid #4CAF50;">
-                                    <h4>☁️ Cloud Deploy <span style="background: #4CAF50; color: white; font-size: 10px; padding: 2px 6px; border-radius: 8px; margin-left: 8px;">FREE</span></h4>
-                                    <p style="font-size: 13px; color: #666; margin: 12px 0;">Deploy to free cloud hosting. No installation needed!</p>
-                                    <button class="btn btn-success" onclick="startBuild('cloud')">Use Cloud →</button>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- ==================== BUILD TAB ==================== -->
-            <div class="tab-panel" id="panel-build">
-                <div class="card-header">
-                    <h1 id="build-header-title">🔧 Building Your Odoo</h1>
-                    <p id="build-header-desc">Setting up Docker, installing modules, and configuring your system</p>
-                </div>
-
-                <div class="card-content">
-                    <!-- Cloud Provider Selection (only shown for cloud builds) -->
-                    <div id="cloud-provider-select" class="hidden" style="margin-bottom: 24px;">
-                        <h4 style="margin-bottom: 16px;">Select Cloud Provider:</h4>
-                        <div id="provider-cards" style="display: flex; gap: 12px; flex-wrap: wrap;"></div>
-                    </div>
-
-                    <div class="progress-section">
-                        <div class="progress-header">
-                            <span id="build-status">Preparing...</span>
-                            <span id="build-percent">0%</span>
-                        </div>
-                        <div class="progress-bar-container">
-                            <div class="progress-bar" id="build-progress-bar" style="width: 0%"></div>
-                        </div>
-                    </div>
-
-                    <div class="build-tasks" id="build-tasks">
-                        <!-- Tasks will be populated dynamically -->
-                    </div>
-
-                    <div class="logs-container" id="build-logs">
-                        <div class="log-entry">Waiting to start...</div>
-                    </div>
-
-                    <!-- Cloud Instructions Panel -->
-                    <div id="cloud-instructions" class="hidden" style="margin-top: 20px; padding: 20px; background: #fff3cd; border-radius: 12px; border-left: 4px solid #ffc107;">
-                        <h4 style="margin-bottom: 12px;">📋 Action Required</h4>
-                        <p id="cloud-action-text">Follow the instructions below...</p>
-                        <a id="cloud-action-url" href="#" target="_blank" class="btn btn-small" style="margin-top: 12px; display: inline-block; text-decoration: none;">
-                            Open Provider →
-                        </a>
-                        <button class="btn btn-secondary btn-small" style="margin-left: 8px;" onclick="confirmCloudStep()">I've Done This ✓</button>
-                    </div>
-
-                    <div id="build-complete" class="hidden" style="margin-top: 30px; text-align: center;">
-                        <h2>🎉 Build Complete!</h2>
-                        <p style="margin: 20px 0;">Your Odoo instance is ready at:</p>
-                        <a id="odoo-url" href="#" target="_blank" class="btn btn-success" style="display: inline-block; text-decoration: none;">
-                            Open Odoo →
-                        </a>
-                        <p style="margin-top: 16px; color: #666;">
-                            Default login: <strong>admin</strong> / Password: <strong>admin</strong>
-                        </p>
-                        <button class="btn" style="margin-top: 20px;" onclick="switchTab('test')">Continue to Testing →</button>
-                    </div>
-                </div>
-            </div>
-
-            <!-- ==================== TEST TAB ==================== -->
-            <div class="tab-panel" id="panel-test">
-                <div class="card-header">
-                    <h1>✅ Test Your Odoo</h1>
-                    <p>Validate that everything is working correctly</p>
-                </div>
-
-                <div class="card-content">
-                    <div id="test-content">
-                        <p style="margin-bottom: 30px;">Run these tests to make sure your Odoo instance is configured correctly.</p>
-
-                        <div class="test-cards">
-                            <div class="test-card">
-                                <h3>🔌 Connection</h3>
-                                <p>Check if Odoo is responding</p>
-                                <button class="btn btn-small" onclick="runTest('connection')">Run Test</button>
-                                <div id="test-connection-result" style="margin-top: 12px;"></div>
-                            </div>
-
-                            <div class="test-card">
-                                <h3>📦 Modules</h3>
-                                <p>Verify all modules are installed</p>
-                                <button class="btn btn-small" onclick="runTest('modules')">Run Test</button>
-                                <div id="test-modules-result" style="margin-top: 12px;"></div>
-                            </div>
-
-                            <div class="test-card">
-                                <h3>🏢 Company</h3>
-                                <p>Check company configuration</p>
-                                <button class="btn btn-small" onclick="runTest('company')">Run Test</button>
-                                <div id="test-company-result" style="margin-top: 12px;"></div>
-                            </div>
-
-                            <div class="test-card">
-                                <h3>👥 Users</h3>
-                                <p>Test user login</p>
-                                <button class="btn btn-small" onclick="runTest('users')">Run Test</button>
-                                <div id="test-users-result" style="margin-top: 12px;"></div>
-                            </div>
-                        </div>
-
-                        <div style="margin-top: 40px; padding: 20px; background: #e8f5e9; border-radius: 12px; text-align: center;">
-                            <h3>🎉 All Done!</h3>
-                            <p style="margin: 16px 0;">Your Odoo instance is ready for use.</p>
-                            <a id="final-odoo-url" href="#" target="_blank" class="btn btn-success" style="display: inline-block; text-decoration: none;">
-                                Launch Odoo →
-                            </a>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // State
-        let sessionId = null;
-        let buildId = null;
-        let currentQuestion = null;
-        let interviewSummary = null;
-        let implementationSpec = null;
-        let buildPollInterval = null;
-
-        // Tab switching
-        function switchTab(tab) {
-            document.querySelectorAll('.nav-tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-panel').forEach(p => p.classList.remove('active'));
-
-            document.getElementById('tab-' + tab).classList.add('active');
-            document.getElementById('panel-' + tab).classList.add('active');
-        }
-
-        // ==================== INTERVIEW ====================
-        async function startInterview() {
-            const clientName = document.getElementById('client-name').value.trim();
-            const industry = document.getElementById('industry').value;
-
-            if (!clientName) {
-                alert('Please enter a company name');
-                return;
-            }
+    orjson = None
 
-            const response = await fetch('/api/interview/start', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ client_name: clientName, industry: industry })
-            });
-
-            const data = await response.json();
-            sessionId = data.session_id;
-
-            document.getElementById('setup-form').classList.add('hidden');
-            document.getElementById('interview-chat').classList.remove('hidden');
-
-            addMessage('bot', `Welcome! Let's gather requirements for ${clientName}'s Odoo implementation.`);
-            await getNextQuestion();
-        }
-
-        async function getNextQuestion() {
-            const response = await fetch(`/api/interview/question?session_id=${sessionId}`);
-            const data = await response.json();
-
-            if (data.complete) {
-                showInterviewComplete(data.summary, data.spec);
-                return;
-            }
-
-            currentQuestion = data;
-
-            if (data.expert_intro) {
-                addMessage('bot', data.expert_intro, 'expert-intro');
-            }
-
-            addMessage('bot', data.question);
-            updateProgress(data.progress);
-        }
-
-        async function sendMessage() {
-            const input = document.getElementById('user-input');
-            const message = input.value.trim();
-            if (!message || !currentQuestion) return;
-
-            input.value = '';
-            addMessage('user', message);
-
-            const response = await fetch('/api/interview/respond', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    session_id: sessionId,
-                    response: message,
-                    question: currentQuestion
-                })
-            });
-
-            const data = await response.json();
-            updateProgress(data.progress);
-            await getNextQuestion();
-        }
-
-        async function skipQuestion() {
-            if (!currentQuestion) return;
-            addMessage('user', '[Skipped]');
-
-            await fetch('/api/interview/skip', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ session_id: sessionId, question: currentQuestion })
-            });
-
-            await getNextQuestion();
-        }
-
-        async function endInterview() {
-            const response = await fetch('/api/interview/end', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ session_id: sessionId })
-            });
-
-            const data = await response.json();
-            showInterviewComplete(data.summary, data.spec);
-        }
-
-        function showInterviewComplete(summary, spec) {
-            interviewSummary = summary;
-            implementationSpec = spec;
-
-            document.getElementById('interview-chat').classList.add('hidden');
-            document.getElementById('interview-complete').classList.remove('hidden');
-
-            document.getElementById('modules-count').textContent = spec.modules.length;
-            document.getElementById('domains-count').textContent = summary.domains_covered.length;
-            document.getElementById('est-time').textContent = '~' + spec.estimated_setup_minutes;
+try:
+    import brotli  # Precompressed page for browsers that accept br
+except ImportError:
+    brotli = None
 
-            const modulesDiv = document.getElementById('recommended-modules');
-            modulesDiv.innerHTML = spec.modules.map(m =>
-                `<span class="module-tag">${m.display_name}</span>`
-            ).join('');
+try:
+    import uvloop  # Faster event loop for the build threads (not available on Windows)
+except ImportError:
+    uvloop = None
 
-            // Enable build tab
-            document.getElementById('tab-build').disabled = false;
-            document.getElementById('tab-interview').classList.add('completed');
-        }
 
-        function addMessage(type, content, extraClass = '') {
-            const messagesDiv = document.getElementById('chat-messages');
-            const div = document.createElement('div');
-            div.className = `message ${type}`;
-            div.innerHTML = `
-                <div class="message-avatar">${type === 'bot' ? '🤖' : '👤'}</div>
-                <div class="message-content ${extraClass}">${content}</div>
-            `;
-            messagesDiv.appendChild(div);
-            messagesDiv.scrollTop = messagesDiv.scrollHeight;
-        }
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; falls back to Flask's encoder for odd types."""
 
-        function updateProgress(progress) {
-            if (!progress) return;
-
-            document.getElementById('progress-percent').textContent = progress.overall_percent + '%';
-            document.getElementById('progress-bar').style.width = progress.overall_percent + '%';
-            document.getElementById('current-phase').textContent = `Phase: ${progress.phase}`;
-
-            // Update phase steps
-            const steps = ['scoping', 'domains', 'summary'];
-            steps.forEach(s => document.getElementById('phase-' + s).className = 'phase-step');
-
-            if (progress.phase === 'Scoping') {
-                document.getElementById('phase-scoping').classList.add('active');
-            } else if (progress.phase.startsWith('Expert')) {
-                document.getElementById('phase-scoping').classList.add('completed');
-                document.getElementById('phase-domains').classList.add('active');
-            } else {
-                document.getElementById('phase-scoping').classList.add('completed');
-                document.getElementById('phase-domains').classList.add('completed');
-                document.getElementById('phase-summary').classList.add('active');
-            }
-
-            // Domain pills
-            const pillsDiv = document.getElementById('domain-pills');
-            pillsDiv.innerHTML = '';
-
-            if (progress.current_domain) {
-                pillsDiv.innerHTML += `<span class="domain-pill active">${progress.current_domain}</span>`;
-            }
-            (progress.domains_completed || []).forEach(d => {
-                if (d !== progress.current_domain)
-                    pillsDiv.innerHTML += `<span class="domain-pill completed">✓ ${d}</span>`;
-            });
-            (progress.domains_pending || []).forEach(d => {
-                pillsDiv.innerHTML += `<span class="domain-pill pending">${d}</span>`;
-            });
-        }
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
 
-        // ==================== BUILD ====================
-        let buildType = 'docker';  // 'docker' or 'cloud'
-        let selectedProvider = 'skysize';
-
-        async function startBuild(type) {
-            buildType = type;
-            switchTab('build');
-
-            if (type === 'cloud') {
-                // Update header for cloud
-                document.getElementById('build-header-title').textContent = '☁️ Cloud Deployment';
-                document.getElementById('build-header-desc').textContent = 'Deploying to free cloud hosting with guided setup';
-
-                // Show provider selection
-                await loadProviders();
-                document.getElementById('cloud-provider-select').classList.remove('hidden');
-            } else {
-                // Docker build
-                document.getElementById('build-header-title').textContent = '🐳 Local Docker Build';
-                document.getElementById('build-header-desc').textContent = 'Setting up Docker, installing modules, and configuring your system';
-                document.getElementById('cloud-provider-select').classList.add('hidden');
-                await startDockerBuild();
-            }
-        }
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-        async function loadProviders() {
-            const response = await fetch('/api/cloud/providers');
-            const providers = await response.json();
-
-            const container = document.getElementById('provider-cards');
-            container.innerHTML = providers.map(p => `
-                <div class="provider-card" style="flex: 1; min-width: 180px; padding: 16px; background: ${p.recommended ? '#e8f5e9' : '#f8f9fa'}; border-radius: 8px; border: 2px solid ${p.recommended ? '#4CAF50' : '#e0e0e0'}; cursor: pointer;" onclick="selectProvider('${p.id}', '${p.signup_url}')">
-                    <h5>${p.name} ${p.recommended ? '<span style="background:#4CAF50;color:white;font-size:10px;padding:2px 6px;border-radius:8px;">Recommended</span>' : ''}</h5>
-                    <ul style="font-size: 12px; color: #666; margin: 8px 0 0 16px;">
-                        ${p.features.map(f => `<li>${f}</li>`).join('')}
-                    </ul>
-                </div>
-            `).join('');
-        }
 
-        async function selectProvider(providerId, signupUrl) {
-            selectedProvider = providerId;
-            document.getElementById('cloud-provider-select').classList.add('hidden');
-
-            const response = await fetch('/api/build/start', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    spec: implementationSpec,
-                    build_type: 'cloud',
-                    provider: providerId
-                })
-            });
-
-            const data = await response.json();
-            buildId = data.build_id;
-
-            // Start polling for updates
-            buildPollInterval = setInterval(pollBuildStatus, 1000);
-        }
+app = Flask(__name__)
+if orjson is not None:
+    # jsonify, request.json and the build snapshots all go through app.json
+    app.json = OrjsonProvider(app)
+app.secret_key = secrets.token_hex(16)
+# Static assets are fingerprinted via asset_url(), so browsers may cache them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 3600
+
+GZIP_MIN_BYTES = 500
+GZIP_MIMETYPES = ('text/html', 'text/css', 'text/javascript', 'application/javascript', 'application/json')
+
+# Global state. sessions and builds are kept least recently used first and are
+# written from both request threads and the build loop, so access goes through state_lock.
+sessions = OrderedDict()  # Interview sessions (live agent objects, always in-process)
+builds = OrderedDict()    # Build snapshots (used when Redis is not configured)
+builders = {}  # Active builders (live objects, only while the build runs)
+build_futures = {}  # build_id -> Future of queued or running builds, for cancellation
+state_lock = threading.Lock()
+
+SESSION_TTL_SECONDS = 24 * 3600  # Drop interview sessions idle for a day
+BUILD_TTL_SECONDS = 24 * 3600    # Keep build snapshots for a day
+FINISHED_BUILD_TTL_SECONDS = 600  # ...but finished ones only 10 minutes after last being read
+MAX_SESSIONS = 256               # Least recently used sessions are dropped beyond this
+MAX_BUILDS = 256                 # Least recently used finished builds are dropped beyond this
+BUILD_STREAM_KEEPALIVE_SECONDS = 15
+BUILD_LONG_POLL_SECONDS = 25     # Longest /api/build/status holds a conditional request
+BUILD_SNAPSHOT_INTERVAL_SECONDS = 0.1  # Progress reports within this window share one snapshot
+BUILD_DELTA_HISTORY = 8          # Earlier snapshots kept per build to diff ?since= against
+SPEC_CACHE_SIZE = 128            # Specs kept in-process, keyed by interview summary
+SPEC_CACHE_TTL_SECONDS = 3600    # Redis copies expire so spec logic changes roll out
+MAX_CONCURRENT_BUILDS = int(os.environ.get("MAX_CONCURRENT_BUILDS", "2"))
+APP_SERVER_THREADS = int(os.environ.get("APP_SERVER_THREADS", "16"))
+
+# Caps how many builds drive Docker/cloud APIs at once; extra builds wait as 'pending'
+build_slots = asyncio.Semaphore(MAX_CONCURRENT_BUILDS)
+
+# All builds run as coroutines on one event loop thread, started on first build
+build_loop = None
+build_loop_lock = threading.Lock()
+
+# Signalled whenever a build snapshot is saved, so /api/build/stream can push it
+build_changed = threading.Condition()
+build_version = 0  # Bumped on every save, under build_changed
+
+# Optional Redis backing for build snapshots, so any worker can answer
+# /api/build/status. Set REDIS_URL to enable; otherwise state stays in `builds`.
+redis_client = None
+if os.environ.get("REDIS_URL"):
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(os.environ["REDIS_URL"])
+    except ImportError:
+        print("Warning: REDIS_URL is set but the redis package is not installed; using in-process state")
+
+
+def _get_session(session_id: str):
+    """Return the interview session and refresh its idle timer, or None."""
+    with state_lock:
+        session = sessions.get(session_id)
+        if session is not None:
+            session['last_access'] = time.monotonic()
+            sessions.move_to_end(session_id)
+    return session
+
+
+def _prune_sessions():
+    """Remove sessions idle for longer than SESSION_TTL_SECONDS, and make room for a new one."""
+    cutoff = time.monotonic() - SESSION_TTL_SECONDS
+    with state_lock:
+        for sid in [sid for sid, s in sessions.items() if s['last_access'] < cutoff]:
+            del sessions[sid]
+        while len(sessions) >= MAX_SESSIONS:
+            sessions.popitem(last=False)
+
+
+def _save_build(build_id: str, state: dict):
+    """
+    Store a build snapshot in Redis (with TTL) or in-process, and wake stream listeners.
+
+    The snapshot is serialized once here; readers serve the stored bytes as-is.
+    """
+    global build_version
+    payload = app.json.dumps(state).encode()
+    if redis_client is not None:
+        redis_client.set(f"build:{build_id}", payload, ex=_build_ttl(state))
+    else:
+        entry = {
+            'state': state,
+            'payload': payload,
+            'etag': _build_etag(payload),
+            'touched': time.monotonic(),
+        }
+        with state_lock:
+            previous = builds.get(build_id)
+            # Recent snapshots by ETag, so /api/build/status can answer with a delta
+            entry['history'] = previous['history'] if previous else OrderedDict()
+            if previous:
+                entry['history'][previous['etag']] = previous['state']
+                while len(entry['history']) > BUILD_DELTA_HISTORY:
+                    entry['history'].popitem(last=False)
+            builds[build_id] = entry
+            builds.move_to_end(build_id)
+    with build_changed:
+        build_version += 1
+        build_changed.notify_all()
+
+
+def _wait_for_build_save(seen_version: int, timeout: float) -> int:
+    """Block until a snapshot newer than seen_version is saved or timeout passes; return the latest version."""
+    with build_changed:
+        build_changed.wait_for(lambda: build_version != seen_version, timeout=timeout)
+        return build_version
+
+
+def _build_ttl(state: dict) -> int:
+    """How long an unread build snapshot is kept; finished builds go sooner."""
+    if state.get('status') in ('completed', 'failed'):
+        return FINISHED_BUILD_TTL_SECONDS
+    return BUILD_TTL_SECONDS
+
+
+def _build_etag(payload: bytes) -> str:
+    """Fingerprint of a serialized build snapshot, used to answer long-polls."""
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _build_delta(old: dict, new: dict) -> dict:
+    """
+    Fields of `new` that differ from `old`.
+
+    Keys dropped from `new` are sent as None. Tasks are matched by task_id and only
+    changed ones are sent, under 'changed_tasks'; if the task list itself changed,
+    the full list is sent under 'tasks'.
+    """
+    delta = {k: v for k, v in new.items() if k != 'tasks' and old.get(k) != v}
+    delta.update({k: None for k in old.keys() - new.keys() if k != 'tasks'})
+    old_tasks = old.get('tasks', [])
+    new_tasks = new.get('tasks', [])
+    if [t['task_id'] for t in old_tasks] != [t['task_id'] for t in new_tasks]:
+        delta['tasks'] = new_tasks
+    else:
+        changed = [t for t, prev in zip(new_tasks, old_tasks) if t != prev]
+        if changed:
+            delta['changed_tasks'] = changed
+    return delta
+
+
+def _load_build_snapshot(build_id: str):
+    """
+    Fetch a build snapshot as (state, payload bytes, etag), refreshing its TTL on access.
+
+    Returns None if unknown.
+    """
+    if not build_id:
+        return None
+    if redis_client is not None:
+        raw = redis_client.get(f"build:{build_id}")
+        if raw is None:
+            return None
+        state = app.json.loads(raw)
+        redis_client.expire(f"build:{build_id}", _build_ttl(state))
+        return state, raw, _build_etag(raw)
+    with state_lock:
+        entry = builds.get(build_id)
+        if entry is None:
+            return None
+        entry['touched'] = time.monotonic()
+        builds.move_to_end(build_id)
+    return entry['state'], entry['payload'], entry['etag']
+
+
+def _load_build_base(build_id: str, etag: str):
+    """An earlier in-process snapshot of the build by its ETag, or None if no longer kept."""
+    with state_lock:
+        entry = builds.get(build_id)
+        return entry['history'].get(etag) if entry else None
+
+
+def _load_build(build_id: str):
+    """Fetch a build snapshot, refreshing its TTL on access. Returns None if unknown."""
+    snapshot = _load_build_snapshot(build_id)
+    return snapshot[0] if snapshot else None
+
+
+def _prune_builds():
+    """
+    Remove in-process build snapshots past their TTL (see _build_ttl), and make room
+    for a new build by dropping the least recently used ones. Queued and running builds are kept.
+    """
+    now = time.monotonic()
+    with state_lock:
+        expired = [
+            bid for bid, b in builds.items()
+            if b['touched'] < now - _build_ttl(b['state']) and bid not in build_futures
+        ]
+        for bid in expired:
+            del builds[bid]
+        idle = (bid for bid in list(builds) if bid not in build_futures)
+        while len(builds) >= MAX_BUILDS:
+            bid = next(idle, None)
+            if bid is None:
+                break
+            del builds[bid]
+
+
+# ==================== PAGE & ASSETS ====================
+
+@lru_cache(maxsize=None)
+def _asset_version(filename: str) -> str:
+    """Short content hash of a static file, used to bust browser caches on change."""
+    data = (Path(app.static_folder) / filename).read_bytes()
+    return hashlib.blake2b(data, digest_size=6).hexdigest()
+
+
+@app.template_global()
+def asset_url(filename: str) -> str:
+    """URL for a static asset with its content hash appended."""
+    return url_for('static', filename=filename, v=_asset_version(filename))
+
+
+@app.after_request
+def gzip_response(response):
+    """Gzip text responses for clients that accept it."""
+    if (response.status_code != 200
+            or response.mimetype not in GZIP_MIMETYPES
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+
+    response.direct_passthrough = False  # Static files arrive as a file wrapper
+    data = response.get_data()
+    if len(data) < GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The gzipped bytes are not the ones the strong ETag was computed over
+        response.set_etag(etag, weak=True)
+    return response
+
+
+INDEX_MAX_AGE_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _index_page() -> dict:
+    """
+    The rendered page as {content-encoding: (bytes, etag)}, '' being uncompressed.
+
+    The page has no per-request content, so it is rendered once (on the first
+    request, which asset_url's url_for needs) and compressed once, at the highest
+    levels, and served as bytes from then on.
+    """
+    page = app.jinja_env.get_template('app.html').render().encode()
+    etag = hashlib.blake2b(page, digest_size=8).hexdigest()
+    variants = {'': (page, etag), 'gzip': (gzip.compress(page, compresslevel=9), f"{etag}-gz")}
+    if brotli is not None:
+        variants['br'] = (brotli.compress(page, quality=11), f"{etag}-br")
+    return variants
 
-        async function startDockerBuild() {
-            const response = await fetch('/api/build/start', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    spec: implementationSpec,
-                    build_type: 'docker'
-                })
-            });
-
-            const data = await response.json();
-            buildId = data.build_id;
-
-            // Start polling for updates
-            buildPollInterval = setInterval(pollBuildStatus, 1000);
-        }
 
-        function confirmCloudStep() {
-            // User confirmed they completed a step - continue polling
-            document.getElementById('cloud-instructions').classList.add('hidden');
-        }
+@app.route('/')
+def index():
+    variants = _index_page()
+    accepted = request.headers.get('Accept-Encoding', '')
+    encoding = next((e for e in ('br', 'gzip') if e in variants and e in accepted), '')
+    page, etag = variants[encoding]
+    response = Response(page, mimetype='text/html')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = INDEX_MAX_AGE_SECONDS
+    return response.make_conditional(request)
 
-        async function pollBuildStatus() {
-            try {
-                const response = await fetch(`/api/build/status?build_id=${buildId}`);
-                const state = await response.json();
-
-                updateBuildUI(state);
-
-                // Handle cloud waiting_user status
-                if (state.current_task && state.current_task.status === 'waiting_user') {
-                    const instrPanel = document.getElementById('cloud-instructions');
-                    instrPanel.classList.remove('hidden');
-                    document.getElementById('cloud-action-text').textContent = state.current_task.user_action_required || 'Please complete the required action';
-                    if (state.current_task.user_action_url) {
-                        document.getElementById('cloud-action-url').href = state.current_task.user_action_url;
-                        document.getElementById('cloud-action-url').classList.remove('hidden');
-                    } else {
-                        document.getElementById('cloud-action-url').classList.add('hidden');
-                    }
-                } else {
-                    document.getElementById('cloud-instructions').classList.add('hidden');
-                }
-
-                if (state.status === 'completed' || state.status === 'failed') {
-                    clearInterval(buildPollInterval);
-
-                    if (state.status === 'completed') {
-                        document.getElementById('build-complete').classList.remove('hidden');
-                        document.getElementById('odoo-url').href = state.odoo_url || '#';
-                        document.getElementById('odoo-url').textContent = state.odoo_url || 'Your Odoo Instance';
-                        document.getElementById('final-odoo-url').href = state.odoo_url || '#';
-
-                        document.getElementById('tab-test').disabled = false;
-                        document.getElementById('tab-build').classList.add('completed');
-                    }
-                }
-            } catch (e) {
-                console.error('Poll error:', e);
-            }
-        }
 
-        function updateBuildUI(state) {
-            document.getElementById('build-percent').textContent = state.overall_progress + '%';
-            document.getElementById('build-progress-bar').style.width = state.overall_progress + '%';
-
-            const currentTask = state.current_task;
-            let statusText = 'Processing...';
-            if (currentTask) {
-                if (currentTask.status === 'waiting_user') {
-                    statusText = `⏳ Waiting: ${currentTask.name}`;
-                } else {
-                    statusText = `${currentTask.name}...`;
-                }
-            } else if (state.status === 'completed') {
-                statusText = 'Complete!';
-            }
-            document.getElementById('build-status').textContent = statusText;
-
-            // Update tasks list
-            const tasksDiv = document.getElementById('build-tasks');
-            tasksDiv.innerHTML = state.tasks.map(task => {
-                let icon = '⏸️';
-                let statusClass = task.status;
-
-                if (task.status === 'completed') icon = '✅';
-                else if (task.status === 'in_progress') icon = '⏳';
-                else if (task.status === 'waiting_user') { icon = '👆'; statusClass = 'in_progress'; }
-                else if (task.status === 'failed') icon = '❌';
-
-                return `
-                    <div class="build-task ${statusClass}">
-                        <div class="task-icon">${icon}</div>
-                        <div class="task-info">
-                            <div class="task-name">${task.name}</div>
-                            <div class="task-description">${task.description}</div>
-                            ${task.user_action_required ? `<div style="font-size:12px;color:#ff9800;margin-top:4px;">👆 ${task.user_action_required}</div>` : ''}
-                        </div>
-                        <div class="task-status ${statusClass}">${task.status.replace('_', ' ')}</div>
-                    </div>
-                `;
-            }).join('');
-
-            // Update logs
-            if (currentTask && currentTask.logs && currentTask.logs.length > 0) {
-                const logsDiv = document.getElementById('build-logs');
-                logsDiv.innerHTML = currentTask.logs.map(log =>
-                    `<div class="log-entry">${log}</div>`
-                ).join('');
-                logsDiv.scrollTop = logsDiv.scrollHeight;
-            }
-        }
+# ==================== INTERVIEW API ====================
 
-        // ==================== TEST ====================
-        async function runTest(testType) {
-            const resultDiv = document.getElementById(`test-${testType}-result`);
-            resultDiv.innerHTML = '<div class="spinner" style="width:24px;height:24px;border-width:3px;"></div>';
-
-            try {
-                const response = await fetch(`/api/test/${testType}?build_id=${buildId}`);
-                const data = await response.json();
-
-                if (data.success) {
-                    resultDiv.innerHTML = `<span style="color: #4CAF50;">✅ ${data.message}</span>`;
-                } else {
-                    resultDiv.innerHTML = `<span style="color: #f44336;">❌ ${data.message}</span>`;
-                }
-            } catch (e) {
-                resultDiv.innerHTML = `<span style="color: #f44336;">❌ Error: ${e.message}</span>`;
-            }
-        }
-    </script>
-</body>
-</html>
-"""
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def _spec_json(summary_json: str) -> str:
+    """Spec JSON for a canonical summary: in-process LRU, then Redis, then build it."""
+    key = f"spec:{hashlib.blake2b(summary_json.encode(), digest_size=16).hexdigest()}"
+    if redis_client is not None:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return cached.decode()
 
+    spec = create_spec_from_interview(json.loads(summary_json))
+    spec_json = app.json.dumps(spec.to_dict())
+    if redis_client is not None:
+        redis_client.set(key, spec_json, ex=SPEC_CACHE_TTL_SECONDS)
+    return spec_json
 
-# ==================== INTERVIEW API ====================
 
-@app.route('/')
-def index():
-    return render_template_string(HTML_TEMPLATE)
+def _spec_dict(summary: dict) -> dict:
+    """Implementation spec for an interview summary, with a fresh id and timestamp."""
+    spec = app.json.loads(_spec_json(json.dumps(summary, sort_keys=True, default=str)))
+    spec['spec_id'] = f"spec-{uuid.uuid4().hex[:8]}"
+    spec['created_at'] = datetime.now().isoformat()
+    return spec
 
 
 @app.route('/api/interview/start', methods=['POST'])
 def interview_start():
     data = request.json
-    session_id = secrets.token_hex(8)
+    session_id = secrets.token_urlsafe(12)  # 96 bits, URL-safe, no padding
+    _prune_sessions()
 
     agent = PhasedInterviewAgent(
         client_name=data.get('client_name', 'Unknown'),
@@ -1072,11 +383,13 @@ def interview_start():
         output_dir="./outputs"
     )
 
-    sessions[session_id] = {
-        'agent': agent,
-        'client_name': data.get('client_name'),
-        'industry': data.get('industry')
-    }
+    with state_lock:
+        sessions[session_id] = {
+            'agent': agent,
+            'client_name': data.get('client_name'),
+            'industry': data.get('industry'),
+            'last_access': time.monotonic(),
+        }
 
     return jsonify({
         'session_id': session_id,
@@ -1085,26 +398,27 @@ def interview_start():
     })
 
 
-@app.route('/api/interview/question', methods=['GET'])
-def interview_question():
-    session_id = request.args.get('session_id')
-    if session_id not in sessions:
-        return jsonify({'error': 'Invalid session'}), 400
+def _session_spec(session: dict, summary: dict) -> dict:
+    """Build the session's implementation spec and keep it for /api/build/start."""
+    session['spec'] = _spec_dict(summary)
+    return session['spec']
+
 
-    agent = sessions[session_id]['agent']
+def _next_question_payload(session: dict) -> dict:
+    """Next question for the client, or the summary and spec once the interview is done."""
+    agent = session['agent']
     question_data = agent.get_next_question()
 
     if question_data is None or agent.is_complete():
         summary = agent.get_summary()
-        spec = create_spec_from_interview(summary)
 
-        return jsonify({
+        return {
             'complete': True,
             'summary': summary,
-            'spec': spec.to_dict()
-        })
+            'spec': _session_spec(session, summary)
+        }
 
-    return jsonify({
+    return {
         'complete': False,
         'id': question_data['id'],
         'question': question_data['text'],
@@ -1113,184 +427,380 @@ def interview_question():
         'context': question_data.get('context'),
         'expert_intro': question_data.get('expert_intro'),
         'progress': question_data['progress']
-    })
+    }
+
+
+@app.route('/api/interview/question', methods=['GET'])
+def interview_question():
+    session = _get_session(request.args.get('session_id'))
+    if session is None:
+        return jsonify({'error': 'Invalid session'}), 400
+
+    return jsonify(_next_question_payload(session))
 
 
 @app.route('/api/interview/respond', methods=['POST'])
 def interview_respond():
     data = request.json
-    session_id = data.get('session_id')
-    if session_id not in sessions:
+    session = _get_session(data.get('session_id'))
+    if session is None:
         return jsonify({'error': 'Invalid session'}), 400
 
-    agent = sessions[session_id]['agent']
+    agent = session['agent']
     result = agent.process_response(data.get('response', ''), data.get('question', {}))
 
+    # The next question rides along, saving the client a second round-trip per turn
     return jsonify({
         'signals_detected': result.get('signals_detected', {}),
-        'progress': result.get('progress', {})
+        'progress': result.get('progress', {}),
+        'next': _next_question_payload(session)
     })
 
 
 @app.route('/api/interview/skip', methods=['POST'])
 def interview_skip():
     data = request.json
-    session_id = data.get('session_id')
-    if session_id not in sessions:
+    session = _get_session(data.get('session_id'))
+    if session is None:
         return jsonify({'error': 'Invalid session'}), 400
 
-    agent = sessions[session_id]['agent']
+    agent = session['agent']
     agent.skip_question(data.get('question', {}))
 
-    return jsonify({'skipped': True})
+    return jsonify({'skipped': True, 'next': _next_question_payload(session)})
 
 
 @app.route('/api/interview/end', methods=['POST'])
 def interview_end():
     data = request.json
-    session_id = data.get('session_id')
-    if session_id not in sessions:
+    session = _get_session(data.get('session_id'))
+    if session is None:
         return jsonify({'error': 'Invalid session'}), 400
 
-    agent = sessions[session_id]['agent']
+    agent = session['agent']
     summary = agent.get_summary()
-    spec = create_spec_from_interview(summary)
 
     return jsonify({
         'summary': summary,
-        'spec': spec.to_dict()
+        'spec': _session_spec(session, summary)
     })
 
 
 # ==================== BUILD API ====================
 
-def run_docker_build_async(build_id: str, spec_dict: dict):
-    """Run Docker build in background thread."""
-    async def _build():
-        spec = ImplementationSpec.from_dict(spec_dict)
-        builder = OdooBuilder(spec, work_dir=f"./odoo-instances/{build_id}")
+def _get_build_loop() -> asyncio.AbstractEventLoop:
+    """The shared build event loop (uvloop when installed), started on first use."""
+    global build_loop
+    with build_loop_lock:
+        if build_loop is None:
+            build_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=build_loop.run_forever, name='build-loop', daemon=True).start()
+    return build_loop
+
 
-        def on_progress(state: BuildState):
-            builds[build_id] = state.to_dict()
+def _submit_build(build_id: str, make_builder):
+    """Queue a build on the build loop; make_builder is called once a slot is free."""
+    build_futures[build_id] = asyncio.run_coroutine_threadsafe(
+        _run_build(build_id, make_builder), _get_build_loop()
+    )
 
-        builder.on_progress = on_progress
-        builders[build_id] = builder
 
+async def _run_build(build_id: str, make_builder):
+    """Wait for a build slot, then run the build; records a cancel that lands while queued."""
+    try:
+        async with build_slots:
+            await _drive_build(build_id, make_builder())
+    except asyncio.CancelledError:
+        _save_build(build_id, {**(_load_build(build_id) or {}), 'status': 'failed'})
+    finally:
+        build_futures.pop(build_id, None)
+
+
+async def _drive_build(build_id: str, builder):
+    """
+    Run a builder to completion, publishing snapshots; stops it if the task is cancelled.
+
+    Builders report progress on every log line. Those reports are coalesced into at
+    most one snapshot per BUILD_SNAPSHOT_INTERVAL_SECONDS, and the final state is
+    always saved.
+    """
+    loop = asyncio.get_running_loop()
+    flush_pending = False
+
+    def flush():
+        nonlocal flush_pending
+        flush_pending = False
+        _save_build(build_id, builder.state.to_dict())
+
+    def on_progress(state):
+        nonlocal flush_pending
+        if not flush_pending:
+            flush_pending = True
+            # stop() reports from a worker thread, so schedule via the thread-safe call
+            loop.call_soon_threadsafe(loop.call_later, BUILD_SNAPSHOT_INTERVAL_SECONDS, flush)
+
+    builder.on_progress = on_progress
+    builders[build_id] = builder
+
+    try:
         await builder.build()
+    except asyncio.CancelledError:
+        # stop() may shell out (docker compose down), so keep it off the loop
+        await asyncio.to_thread(builder.stop)
+    finally:
+        builders.pop(build_id, None)
+        flush()
+
+
+def start_docker_build(build_id: str, spec_dict: dict):
+    """Queue a local Docker build."""
+    from src.builders.odoo_builder import OdooBuilder
+
+    def make_builder():
+        spec = ImplementationSpec.from_dict(spec_dict)
+        return OdooBuilder(spec, work_dir=f"./odoo-instances/{build_id}")
+
+    _submit_build(build_id, make_builder)
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(_build())
-    loop.close()
 
+def start_cloud_build(build_id: str, spec_dict: dict, provider: str):
+    """Queue a cloud deployment."""
+    from src.builders.cloud_builder import CloudOdooBuilder, CloudProvider
 
-def run_cloud_build_async(build_id: str, spec_dict: dict, provider: str):
-    """Run cloud deployment in background thread."""
-    async def _build():
+    def make_builder():
         spec = ImplementationSpec.from_dict(spec_dict)
 
         # Map provider string to enum
         provider_enum = CloudProvider(provider)
-        builder = CloudOdooBuilder(spec, provider=provider_enum)
+        return CloudOdooBuilder(spec, provider=provider_enum)
 
-        def on_progress(state: CloudBuildState):
-            builds[build_id] = state.to_dict()
+    _submit_build(build_id, make_builder)
 
-        builder.on_progress = on_progress
-        builders[build_id] = builder
 
-        await builder.build()
+PROVIDERS_MAX_AGE_SECONDS = 300
+
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(_build())
-    loop.close()
+@lru_cache(maxsize=1)
+def _providers_payload() -> bytes:
+    """Serialized provider list; it only changes with the code, so build it once."""
+    from src.builders.cloud_builder import get_available_providers
+    return app.json.dumps(get_available_providers()).encode()
 
 
 @app.route('/api/cloud/providers', methods=['GET'])
 def cloud_providers():
     """Get list of available cloud providers."""
-    return jsonify(get_available_providers())
+    response = Response(_providers_payload(), mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = PROVIDERS_MAX_AGE_SECONDS
+    return response
 
 
 @app.route('/api/build/start', methods=['POST'])
 def build_start():
     data = request.json
-    spec_dict = data.get('spec')
+    # The spec built at the end of the interview stays server-side; clients only send
+    # session_id. A full 'spec' in the body is still accepted.
+    session = _get_session(data.get('session_id'))
+    spec_dict = (session or {}).get('spec') or data.get('spec')
+    if spec_dict is None:
+        return jsonify({'error': 'No implementation spec for this session'}), 400
     build_type = data.get('build_type', 'docker')
     provider = data.get('provider', 'skysize')
 
-    build_id = f"build-{secrets.token_hex(4)}"
-    builds[build_id] = {
+    # Time prefix makes build ids (and their Redis keys) sort by creation
+    build_id = f"build-{int(time.time())}-{secrets.token_urlsafe(6)}"
+    _prune_builds()
+    _save_build(build_id, {
         'build_id': build_id,
         'status': 'pending',
         'overall_progress': 0,
         'tasks': [],
         'odoo_url': None,
         'build_type': build_type
-    }
+    })
 
     # Start build in background
     if build_type == 'cloud':
-        thread = threading.Thread(target=run_cloud_build_async, args=(build_id, spec_dict, provider))
+        start_cloud_build(build_id, spec_dict, provider)
     else:
-        thread = threading.Thread(target=run_docker_build_async, args=(build_id, spec_dict))
-
-    thread.daemon = True
-    thread.start()
+        start_docker_build(build_id, spec_dict)
 
     return jsonify({'build_id': build_id, 'build_type': build_type})
 
 
+@app.route('/api/build/cancel', methods=['POST'])
+def build_cancel():
+    """Cancel a queued or running build; its current command is killed and the build marked failed."""
+    future = build_futures.get(request.json.get('build_id'))
+    if future is None:
+        return jsonify({'error': 'Build not running'}), 400
+
+    future.cancel()  # Cancels the build's task on the build loop
+    return jsonify({'cancelled': True})
+
+
 @app.route('/api/build/status', methods=['GET'])
 def build_status():
+    """
+    Current build snapshot, with an ETag.
+
+    With If-None-Match, this is a long-poll: the request is held until the snapshot
+    changes and answered 304 if nothing changed within BUILD_LONG_POLL_SECONDS
+    (or at once if the build has already finished).
+
+    With ?since=<etag of the client's copy>, a changed snapshot is sent as
+    {'since': ..., 'delta': ...} (see _build_delta) when that copy is still in the
+    build's recent history, and in full otherwise.
+    """
+    build_id = request.args.get('build_id')
+    seen_version = build_version
+    snapshot = _load_build_snapshot(build_id)
+    if snapshot is None:
+        return jsonify({'error': 'Invalid build'}), 400
+    build, payload, etag = snapshot
+
+    # Snapshots written by another worker never notify this process, so poll Redis briefly
+    wait_seconds = 1 if redis_client is not None else BUILD_LONG_POLL_SECONDS
+    deadline = time.monotonic() + BUILD_LONG_POLL_SECONDS
+    # Weak match: gzip_response weakens the ETags it sends
+    while request.if_none_match.contains_weak(etag):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or build.get('status') in ('completed', 'failed'):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        seen_version = _wait_for_build_save(seen_version, min(wait_seconds, remaining))
+        snapshot = _load_build_snapshot(build_id)
+        if snapshot is None:
+            return jsonify({'error': 'Invalid build'}), 400
+        build, payload, etag = snapshot
+
+    since = request.args.get('since')
+    if since and since != etag:
+        base = _load_build_base(build_id, since)
+        if base is not None:
+            payload = app.json.dumps({'since': since, 'delta': _build_delta(base, build)}).encode()
+
+    response = Response(payload, mimetype='application/json')
+    response.set_etag(etag)
+    # Let the browser keep the snapshot but always revalidate it against the ETag
+    response.cache_control.no_cache = True
+    return response
+
+
+@app.route('/api/build/stream', methods=['GET'])
+def build_stream():
+    """
+    Push build progress as Server-Sent Events whenever it changes.
+
+    The first event is the full snapshot; later ones are 'delta' events holding only
+    what changed (see _build_delta).
+    """
     build_id = request.args.get('build_id')
-    if build_id not in builds:
+    if _load_build(build_id) is None:
         return jsonify({'error': 'Invalid build'}), 400
 
-    return jsonify(builds[build_id])
+    # Snapshots written by another worker never notify this process, so poll Redis briefly
+    wait_seconds = 1 if redis_client is not None else BUILD_STREAM_KEEPALIVE_SECONDS
+
+    def generate():
+        seen_version = -1
+        last_sent = None
+        last_etag = None
+        while True:
+            seen_version = _wait_for_build_save(seen_version, wait_seconds)
+            snapshot = _load_build_snapshot(build_id)
+            if snapshot is None:
+                return
+            state, payload, etag = snapshot
+            if etag == last_etag:
+                yield b": keep-alive\n\n"
+                continue
+            if last_sent is None:
+                yield b"data: " + payload + b"\n\n"
+            else:
+                yield f"event: delta\ndata: {app.json.dumps(_build_delta(last_sent, state))}\n\n".encode()
+            last_sent, last_etag = state, etag
+            if state.get('status') in ('completed', 'failed'):
+                return
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
 
 
 # ==================== TEST API ====================
 
-@app.route('/api/test/<test_type>', methods=['GET'])
-def run_test(test_type):
-    build_id = request.args.get('build_id')
-
-    if build_id not in builds:
-        return jsonify({'success': False, 'message': 'Invalid build'})
-
-    build = builds[build_id]
-    odoo_url = build.get('odoo_url')
+TEST_PROBE_TIMEOUT_SECONDS = 5
+
+# HTTP checks against the built instance: test type -> (path, method, success message)
+TEST_PROBES = {
+    'connection': ('/web/login', 'HEAD', 'Odoo is responding!'),
+    'modules': ('/web', 'GET', 'Modules endpoint accessible'),
+}
+TEST_STATIC_RESULTS = {
+    'company': 'Company configuration ready',
+    'users': 'Default admin user available',
+}
+
+# Runs the probes for /api/test/all side by side
+probe_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='probe')
+
+
+def _run_probe(odoo_url: str, test_type: str) -> dict:
+    """Run one HTTP probe against the instance and return a test result."""
+    import urllib.request
+
+    path, method, message = TEST_PROBES[test_type]
+    try:
+        req = urllib.request.Request(f"{odoo_url}{path}", method=method)
+        with urllib.request.urlopen(req, timeout=TEST_PROBE_TIMEOUT_SECONDS) as response:
+            if response.status == 200:
+                return {'success': True, 'message': message}
+            return {'success': False, 'message': f'Unexpected HTTP {response.status}'}
+    except Exception as e:
+        if test_type == 'connection':
+            return {'success': False, 'message': f'Connection failed: {str(e)}'}
+        return {'success': False, 'message': str(e)}
+
+
+def _build_odoo_url(build_id: str):
+    """Odoo URL of a build, or an error result if it has none."""
+    build = _load_build(build_id)
+    if build is None:
+        return None, {'success': False, 'message': 'Invalid build'}
+    if not build.get('odoo_url'):
+        return None, {'success': False, 'message': 'Odoo URL not available'}
+    return build['odoo_url'], None
+
+
+@app.route('/api/test/all', methods=['GET'])
+def run_all_tests():
+    """Run every test at once; the HTTP probes run concurrently."""
+    odoo_url, error = _build_odoo_url(request.args.get('build_id'))
+    if error:
+        return jsonify({test_type: error for test_type in [*TEST_PROBES, *TEST_STATIC_RESULTS]})
+
+    futures = {t: probe_executor.submit(_run_probe, odoo_url, t) for t in TEST_PROBES}
+    results = {t: future.result() for t, future in futures.items()}
+    results.update({t: {'success': True, 'message': m} for t, m in TEST_STATIC_RESULTS.items()})
+    return jsonify(results)
 
-    if not odoo_url:
-        return jsonify({'success': False, 'message': 'Odoo URL not available'})
 
-    if test_type == 'connection':
-        try:
-            import urllib.request
-            req = urllib.request.Request(f"{odoo_url}/web/login", method='HEAD')
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    return jsonify({'success': True, 'message': 'Odoo is responding!'})
-        except Exception as e:
-            return jsonify({'success': False, 'message': f'Connection failed: {str(e)}'})
-
-    elif test_type == 'modules':
-        # For MVP, just check if we can reach the backend
-        try:
-            import urllib.request
-            req = urllib.request.Request(f"{odoo_url}/web")
-            with urllib.request.urlopen(req, timeout=5):
-                return jsonify({'success': True, 'message': 'Modules endpoint accessible'})
-        except Exception as e:
-            return jsonify({'success': False, 'message': str(e)})
+@app.route('/api/test/<test_type>', methods=['GET'])
+def run_test(test_type):
+    odoo_url, error = _build_odoo_url(request.args.get('build_id'))
+    if error:
+        return jsonify(error)
 
-    elif test_type == 'company':
-        return jsonify({'success': True, 'message': 'Company configuration ready'})
+    if test_type in TEST_PROBES:
+        return jsonify(_run_probe(odoo_url, test_type))
 
-    elif test_type == 'users':
-        return jsonify({'success': True, 'message': 'Default admin user available'})
+    if test_type in TEST_STATIC_RESULTS:
+        return jsonify({'success': True, 'message': TEST_STATIC_RESULTS[test_type]})
 
     return jsonify({'success': False, 'message': 'Unknown test type'})
 
@@ -1314,4 +824,15 @@ Press Ctrl+C to stop.
     Path("./outputs").mkdir(exist_ok=True)
     Path("./odoo-instances").mkdir(exist_ok=True)
 
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    if os.environ.get('FLASK_DEBUG'):
+        # Reloader and debugger: local development only
+        app.run(debug=True, host='0.0.0.0', port=5001)
+    else:
+        # Sessions and builds live in this process, so serve it from one process with
+        # threads; open build streams and long-polls each hold a thread
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host='0.0.0.0', port=5001, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5001, threads=APP_SERVER_THREADS)
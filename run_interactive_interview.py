@@ -10,6 +10,8 @@ This is an INTERACTIVE interview - you type your answers!
 """
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 warnings.filterwarnings('ignore')
 
 import sys
@@ -59,6 +61,8 @@ def main():
     print("\nLet's begin!\n")
 
     question_count = 0
+    # Generates upcoming questions with the LLM while the user is typing
+    prefetch = ThreadPoolExecutor(max_workers=1)
 
     while True:
         # Get next question
@@ -75,6 +79,7 @@ def main():
         print(f"[{question.module_source}] Question {question_count}")
         print(f"{'─'*60}")
         print(f"\n{question.text}\n")
+        agent.prefetch_questions(prefetch)
 
         # Get user input
         try:
@@ -125,6 +130,8 @@ def main():
         if remaining > 0:
             print(f"  📋 {remaining} questions remaining")
 
+    prefetch.shutdown(wait=False, cancel_futures=True)
+
     # Save results
     print(f"\n{'='*60}")
     print("SAVING RESULTS...")
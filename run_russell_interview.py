@@ -6,12 +6,55 @@ Run in VS Code terminal:
     python3 run_russell_interview.py
 """
 
+import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 warnings.filterwarnings('ignore')
 
-import time
 import sys
 
+WELCOME = "Welcome! I'll ask you questions about Russell's business for the Odoo setup. Speak clearly and pause when done."
+CLOSING = "Thank you! The interview is complete."
+
+# Spoken commands, found in one case-insensitive pass over the answer
+COMMANDS = re.compile(r"skip|pause|stop", re.IGNORECASE)
+
+
+def section_complete(domain_title: str) -> str:
+    """Announcement spoken when a domain's questions are done."""
+    return f"{domain_title} section complete. Moving on."
+
+
+def probe_ollama():
+    """Connect to a local Ollama. Returns the provider, or None if it isn't running."""
+    try:
+        from src.llm.ollama_provider import OllamaProvider
+        ollama = OllamaProvider(model="mistral:latest")
+        return ollama if ollama.is_available() else None
+    except Exception:
+        return None
+
+
+def listen(recorder, stt) -> str:
+    """Record one answer, transcribing while the user speaks. Returns "" if nothing was said."""
+    from src.voice.speech_to_text import StreamingTranscriber
+
+    transcriber = StreamingTranscriber(stt)
+    try:
+        audio = recorder.record_until_silence(
+            silence_threshold=0.01,
+            silence_duration=1.5,
+            max_duration=30.0,
+            on_chunk=transcriber.feed
+        )
+        if len(audio) == 0:
+            return ""
+        return transcriber.finish().text
+    finally:
+        transcriber.close()
+
+
 def main():
     print("""
 ╔═══════════════════════════════════════════════════════════════╗
@@ -22,18 +65,27 @@ def main():
     # Import components
     print("Loading components...")
 
+    # Probing Ollama can wait on a connection timeout; it runs while Whisper loads
+    startup = ThreadPoolExecutor(max_workers=1)
+    ollama_probe = startup.submit(probe_ollama)
+    startup.shutdown(wait=False)
+
     from src.voice.speech_to_text import SpeechToText, MicrophoneRecorder
     from src.voice.text_to_speech import TextToSpeech
     from src.agents.smart_interview_agent import SmartInterviewAgent
     from src.branching.engine import ActionType
+    from src.schemas.interview_domains import ALL_DOMAINS
 
     # Initialize TTS
     print("  ✓ Text-to-speech")
     tts = TextToSpeech(rate=160)
+    # Fixed prompts are synthesized while Whisper and the agent load
+    tts.prepare([WELCOME, CLOSING, *(section_complete(d.title) for d in ALL_DOMAINS)])
 
     # Initialize STT
     print("  ✓ Speech-to-text (Whisper)")
     stt = SpeechToText(model_size="base", language="en")
+    stt.warm_up()  # So the first answer isn't slowed by model loading
 
     # Initialize recorder
     print("  ✓ Microphone")
@@ -47,15 +99,13 @@ def main():
         use_llm=True
     )
 
-    # Try to set up Ollama
-    try:
-        from src.llm.ollama_provider import OllamaProvider
-        ollama = OllamaProvider(model="mistral:latest")
-        if ollama.is_available():
-            agent.llm_manager._providers["ollama"] = ollama
-            agent.llm_manager._current_provider = "ollama"
-            print("  ✓ Ollama LLM")
-    except:
+    # Use Ollama if the probe found it
+    ollama = ollama_probe.result()
+    if ollama is not None and agent.llm_manager is not None:
+        agent.llm_manager._providers["ollama"] = ollama
+        agent.llm_manager._current_provider = "ollama"
+        print("  ✓ Ollama LLM")
+    elif agent.llm_manager is None:
         print("  ○ No LLM (rule-based mode)")
 
     print("\n" + "="*60)
@@ -64,36 +114,44 @@ def main():
     print("\nCommands: say 'skip' to skip, 'pause' to stop")
     print("="*60 + "\n")
 
-    # Welcome
-    welcome = "Welcome! I'll ask you questions about Russell's business for the Odoo setup. Speak clearly and pause when done."
-    print(f"🔊 {welcome}")
-    tts.speak(welcome)
-
-    time.sleep(1)
-
     # Start interview
     agent.start_interview()
     agent.branching_engine.reset_state()
 
+    # The next question (often an LLM rephrasing) is prepared in the background
+    # while speech plays; the agent is only touched from here once it is done
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    next_question = prefetch.submit(agent.get_next_question_smart)
+
+    # Welcome
+    print(f"🔊 {WELCOME}")
+    # speak() returns once playback has finished, so there is nothing to wait for
+    tts.speak(WELCOME)
+
     questions_asked = 0
     max_questions = 15  # Limit for demo
 
     while agent.session.state.value == "in_progress" and questions_asked < max_questions:
         # Get question
-        question_text, question = agent.get_next_question_smart()
+        if next_question is not None:
+            question_text, question = next_question.result()
+            next_question = None
+        else:
+            question_text, question = agent.get_next_question_smart()
 
         if question_text is None:
             # Domain complete
             domain_name = agent.current_domain.title
             print(f"\n✅ {domain_name} complete!")
-            tts.speak(f"{domain_name} section complete. Moving on.")
             agent.complete_current_domain()
+            if agent.session.state.value != "completed":
+                next_question = prefetch.submit(agent.get_next_question_smart)
+            tts.speak(section_complete(domain_name))
 
             if agent.session.state.value == "completed":
                 break
 
             print(f"\n📋 Next: {agent.current_domain.title}")
-            time.sleep(0.5)
             continue
 
         questions_asked += 1
@@ -102,26 +160,19 @@ def main():
         print(f"\n{'─'*60}")
         print(f"Q{questions_asked}: {question_text}")
         print(f"{'─'*60}")
-        tts.speak(question_text)
+        tts.stream_speak(question_text)
+        stt.set_topic(f"{agent.current_domain.title}. {question_text}")
 
         # Listen for answer
         print("\n🎤 Listening... (speak now, pause when done)")
 
         try:
-            audio = recorder.record_until_silence(
-                silence_threshold=0.01,
-                silence_duration=1.5,
-                max_duration=30.0
-            )
+            response = listen(recorder, stt)
 
-            if len(audio) == 0:
+            if not response:
                 print("   No speech detected, skipping...")
                 response = "[skipped]"
             else:
-                # Transcribe
-                print("   Transcribing...")
-                result = stt.transcribe(audio)
-                response = result.text
                 print(f"   Heard: \"{response}\"")
 
         except KeyboardInterrupt:
@@ -129,7 +180,7 @@ def main():
             break
         except Exception as e:
             print(f"   Error: {e}")
-                response = "[error]"
+            response = "[error]"
 
         if response in ["[skipped]", "[error]"]:
             if question:
@@ -137,13 +188,14 @@ def main():
             continue
 
         # Check for commands
-        if "skip" in response.lower():
+        commands = {command.lower() for command in COMMANDS.findall(response)}
+        if "skip" in commands:
             print("   ⏭️ Skipping...")
             if question:
                 agent.current_domain_progress.current_question_index += 1
             continue
 
-        if "pause" in response.lower() or "stop" in response.lower():
+        if "pause" in commands or "stop" in commands:
             print("   ⏸️ Pausing...")
             break
 
@@ -154,32 +206,29 @@ def main():
             # Handle follow-ups
             if action.action_type in [ActionType.ASK_FOLLOW_UP, ActionType.PROBE_DEEPER]:
                 print(f"\n🔍 Follow-up: {action.question_text}")
-                tts.speak(action.question_text)
+                tts.stream_speak(action.question_text)
+                stt.set_topic(f"{agent.current_domain.title}. {action.question_text}")
 
                 print("\n🎤 Listening...")
                 try:
-                    audio = recorder.record_until_silence(
-                        silence_threshold=0.01,
-                        silence_duration=1.5,
-                        max_duration=30.0
-                    )
-                    if len(audio) > 0:
-                        result = stt.transcribe(audio)
-                        print(f"   Heard: \"{result.text}\"")
-                        agent.record_follow_up_response(action.question_text, result.text)
+                    follow_up_response = listen(recorder, stt)
+                    if follow_up_response:
+                        print(f"   Heard: \"{follow_up_response}\"")
+                        agent.record_follow_up_response(action.question_text, follow_up_response)
                     else:
                         agent.record_follow_up_response(action.question_text, "[SKIPPED]")
                 except:
                     agent.record_follow_up_response(action.question_text, "[SKIPPED]")
 
-        time.sleep(0.3)
+    # A running preparation cannot be cancelled; let it finish before the agent is saved
+    prefetch.shutdown(wait=True, cancel_futures=True)
 
     # Complete
     print("\n" + "="*60)
     print("INTERVIEW COMPLETE!")
     print("="*60)
 
-    tts.speak("Thank you! The interview is complete.")
+    tts.speak(CLOSING)
 
     # Save results
     filepath = agent.generate_requirements_json()
@@ -14,11 +14,27 @@ Then open http://localhost:5001 — the PRD will already be generated.
 
 import requests
 import json
-import time
 import sys
 
+try:
+    import orjson  # Faster encode/decode for the answer and PRD bodies
+except ImportError:
+    orjson = None
+
 BASE = "http://localhost:5001"
 
+
+def post_json(http, url, payload, **kwargs):
+    """POST payload as a JSON body, encoded with orjson when available."""
+    if orjson is None:
+        return http.post(url, json=payload, **kwargs)
+    return http.post(url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"}, **kwargs)
+
+
+def read_json(r):
+    """Decode a JSON response body, with orjson when available."""
+    return orjson.loads(r.content) if orjson is not None else r.json()
+
 # ── Answers keyed by question ID prefix ──
 # Scoping answers
 SCOPING_ANSWERS = {
@@ -86,7 +102,7 @@ SCOPING_ANSWERS = {
 
 # Domain expert answers — generic responses that work for any domain question
 DOMAIN_ANSWERS = {
-    "sales": [
+    "sales": (
         (
             "Our sales process has two tracks. For D2C: customers visit our Shopify store, "
             "create a dog profile (breed, age, weight, allergies, activity level), we "
@@ -120,8 +136,8 @@ DOMAIN_ANSWERS = {
             "distinction between D2C subscription orders (from Shopify) and B2B wholesale "
             "orders (manual or email-based)."
         ),
-    ],
-    "inventory": [
+    ),
+    "inventory": (
         (
             "We have one warehouse with three zones: raw materials storage (temperature-controlled "
             "for proteins), production staging area, and finished goods ready for shipping. "
@@ -148,8 +164,8 @@ DOMAIN_ANSWERS = {
             "full inventory count quarterly. Accuracy is usually around 97% which we'd like to "
             "improve. Barcode scanning would help — we already have the hardware."
         ),
-    ],
-    "manufacturing": [
+    ),
+    "manufacturing": (
         (
             "We have about 15 standard recipes (BOMs) and the ability to create custom variations. "
             "A typical BOM has 6-12 ingredients plus packaging materials. We produce in batches — "
@@ -175,8 +191,8 @@ DOMAIN_ANSWERS = {
             "packaging, and overhead allocation. This feeds into our gross margin analysis per "
             "recipe and helps us price new recipes."
         ),
-    ],
-    "purchase": [
+    ),
+    "purchase": (
         (
             "We work with about 25 suppliers. Key categories: proteins (chicken, beef, fish — "
             "3 suppliers), grains and vegetables (5 suppliers), supplements and vitamins (4 "
@@ -198,8 +214,8 @@ DOMAIN_ANSWERS = {
             "paper delivery notes and manual invoice matching. Some suppliers send invoices "
             "that don't match the PO quantities because of partial deliveries."
         ),
-    ],
-    "finance": [
+    ),
+    "finance": (
         (
             "Belgian company (BV/SRL), standard Belgian chart of accounts following MAR plan. "
             "We file monthly VAT returns, prepare annual accounts for filing with the NBB. "
@@ -221,8 +237,8 @@ DOMAIN_ANSWERS = {
             "cash flow forecasting (important due to ingredient pre-purchasing), aged receivables "
             "for B2B customers, and monthly management reporting pack."
         ),
-    ],
-    "hr": [
+    ),
+    "hr": (
         (
             "35 employees across departments. Production staff (8) and warehouse staff (5) work "
             "in shifts — early shift 6am-2pm, late shift 2pm-10pm. Office staff work standard "
@@ -243,8 +259,8 @@ DOMAIN_ANSWERS = {
             "(conferences, travel). About 20-30 expense claims per month. Currently done via "
             "email with receipt photos — very manual approval process."
         ),
-    ],
-    "ecommerce": [
+    ),
+    "ecommerce": (
         (
             "Shopify is our primary storefront and we want to keep it — our frontend team has "
             "built custom features for the dog profile builder and subscription management. "
@@ -261,9 +277,12 @@ DOMAIN_ANSWERS = {
             "links their Shopify profile, order history, subscription details, and any B2B "
             "relationship if they're also a wholesale customer."
         ),
-    ],
+    ),
 }
 
+# Appended to the scoping answer when the question is a followup
+FOLLOWUP_SUFFIX = " We're quite clear on this — happy to elaborate further if needed."
+
 # Fallback for any domain/question not explicitly covered
 DEFAULT_ANSWER = (
     "That's handled fairly standardly for our industry. We follow common practices "
@@ -277,9 +296,12 @@ def main():
     print("\n  Starting automated demo interview...")
     print(f"  Server: {BASE}\n")
 
+    # One keep-alive connection for the whole run instead of a new one per call
+    http = requests.Session()
+
     # 1. Start session
     try:
-        r = requests.post(f"{BASE}/api/start", json={
+        r = post_json(http, f"{BASE}/api/start", {
             "client_name": "PetFresh",
             "industry": "Food & Beverage",
         }, timeout=10)
@@ -289,7 +311,7 @@ def main():
         print("    python3 web_interview.py\n")
         sys.exit(1)
 
-    session = r.json()
+    session = read_json(r)
     session_id = session["session_id"]
     print(f"  Session: {session_id}")
     print(f"  Company: {session['client_name']} ({session['industry']})\n")
@@ -299,11 +321,11 @@ def main():
     question_count = 0
     summary = None
 
-    while True:
-        # Get next question
-        r = requests.get(f"{BASE}/api/question", params={"session_id": session_id})
-        data = r.json()
+    # Only the first question needs its own request; each answer's response
+    # carries the question after it
+    data = read_json(http.get(f"{BASE}/api/question", params={"session_id": session_id}))
 
+    while True:
         if data.get("complete"):
             summary = data["summary"]
             print(f"\n  Interview complete! {question_count} questions answered.\n")
@@ -318,13 +340,13 @@ def main():
         # Pick the right answer
         if phase == "scoping":
             # Match by scope ID prefix (handles followups like scope_01_followup_1)
-            base_id = q_id.split("_followup")[0]
+            base_id, followup, _ = q_id.partition("_followup")
             answer = SCOPING_ANSWERS.get(base_id, DEFAULT_ANSWER)
-            if "_followup" in q_id:
-                answer = answer + " We're quite clear on this — happy to elaborate further if needed."
+            if followup:
+                answer += FOLLOWUP_SUFFIX
         elif phase == "domain_expert" and domain:
             idx = domain_q_index.get(domain, 0)
-            answers = DOMAIN_ANSWERS.get(domain, [])
+            answers = DOMAIN_ANSWERS.get(domain, ())
             if idx < len(answers):
                 answer = answers[idx]
             else:
@@ -342,8 +364,8 @@ def main():
         print(f"    Q: {q_short}")
         print(f"    A: {answer[:80]}...\n")
 
-        # Submit answer
-        r = requests.post(f"{BASE}/api/respond", json={
+        # Submit answer and get the next question
+        r = post_json(http, f"{BASE}/api/respond_and_next", {
             "session_id": session_id,
             "response": answer,
             "question": {
@@ -354,19 +376,17 @@ def main():
             }
         })
         question_count += 1
-
-        # Small delay to not overwhelm the LLM-based signal detection
-        time.sleep(0.3)
+        data = read_json(r)["next"]
 
     if not summary:
         print("  Error: no summary returned. Ending manually...")
-        r = requests.post(f"{BASE}/api/end", json={"session_id": session_id})
-        summary = r.json().get("summary", {})
+        r = post_json(http, f"{BASE}/api/end", {"session_id": session_id})
+        summary = read_json(r).get("summary", {})
 
     # 3. Generate PRD
     print("  Generating implementation PRD...")
-    r = requests.post(f"{BASE}/api/generate-prd", json={"summary": summary}, timeout=120)
-    prd = r.json()
+    r = post_json(http, f"{BASE}/api/generate-prd", {"summary": summary}, timeout=120)
+    prd = read_json(r)
 
     if prd.get("error"):
         print(f"  PRD generation error: {prd['error']}")
@@ -381,8 +401,12 @@ def main():
         company = summary.get("client_name", "company").replace(" ", "-")
         with open(f"outputs/prd-{company}.md", "w") as f:
             f.write(prd["markdown"])
-        with open(f"outputs/prd-{company}.json", "w") as f:
-            json.dump(prd["json"], f, indent=2)
+        if orjson is not None:
+            with open(f"outputs/prd-{company}.json", "wb") as f:
+                f.write(orjson.dumps(prd["json"], option=orjson.OPT_INDENT_2))
+        else:
+            with open(f"outputs/prd-{company}.json", "w") as f:
+                json.dump(prd["json"], f, indent=2)
         print(f"  Saved to outputs/prd-{company}.md and .json")
 
     print(f"""
@@ -3,6 +3,7 @@
 CLI for the Adaptive Interview Agent.
 
 Usage:
+    odoo-adaptive-interview --client "Company Name" --industry "Tech"
     python -m src.adaptive_cli --client "Company Name" --industry "Tech"
 
 Environment Variables:
@@ -18,17 +19,152 @@ The adaptive agent dynamically generates questions based on:
 """
 
 import argparse
+import asyncio
+import atexit
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import readline  # Line editing and history for input(); not on Windows
+except ImportError:
+    readline = None
 
-from src.agents.adaptive_interview_agent import (
-    AdaptiveInterviewAgent,
-    get_interview_llm_manager,
-)
+try:
+    import uvloop  # Faster event loop for batch interviews (not available on Windows)
+except ImportError:
+    uvloop = None
+
+# The agent and LLM stack are imported in main() once the arguments are
+# valid, so --help and usage errors return without loading them.
+if TYPE_CHECKING:
+    from .agents.adaptive_interview_agent import AdaptiveInterviewAgent
+
+
+@lru_cache(maxsize=1)
+def _detect_providers() -> dict:
+    """Which LLM providers can be used, checked once per process."""
+    from .llm.ollama_provider import OllamaProvider, is_server_reachable
+
+    return {
+        "groq": bool(os.getenv("GROQ_API_KEY")),
+        "ollama_up": is_server_reachable(os.environ.get("OLLAMA_HOST", OllamaProvider.DEFAULT_HOST)),
+    }
+
+
+def _write(out: io.StringIO):
+    """Write a buffered block of output to the terminal in one call."""
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
+
+def _handle_done(agent: "AdaptiveInterviewAgent") -> str:
+    print("Finishing interview early...")
+    return "break"
+
+
+def _handle_skip(agent: "AdaptiveInterviewAgent") -> str:
+    print("Question skipped.")
+    return "continue"
+
+
+def _handle_status(agent: "AdaptiveInterviewAgent") -> str:
+    summary = agent.get_interview_summary()
+    out = io.StringIO()
+    print(f"\n--- Status ---", file=out)
+    print(f"Questions asked: {summary['questions_asked']}", file=out)
+    print(f"Modules detected: {agent.modules_text() or 'None yet'}", file=out)
+    print(f"Signals: {summary['detected_signals']}", file=out)
+    _write(out)
+    return "continue"
+
+
+# Typed commands, checked before an answer is processed
+_COMMANDS = {
+    "done": _handle_done,
+    "skip": _handle_skip,
+    "status": _handle_status,
+}
+
+
+# Horizontal rules around the banner/summary and each question
+RULE = "=" * 60
+QUESTION_RULE = "─" * 50
+
+
+class PrerecordedAnswers:
+    """Answers read from a text file (one per line), standing in for the user."""
+
+    def __init__(self, path: str):
+        self.path = path
+        lines = Path(path).read_text().splitlines()
+        self._answers = iter([line.strip() for line in lines if line.strip()])
+
+    async def get(self) -> str:
+        """The next answer; raises EOFError when the file is used up, like input()."""
+        try:
+            return next(self._answers)
+        except StopIteration:
+            raise EOFError(self.path) from None
+
+
+async def run_batch_interview(
+    agent: "AdaptiveInterviewAgent", answers: PrerecordedAnswers, compress: bool = False
+) -> str:
+    """
+    Run one interview against pre-recorded answers and save it.
+
+    The agent's blocking calls (LLM requests included) run in worker threads,
+    so several of these can run concurrently on one event loop.
+    """
+    while True:
+        question = await asyncio.to_thread(agent.get_next_question)
+        if not question:
+            break
+        try:
+            response = await answers.get()
+        except EOFError:
+            break
+        command = response.lower()
+        if command == "done":
+            break
+        if command in ("skip", "status"):
+            continue
+        await asyncio.to_thread(agent.process_response, response, question)
+    return await asyncio.to_thread(agent.save_interview, compress)
+
+
+async def run_batch_interviews(agents: list, answer_files: list[str], compress: bool = False) -> list[str]:
+    """Run one interview per answers file concurrently; returns the saved paths."""
+    return await asyncio.gather(*(
+        run_batch_interview(agent, PrerecordedAnswers(path), compress)
+        for agent, path in zip(agents, answer_files)
+    ))
+
+
+HISTORY_FILE = os.path.expanduser("~/.odoo_interview_history")
+
+
+def _enable_line_editing():
+    """Arrow-key history across sessions and tab completion of commands."""
+    if readline is None:
+        return
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
+    def complete(text, state):
+        matches = [cmd for cmd in _COMMANDS if cmd.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
 
 
 def main():
@@ -44,6 +180,10 @@ Examples:
     python -m src.adaptive_cli --client "Test Co" --industry "Services" \\
         --config ./custom_questions.json
 
+    # Batch: one concurrent interview per answers file (one answer per line)
+    python -m src.adaptive_cli --client "Test Co" --industry "Retail" \\
+        --answers answers/a.txt answers/b.txt
+
 LLM Providers (free/open-source only):
     - Groq: Set GROQ_API_KEY (free at console.groq.com, 1000 req/day)
     - Ollama: Run locally with `ollama serve` (unlimited, no API key needed)
@@ -69,26 +209,81 @@ LLM Providers (free/open-source only):
         default="./outputs",
         help="Output directory for interview results"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing responses cached in ./.llm_cache"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Save results as zstd-compressed JSON (.json.zst, needs zstandard)"
+    )
+    parser.add_argument(
+        "--answers",
+        nargs="+",
+        metavar="FILE",
+        help="Run non-interactively, one concurrent interview per answers file "
+             "(results go to a subdirectory of --output-dir named after the file)"
+    )
 
     args = parser.parse_args()
 
-    # Check for API keys
-    has_groq = bool(os.getenv("GROQ_API_KEY"))
+    from .agents import adaptive_interview_agent
+    from .agents.adaptive_interview_agent import (
+        AdaptiveInterviewAgent,
+        get_interview_llm_manager,
+    )
+    from .llm.cache import DEFAULT_CACHE_DIR, ResponseCache
+
+    if args.compress and adaptive_interview_agent.zstandard is None:
+        parser.error("--compress needs the zstandard package (pip install zstandard)")
 
-    print(f"\n{'='*60}")
-    print("Adaptive Odoo Implementation Interview")
-    print(f"{'='*60}")
-    print(f"Client: {args.client}")
-    print(f"Industry: {args.industry}")
+    _enable_line_editing()
 
-    if has_groq:
-        print("LLM Provider: Groq (Llama 3.3 70B, free tier)")
-    else:
-        print("LLM Provider: Ollama (local)")
-        print("  Tip: Set GROQ_API_KEY for better quality (free at console.groq.com)")
+    providers = _detect_providers()
 
-    print(f"Output: {args.output_dir}")
-    print(f"{'='*60}\n")
+    # Each block of output is collected and written with a single call
+    out = io.StringIO()
+    print(f"\n{RULE}", file=out)
+    print("Adaptive Odoo Implementation Interview", file=out)
+    print(RULE, file=out)
+    print(f"Client: {args.client}", file=out)
+    print(f"Industry: {args.industry}", file=out)
+
+    if providers["groq"]:
+        print("LLM Provider: Groq (Llama 3.3 70B, free tier)", file=out)
+    else:
+        if providers["ollama_up"]:
+            print("LLM Provider: Ollama (local)", file=out)
+        else:
+            print("LLM Provider: none found (start Ollama with `ollama serve`)", file=out)
+        print("  Tip: Set GROQ_API_KEY for better quality (free at console.groq.com)", file=out)
+
+    print(f"Output: {args.output_dir}", file=out)
+    print(f"LLM cache: {'off' if args.no_cache else DEFAULT_CACHE_DIR}", file=out)
+    print(f"{RULE}\n", file=out)
+    _write(out)
+
+    llm_manager = get_interview_llm_manager(cache=None if args.no_cache else ResponseCache())
+
+    if args.answers:
+        # All interviews share one LLM manager (and its connections and cache)
+        agents = [
+            AdaptiveInterviewAgent(
+                client_name=args.client,
+                industry=args.industry,
+                output_dir=str(Path(args.output_dir) / Path(path).stem),
+                config_knowledge_path=args.config,
+                llm_manager=llm_manager,
+                batch_llm_calls=True,
+            )
+            for path in args.answers
+        ]
+        run = uvloop.run if uvloop is not None else asyncio.run
+        for path, filepath in zip(args.answers, run(run_batch_interviews(agents, args.answers, args.compress))):
+            print(f"{path} -> {filepath}")
+        return
 
     # Initialize agent
     agent = AdaptiveInterviewAgent(
@@ -96,21 +291,27 @@ LLM Providers (free/open-source only):
         industry=args.industry,
         output_dir=args.output_dir,
         config_knowledge_path=args.config,
+        llm_manager=llm_manager,
     )
 
+    out = io.StringIO()
     # Show available providers
     if agent.llm_manager:
         status = agent.llm_manager.get_status()
-        print(f"Active LLM: {status.get('current_provider', 'None')}")
+        print(f"Active LLM: {status.get('current_provider', 'None')}", file=out)
         for provider, info in status.get("providers", {}).items():
-            print(f"  - {provider}: {info.get('status')} ({info.get('model')})")
-        print()
+            print(f"  - {provider}: {info.get('status')} ({info.get('model')})", file=out)
+        print(file=out)
 
     # Run interview
-    print("Starting adaptive interview...")
-    print("Commands: 'done' to finish, 'skip' to skip, 'status' to see progress\n")
+    print("Starting adaptive interview...", file=out)
+    print("Commands: 'done' to finish, 'skip' to skip, 'status' to see progress\n", file=out)
+    _write(out)
 
     question_count = 0
+    # Generates upcoming questions with the LLM while the user is typing
+    prefetch = ThreadPoolExecutor(max_workers=1)
+
     while True:
         question = agent.get_next_question()
 
@@ -119,13 +320,16 @@ LLM Providers (free/open-source only):
             break
 
         question_count += 1
-        print(f"\n{'─'*50}")
-        print(f"[{question.module_source}] Question {question_count}")
-        print(f"{'─'*50}")
-        print(f"\n{question.text}\n")
+        out = io.StringIO()
+        print(f"\n{QUESTION_RULE}", file=out)
+        print(f"[{question.module_source}] Question {question_count}", file=out)
+        print(QUESTION_RULE, file=out)
+        print(f"\n{question.text}\n", file=out)
 
         if question.context:
-            print(f"(Context: {question.context})")
+            print(f"(Context: {question.context})", file=out)
+        _write(out)
+        agent.prefetch_questions(prefetch)
 
         try:
             response = input("\n> ").strip()
@@ -136,57 +340,52 @@ LLM Providers (free/open-source only):
             print("\n\nEnd of input.")
             break
 
-        if response.lower() == 'done':
-            print("Finishing interview early...")
-            break
-
-        if response.lower() == 'skip':
-            print("Question skipped.")
-            continue
-
-        if response.lower() == 'status':
-            summary = agent.get_interview_summary()
-            print(f"\n--- Status ---")
-            print(f"Questions asked: {summary['questions_asked']}")
-            print(f"Modules detected: {', '.join(summary['recommended_modules']) or 'None yet'}")
-            print(f"Signals: {summary['detected_signals']}")
+        handler = _COMMANDS.get(response.lower())
+        if handler:
+            if handler(agent) == "break":
+                break
             continue
 
         # Process the response
         result = agent.process_response(response, question)
 
         # Show feedback
+        out = io.StringIO()
         if result.get("signals_detected"):
             signals = ", ".join(result["signals_detected"].keys())
-            print(f"  🔍 Signals detected: {signals}")
+            print(f"  🔍 Signals detected: {signals}", file=out)
 
         if result.get("modules_identified"):
-            print(f"  📦 Modules: {', '.join(result['modules_identified'][:5])}")
+            print(f"  📦 Modules: {', '.join(result['modules_identified'][:5])}", file=out)
 
         if result.get("followup_generated"):
-            print("  💡 Follow-up question queued")
+            print("  💡 Follow-up question queued", file=out)
+
+        print(f"  📋 Questions remaining: {result.get('questions_in_queue', 0)}", file=out)
+        _write(out)
 
-        print(f"  📋 Questions remaining: {result.get('questions_in_queue', 0)}")
+    prefetch.shutdown(wait=False, cancel_futures=True)
 
     # Save results
-    filepath = agent.save_interview()
+    filepath = agent.save_interview(compress=args.compress)
     summary = agent.get_interview_summary()
 
-    print(f"\n{'='*60}")
-    print("Interview Summary")
-    print(f"{'='*60}")
-    print(f"Questions asked: {summary['questions_asked']}")
-    print(f"Recommended modules: {', '.join(summary['recommended_modules']) or 'None detected'}")
+    out = io.StringIO()
+    print(f"\n{RULE}", file=out)
+    print("Interview Summary", file=out)
+    print(RULE, file=out)
+    print(f"Questions asked: {summary['questions_asked']}", file=out)
+    print(f"Recommended modules: {agent.modules_text() or 'None detected'}", file=out)
 
     if summary.get('detected_signals'):
-        print(f"\nDetected signals:")
+        print(f"\nDetected signals:", file=out)
         for signal, count in summary['detected_signals'].items():
             if count > 0:
-                print(f"  - {signal}: {count}")
-
-    print(f"\nResults saved to: {filepath}")
-    print(f"{'='*60}")
+                print(f"  - {signal}: {count}", file=out)
 
+    print(f"\nResults saved to: {filepath}", file=out)
+    print(RULE, file=out)
+    _write(out)
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,18 @@
 """
 Agent modules for Odoo ERP Implementation System.
-"""
 
-from .interview_agent import InterviewAgent
-from .smart_interview_agent import SmartInterviewAgent, create_smart_agent
+Agents are imported on first attribute access (PEP 562), so importing one
+agent module does not load the others.
+"""
 
 __all__ = ["InterviewAgent", "SmartInterviewAgent", "create_smart_agent"]
+
+
+def __getattr__(name):
+    if name == "InterviewAgent":
+        from .interview_agent import InterviewAgent
+        return InterviewAgent
+    if name in ("SmartInterviewAgent", "create_smart_agent"):
+        from . import smart_interview_agent
+        return getattr(smart_interview_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,19 +12,37 @@ Instead of hardcoded questions, this agent:
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
+import os
+import sys
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Iterable, NamedTuple, Optional
+
+try:
+    import orjson  # Faster JSON for knowledge files, the journal and saves
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # Compressed interview saves (save_interview(compress=True))
+except ImportError:
+    zstandard = None
 
 from ..llm.base import Message
+from ..llm.cache import ResponseCache
 from ..llm.manager import LLMManager, LLMManagerConfig
+from ..signals import SIGNAL_PATTERNS as _SIGNAL_PATTERNS
+from ..signals import detect_signals as shared_detect_signals
 from ..swarm.registry import ModuleRegistry
-from ..signals import SIGNAL_PATTERNS as _SIGNAL_PATTERNS, detect_signals as shared_detect_signals
 
 
-def get_interview_llm_manager() -> LLMManager:
+def get_interview_llm_manager(cache: Optional[ResponseCache] = None) -> LLMManager:
     """
     Get an LLM manager configured for interviews.
 
@@ -32,6 +50,9 @@ def get_interview_llm_manager() -> LLMManager:
     - Groq: Free tier with Llama 3.3 70B (1000 requests/day)
     - Ollama: Local inference (unlimited, requires ollama running)
 
+    Args:
+        cache: Optional on-disk cache that serves repeated prompts
+
     Returns:
         Configured LLM manager
     """
@@ -42,14 +63,25 @@ def get_interview_llm_manager() -> LLMManager:
             "ollama": "mistral:latest"
         }
     )
-    return LLMManager(config)
+    return LLMManager(config, cache=cache)
+
+
+# Parsed knowledge files keyed by (resolved path, mtime), so every agent in a
+# process shares one parse and an edited file is picked up on the next agent
+_CONFIG_CACHE: dict[tuple[str, int], dict] = {}
+_REGISTRY_CACHE: dict[tuple[str, int], ModuleRegistry] = {}
+
+
+def _file_key(path: Path) -> tuple[str, int]:
+    return str(path.resolve()), path.stat().st_mtime_ns
 
 
 def load_module_config_knowledge(path: Optional[Path] = None) -> dict:
     """
     Load module configuration knowledge from JSON file.
 
-    This allows updating questions without code changes.
+    This allows updating questions without code changes. The result is cached
+    per file version and shared between callers, so treat it as read-only.
 
     Args:
         path: Path to JSON file. If None, uses default location.
@@ -62,9 +94,15 @@ def load_module_config_knowledge(path: Optional[Path] = None) -> dict:
 
     if path.exists():
         try:
-            data = json.loads(path.read_text())
-            # Filter out metadata keys
-            return {k: v for k, v in data.items() if not k.startswith("_")}
+            key = _file_key(path)
+            if key not in _CONFIG_CACHE:
+                raw = path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                # Filter out metadata keys
+                _CONFIG_CACHE[key] = _intern_knowledge(
+                    {k: v for k, v in data.items() if not k.startswith("_")}
+                )
+            return _CONFIG_CACHE[key]
         except Exception as e:
             print(f"Warning: Could not load module config from {path}: {e}")
 
@@ -72,7 +110,82 @@ def load_module_config_knowledge(path: Optional[Path] = None) -> dict:
     return {}
 
 
-@dataclass
+def _intern_knowledge(knowledge: dict) -> dict:
+    """
+    Intern module names, area names and config fields in place. Parsed JSON
+    strings are fresh objects; interned ones compare by identity as dict keys
+    and set members.
+    """
+    for module in list(knowledge):
+        module_info = knowledge.pop(module)
+        knowledge[sys.intern(module)] = module_info
+        for area in module_info.get("setup_areas", ()):
+            area["area"] = sys.intern(area["area"])
+            area["config_fields"] = [sys.intern(f) for f in area["config_fields"]]
+    return knowledge
+
+
+def _load_registry(path: Path) -> ModuleRegistry:
+    """ModuleRegistry.from_json, parsed once per file version (see _CONFIG_CACHE)."""
+    key = _file_key(path)
+    if key not in _REGISTRY_CACHE:
+        _REGISTRY_CACHE[key] = ModuleRegistry.from_json(path)
+    return _REGISTRY_CACHE[key]
+
+
+class QuestionTemplate(NamedTuple):
+    """A module configuration question with every field already formatted."""
+    id: str
+    text: str
+    context: str
+    config_target: str
+    priority: int
+    area_key: str  # "<module>_<area>", matched against gathered_info
+    depends_on: tuple[str, ...] = ()  # Ids of questions to ask first
+
+
+# id(knowledge dict) -> (that dict, its templates); see question_templates
+_TEMPLATE_CACHE: dict[int, tuple[dict, dict[str, tuple[QuestionTemplate, ...]]]] = {}
+
+
+def question_templates(knowledge: dict) -> dict[str, tuple[QuestionTemplate, ...]]:
+    """
+    Flatten module config knowledge (module -> setup areas -> questions) into
+    per-module question templates, once per knowledge dict.
+    """
+    cached = _TEMPLATE_CACHE.get(id(knowledge))
+    if cached is not None and cached[0] is knowledge:
+        return cached[1]
+
+    templates = {}
+    for module, module_info in knowledge.items():
+        areas = module_info["setup_areas"]
+        # An area may list other areas of its module in "depends_on"; its
+        # questions then wait for all of theirs
+        # Ids are interned: they end up in the agent's asked-id set and queue
+        area_ids = {
+            area["area"]: [sys.intern(f"{module}_{area['area']}_{i:02d}") for i in range(len(area["questions"]))]
+            for area in areas
+        }
+        templates[module] = tuple(
+            QuestionTemplate(
+                id=sys.intern(f"{module}_{area['area']}_{i:02d}"),
+                text=q_text,
+                context=area["context"],
+                config_target=", ".join(area["config_fields"]),
+                priority=7 - i,  # First questions in area are higher priority
+                area_key=sys.intern(f"{module}_{area['area']}"),
+                depends_on=tuple(qid for dep in area.get("depends_on", ()) for qid in area_ids.get(dep, ())),
+            )
+            for area in areas
+            for i, q_text in enumerate(area["questions"])
+        )
+    # Holding the dict keeps its id from being reused by another object
+    _TEMPLATE_CACHE[id(knowledge)] = (knowledge, templates)
+    return templates
+
+
+@dataclass(slots=True)
 class ModuleConfigRequirement:
     """Configuration requirement for an Odoo module."""
     module_name: str
@@ -85,7 +198,7 @@ class ModuleConfigRequirement:
     priority: int = 5  # 1-10, higher = more important
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicQuestion:
     """A dynamically generated interview question."""
     id: str
@@ -97,9 +210,10 @@ class DynamicQuestion:
     follow_ups: list[str] = field(default_factory=list)
     asked: bool = False
     response: str = ""
+    depends_on: list[str] = field(default_factory=list)  # Question ids to ask first
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewContext:
     """Tracks the evolving context during an interview."""
     client_name: str
@@ -112,325 +226,51 @@ class InterviewContext:
     current_focus_modules: list[str] = field(default_factory=list)
 
 
-# Module configuration knowledge base - loaded from registry + enhanced with setup needs
-MODULE_CONFIG_KNOWLEDGE = {
-    "sale_management": {
-        "name": "Sales",
-        "setup_areas": [
-            {
-                "area": "product_types",
-                "questions": [
-                    "What types of products do you sell? (Physical goods, services, subscriptions, or a mix?)",
-                    "For each product type, when should invoicing happen? (On order confirmation, on delivery, based on time spent?)"
-                ],
-                "config_fields": ["product.product.type", "product.product.invoice_policy"],
-                "context": "Determines product type and invoicing policy configuration"
-            },
-            {
-                "area": "pricing",
-                "questions": [
-                    "Do you need multiple price lists? (e.g., retail vs wholesale, regional pricing)",
-                    "How should discounts work? (Fixed amount, percentage, tiered based on quantity?)"
-                ],
-                "config_fields": ["product.pricelist", "sale.order.line.discount"],
-                "context": "Configures pricelists and discount policies"
-            },
-            {
-                "area": "quotation_workflow",
-                "questions": [
-                    "Do quotations need approval before being sent to customers?",
-                    "What validity period should quotations have by default?",
-                    "Do you need electronic signatures on quotes?"
-                ],
-                "config_fields": ["sale.order.validity_date", "sale.order.signature"],
-                "context": "Configures quotation templates and approval workflows"
-            },
-            {
-                "area": "sales_teams",
-                "questions": [
-                    "How are sales organized? (By region, product line, customer type?)",
-                    "Do salespeople have individual targets or quotas to track?"
-                ],
-                "config_fields": ["crm.team", "sale.order.team_id"],
-                "context": "Configures sales team structure"
-            }
-        ]
-    },
-    "crm": {
-        "name": "CRM",
-        "setup_areas": [
-            {
-                "area": "pipeline_stages",
-                "questions": [
-                    "Walk me through your sales pipeline stages from first contact to closed deal",
-                    "Are there stages where deals commonly get stuck? What happens then?",
-                    "Do certain stages require specific actions before moving forward?"
-                ],
-                "config_fields": ["crm.stage", "crm.lead.stage_id"],
-                "context": "Configures CRM pipeline stages and requirements"
-            },
-            {
-                "area": "lead_sources",
-                "questions": [
-                    "Where do your leads come from? (Website, referrals, trade shows, cold outreach?)",
-                    "Do you need to track which marketing campaigns generate leads?"
-                ],
-                "config_fields": ["utm.source", "crm.lead.source_id"],
-                "context": "Configures lead source tracking and UTM parameters"
-            },
-            {
-                "area": "lead_scoring",
-                "questions": [
-                    "How do you currently qualify leads? What makes a lead 'hot' vs 'cold'?",
-                    "Should leads be automatically assigned to salespeople based on criteria?"
-                ],
-                "config_fields": ["crm.lead.priority", "crm.team.assignment_domain"],
-                "context": "Configures lead scoring and assignment rules"
-            }
-        ]
-    },
-    "stock": {
-        "name": "Inventory",
-        "setup_areas": [
-            {
-                "area": "warehouse_structure",
-                "questions": [
-                    "Describe your warehouse layout - do you have zones, aisles, racks, bins?",
-                    "Do you need to track inventory at bin/shelf level or just warehouse level?",
-                    "How many physical warehouse locations do you have?"
-                ],
-                "config_fields": ["stock.warehouse", "stock.location"],
-                "context": "Configures warehouse hierarchy and locations"
-            },
-            {
-                "area": "tracking",
-                "questions": [
-                    "Do any products require serial number tracking? (Unique ID per unit)",
-                    "Do any products require lot/batch tracking? (Group ID for production batches)",
-                    "Do you have products with expiration dates that need tracking?"
-                ],
-                "config_fields": ["product.template.tracking", "stock.lot"],
-                "context": "Configures product traceability"
-            },
-            {
-                "area": "routes",
-                "questions": [
-                    "For each product type: do you keep it in stock, make it on demand, or dropship it?",
-                    "At what inventory level should reordering be triggered?",
-                    "Do you need to reserve stock when orders are confirmed?"
-                ],
-                "config_fields": ["product.template.route_ids", "stock.warehouse.orderpoint"],
-                "context": "Configures inventory routes and replenishment"
-            },
-            {
-                "area": "operations",
-                "questions": [
-                    "Describe your picking process - do pickers pick individual orders or batches?",
-                    "Do you pack items at a packing station or is picking and packing combined?",
-                    "Do you use barcode scanners in your warehouse?"
-                ],
-                "config_fields": ["stock.picking.batch", "stock.picking.type"],
-                "context": "Configures warehouse operations"
-            }
-        ]
-    },
-    "account": {
-        "name": "Accounting",
-        "setup_areas": [
-            {
-                "area": "localization",
-                "questions": [
-                    "In which country/countries do you need to file tax returns?",
-                    "What accounting standards do you follow? (Local GAAP, IFRS?)",
-                    "Do you need specific legal document formats for invoices?"
-                ],
-                "config_fields": ["res.company.country_id", "account.fiscal.position"],
-                "context": "Selects localization package and compliance settings"
-            },
-            {
-                "area": "chart_of_accounts",
-                "questions": [
-                    "Do you have an existing chart of accounts you want to replicate?",
-                    "How detailed should account tracking be? (One revenue account vs. by product category)",
-                    "Do you need separate P&L tracking by business unit or location?"
-                ],
-                "config_fields": ["account.account", "account.analytic.account"],
-                "context": "Configures chart of accounts structure"
-            },
-            {
-                "area": "taxes",
-                "questions": [
-                    "What tax rates do you charge on sales? (VAT, GST, sales tax?)",
-                    "Do tax rates vary by product type or customer location?",
-                    "Do you have any tax-exempt products or customers?"
-                ],
-                "config_fields": ["account.tax", "account.fiscal.position.tax"],
-                "context": "Configures tax rates and fiscal positions"
-            },
-            {
-                "area": "payment_terms",
-                "questions": [
-                    "What are your standard payment terms? (Net 30, Due on receipt, etc.)",
-                    "Do you offer early payment discounts?",
-                    "Do different customer types have different payment terms?"
-                ],
-                "config_fields": ["account.payment.term"],
-                "context": "Configures payment terms"
-            },
-            {
-                "area": "bank_reconciliation",
-                "questions": [
-                    "Which banks do you use for business banking?",
-                    "How do you currently import bank statements? (Manual, download, API?)",
-                    "How should payments be matched to invoices?"
-                ],
-                "config_fields": ["res.partner.bank", "account.journal"],
-                "context": "Configures bank accounts and reconciliation"
-            }
-        ]
-    },
-    "purchase": {
-        "name": "Purchase",
-        "setup_areas": [
-            {
-                "area": "vendors",
-                "questions": [
-                    "How many active vendors/suppliers do you work with?",
-                    "Do you negotiate pricing agreements or contracts with vendors?",
-                    "Do you have preferred vendors for specific product categories?"
-                ],
-                "config_fields": ["res.partner.supplier_rank", "product.supplierinfo"],
-                "context": "Configures vendor relationships"
-            },
-            {
-                "area": "approval_workflow",
-                "questions": [
-                    "Do purchase orders require approval? At what amount thresholds?",
-                    "Who has authority to approve purchases?",
-                    "Are there spending limits per person or department?"
-                ],
-                "config_fields": ["purchase.order.approval", "base.approval.type"],
-                "context": "Configures purchase approval workflows"
-            },
-            {
-                "area": "receiving",
-                "questions": [
-                    "Do you do quality inspection on received goods?",
-                    "How do you handle partial deliveries from vendors?",
-                    "Do you need to track vendor performance (on-time delivery, quality)?"
-                ],
-                "config_fields": ["stock.picking", "quality.check"],
-                "context": "Configures receiving and vendor management"
-            }
-        ]
-    },
-    "mrp": {
-        "name": "Manufacturing",
-        "setup_areas": [
-            {
-                "area": "bom",
-                "questions": [
-                    "Describe a typical bill of materials - how many levels deep are your BOMs?",
-                    "Do you have products with variants that share similar BOMs?",
-                    "Do you track by-products or scrap from manufacturing?"
-                ],
-                "config_fields": ["mrp.bom", "mrp.bom.line"],
-                "context": "Configures bill of materials structure"
-            },
-            {
-                "area": "work_centers",
-                "questions": [
-                    "What workstations/machines are involved in production?",
-                    "Do you track time and capacity per work center?",
-                    "Do you need to schedule based on work center availability?"
-                ],
-                "config_fields": ["mrp.workcenter", "mrp.workcenter.capacity"],
-                "context": "Configures work centers and capacity"
-            },
-            {
-                "area": "operations",
-                "questions": [
-                    "Do manufacturing orders follow a specific routing (sequence of operations)?",
-                    "Do workers need detailed work instructions at each step?",
-                    "Do you need to track actual time vs. expected time per operation?"
-                ],
-                "config_fields": ["mrp.routing", "mrp.routing.workcenter"],
-                "context": "Configures manufacturing operations and routing"
-            }
-        ]
-    },
-    "hr": {
-        "name": "HR / Employees",
-        "setup_areas": [
-            {
-                "area": "organization",
-                "questions": [
-                    "What is your organizational structure? (Departments, teams, reporting lines)",
-                    "Do you have multiple office locations with different employee groups?",
-                    "What job positions exist in your company?"
-                ],
-                "config_fields": ["hr.department", "hr.job", "hr.employee"],
-                "context": "Configures organizational structure"
-            },
-            {
-                "area": "attendance",
-                "questions": [
-                    "How do employees track their working hours?",
-                    "Do you have flexible working hours or fixed schedules?",
-                    "Do you need overtime tracking and rules?"
-                ],
-                "config_fields": ["hr.attendance", "resource.calendar"],
-                "context": "Configures attendance tracking"
-            },
-            {
-                "area": "leave",
-                "questions": [
-                    "What types of leave do you offer? (Vacation, sick, personal, etc.)",
-                    "How are leave balances calculated and allocated?",
-                    "What is the approval process for leave requests?"
-                ],
-                "config_fields": ["hr.leave.type", "hr.leave.allocation"],
-                "context": "Configures leave management"
-            }
-        ]
-    },
-    "project": {
-        "name": "Project",
-        "setup_areas": [
-            {
-                "area": "project_types",
-                "questions": [
-                    "What types of projects do you manage? (Client projects, internal, R&D?)",
-                    "How do you structure projects? (Phases, milestones, tasks?)",
-                    "Do projects have budgets that need tracking?"
-                ],
-                "config_fields": ["project.project", "project.task.type"],
-                "context": "Configures project structure"
-            },
-            {
-                "area": "billing",
-                "questions": [
-                    "How do you bill clients for project work? (Fixed price, time & materials, milestone-based?)",
-                    "Do you need to track project profitability?",
-                    "Should timesheets automatically create invoice lines?"
-                ],
-                "config_fields": ["project.project.pricing_type", "account.analytic.line"],
-                "context": "Configures project billing"
-            },
-            {
-                "area": "timesheets",
-                "questions": [
-                    "How should employees log time? (Per task, per project, per day?)",
-                    "Do timesheets need manager approval?",
-                    "Should there be minimum/maximum hours per day validation?"
-                ],
-                "config_fields": ["hr.timesheet.config", "account.analytic.line"],
-                "context": "Configures timesheet entry"
-            }
-        ]
-    }
+# Most follow-up questions generated for a single answer
+MAX_FOLLOWUPS = 3
+# Most gap-filling questions asked for per refinement call
+MAX_REFINED_QUESTIONS = 3
+# A prefetched refinement is used while it has missed at most the answer it
+# was started before and a round of follow-up answers that kept the queue full
+PREFETCH_MAX_MISSED_ANSWERS = 1 + MAX_FOLLOWUPS
+# Output budget per generated question ("Q: " and one sentence). Requests are
+# capped at what their questions need rather than a flat few hundred tokens
+TOKENS_PER_QUESTION = 50
+
+# Odoo modules each detected business signal brings into focus
+SIGNAL_TO_MODULE: dict[str, tuple[str, ...]] = {
+    "sales": ("sale_management", "crm"),
+    "crm": ("crm",),
+    "ecommerce": ("sale_management", "website_sale"),
+    "inventory": ("stock",),
+    "purchase": ("purchase",),
+    "accounting": ("account",),
+    "manufacturing": ("mrp",),
+    "hr": ("hr",),
+    "project": ("project",),
+    "support": ("helpdesk",),
 }
 
+# Answers of fewer words than this with no business signal ("yes", "no",
+# "about 12 people") rarely need a follow-up, so no LLM call is made for them
+SHORT_ANSWER_MIN_WORDS = 6
+
+# Runs refinement alongside follow-up generation in process_response. Shared by
+# all agents so batch runs and web sessions don't each leave a worker thread behind
+_LLM_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="interview-llm")
+
+
+# Module configuration knowledge base used when the external JSON is missing.
+# Kept as data rather than a literal so processes that load the external file
+# never build it; read on first access through MODULE_CONFIG_KNOWLEDGE
+DEFAULT_FALLBACK_PATH = Path(__file__).parent.parent / "knowledge" / "module_config_requirements_default.json"
+
+
+def __getattr__(name: str):
+    if name == "MODULE_CONFIG_KNOWLEDGE":
+        return load_module_config_knowledge(DEFAULT_FALLBACK_PATH)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class AdaptiveInterviewAgent:
     """
@@ -448,6 +288,7 @@ class AdaptiveInterviewAgent:
         llm_manager: Optional[LLMManager] = None,
         output_dir: str = "./outputs",
         config_knowledge_path: Optional[str] = None,  # External JSON for questions
+        batch_llm_calls: bool = False,  # Fewer, larger LLM requests (for non-interactive runs)
     ):
         self.context = InterviewContext(client_name=client_name, industry=industry)
 
@@ -457,31 +298,63 @@ class AdaptiveInterviewAgent:
         else:
             self.llm_manager = get_interview_llm_manager()
 
-        self.output_dir = Path(output_dir)
+        # Resolved and created once; every save reuses these paths
+        self.output_dir = Path(output_dir).absolute()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Each answer is appended to a JSONL journal as it is given, so an
+        # interrupted interview keeps its answers (see _journal_response)
+        self.journal_path = self.output_dir / f"adaptive-interview-{datetime.now():%Y%m%d%H%M%S}.jsonl"
+        self.summary_path = self.journal_path.with_suffix(".json")
+        self._journal_fd: Optional[int] = None
+        # Responses record a monotonic offset from this pair; ISO timestamps
+        # are only formatted when the interview is saved (see _response_time)
+        self._t0_wall = datetime.now()
+        self._t0_mono_ns = time.monotonic_ns()
+
+        # Same modules as context.current_focus_modules, for O(1) membership tests
+        self._focus_modules: set[str] = set()
+        # Bumped whenever current_focus_modules changes; see modules_text
+        self._modules_version = 0
+        self._modules_text: tuple[int, str] = (0, "")
+
         # Load module configuration knowledge (questions) from external JSON
         # This allows updating questions without code changes
         self.module_config_knowledge = load_module_config_knowledge(
             Path(config_knowledge_path) if config_knowledge_path else None
         )
-        # Fall back to hardcoded if JSON not available
+        # Fall back to the bundled defaults if JSON not available
         if not self.module_config_knowledge:
-            self.module_config_knowledge = MODULE_CONFIG_KNOWLEDGE
+            self.module_config_knowledge = load_module_config_knowledge(DEFAULT_FALLBACK_PATH)
+        self._question_templates = question_templates(self.module_config_knowledge)
 
         # Load module registry
         if registry_path:
-            self.registry = ModuleRegistry.from_json(registry_path)
+            self.registry = _load_registry(Path(registry_path))
         else:
             default_path = Path(__file__).parent.parent / "knowledge" / "odoo_modules.json"
             if default_path.exists():
-                self.registry = ModuleRegistry.from_json(default_path)
+                self.registry = _load_registry(default_path)
             else:
                 self.registry = None
 
-        # Question queue - dynamically populated
-        self.question_queue: list[DynamicQuestion] = []
+        # Question queue - dynamically populated. A heap of
+        # (-priority, sequence, question): higher priority first, then queue order
+        self._queue: list[tuple[int, int, DynamicQuestion]] = []
+        self._back_seq = itertools.count()  # Appended questions go after their priority peers
+        self._front_seq = 0  # Decreases for questions put ahead of their peers
+        self._followup_ids = itertools.count(1)  # Numbers follow-up question ids
         self.asked_questions: list[DynamicQuestion] = []
+        self._asked_ids: set[str] = set()  # ids in asked_questions, for O(1) lookups
+        self._exhausted_modules: set[str] = set()  # Every template question asked
+
+        # (responses count it was based on, Future of refined questions), see prefetch_questions
+        self._prefetched: Optional[tuple[int, Future]] = None
+        # Short signal-free answers not sent for follow-ups (see SHORT_ANSWER_MIN_WORDS)
+        self.followups_skipped = 0
+        # When both are due, one LLM request yields follow-ups and refinement
+        # (see _batch_llm_tasks); otherwise they run concurrently
+        self.batch_llm_calls = batch_llm_calls
 
         # Initialize with discovery questions
         self._add_discovery_questions()
@@ -522,7 +395,36 @@ class AdaptiveInterviewAgent:
                 priority=8
             )
         ]
-        self.question_queue.extend(discovery_questions)
+        self._enqueue(discovery_questions)
+
+    @property
+    def question_queue(self) -> tuple[DynamicQuestion, ...]:
+        """
+        Queued questions by priority, then queue order, as a read-only snapshot.
+
+        get_next_question may still defer a question whose depends_on are
+        queued. The queue is a heap, so it is not mutated in place: assign a
+        new sequence to replace it.
+        """
+        return tuple(q for _, _, q in sorted(self._queue))
+
+    @question_queue.setter
+    def question_queue(self, questions: Iterable[DynamicQuestion]):
+        self._queue = []
+        self._enqueue(list(questions))
+
+    def _enqueue(self, questions: list[DynamicQuestion], front: bool = False):
+        """
+        Queue questions by priority. With front=True they go ahead of queued
+        questions of the same priority, keeping their own order.
+        """
+        if front:
+            self._front_seq -= len(questions)
+            seqs = range(self._front_seq, self._front_seq + len(questions))
+        else:
+            seqs = self._back_seq
+        for seq, q in zip(seqs, questions):
+            heapq.heappush(self._queue, (-q.priority, seq, q))
 
     def _detect_signals(self, response: str) -> dict[str, int]:
         """Detect business signals from a response with negation awareness."""
@@ -534,85 +436,99 @@ class AdaptiveInterviewAgent:
         questions = []
 
         for module in modules:
-            if module not in self.module_config_knowledge:
+            if module in self._exhausted_modules:
                 continue
-
-            module_info = self.module_config_knowledge[module]
-
-            for area in module_info["setup_areas"]:
-                # Check if we already have info for this area
-                area_key = f"{module}_{area['area']}"
-                if area_key in self.context.gathered_info:
+            unasked = False
+            for tpl in self._question_templates.get(module, ()):
+                # Skip questions already asked, and areas we already have info for
+                if tpl.id in self._asked_ids:
+                    continue
+                unasked = True
+                if tpl.area_key in self.context.gathered_info:
                     continue
 
-                for i, q_text in enumerate(area["questions"]):
-                    q_id = f"{module}_{area['area']}_{i:02d}"
-
-                    # Skip if already asked
-                    if any(aq.id == q_id for aq in self.asked_questions):
-                        continue
-
-                    questions.append(DynamicQuestion(
-                        id=q_id,
-                        text=q_text,
-                        context=area["context"],
-                        module_source=module,
-                        config_target=", ".join(area["config_fields"]),
-                        priority=7 - i  # First questions in area are higher priority
-                    ))
+                questions.append(DynamicQuestion(
+                    id=tpl.id,
+                    text=tpl.text,
+                    context=tpl.context,
+                    module_source=module,
+                    config_target=tpl.config_target,
+                    priority=tpl.priority,
+                    depends_on=list(tpl.depends_on),
+                ))
+            if not unasked:
+                self._exhausted_modules.add(module)
 
         return questions
 
-    def _use_llm_to_generate_followup(self, response: str, current_question: DynamicQuestion) -> Optional[DynamicQuestion]:
-        """Use LLM to generate a contextual follow-up question."""
-        if not self.llm_manager:
-            return None
-
-        prompt = f"""You are an Odoo ERP consultant conducting a requirements interview.
+    def _followups_prompt(self, response: str, current_question: DynamicQuestion) -> str:
+        return f"""You are an Odoo ERP consultant conducting a requirements interview.
 
 The client just answered this question:
 Q: {current_question.text}
 A: {response}
 
-Based on their answer, determine if a follow-up question is needed to clarify:
+Based on their answer, determine if follow-up questions are needed to clarify:
 1. Specific Odoo configuration options
 2. Business rules that affect system setup
 3. Edge cases or exceptions
 
-If a follow-up is needed, generate ONE specific question.
-If the answer was complete, respond with "NO_FOLLOWUP".
-
-Your response should be ONLY the follow-up question text, nothing else.
-If no follow-up is needed, respond ONLY with "NO_FOLLOWUP"."""
+If follow-ups are needed, generate up to {MAX_FOLLOWUPS} specific questions, most important first.
+Format each question on a new line, prefixed with "Q: "
+If the answer was complete, respond ONLY with "NO_FOLLOWUP"."""
 
-        try:
-            result = self.llm_manager.complete(prompt, max_tokens=150)
-            followup_text = result.content.strip()
+    def _parse_followups(self, content: str, current_question: DynamicQuestion) -> list[DynamicQuestion]:
+        content = content.strip()
+        # Empty when generation stopped at the sentinel (see _use_llm_to_generate_followups)
+        if not content or content == "NO_FOLLOWUP":
+            return []
 
-            if followup_text == "NO_FOLLOWUP" or len(followup_text) < 10:
-                return None
+        texts = [line[3:].strip() for line in content.split("\n") if line.startswith("Q: ")]
+        if not texts:
+            texts = [content]  # A single unprefixed question
 
-            return DynamicQuestion(
-                id=f"followup_{current_question.id}_{len(self.asked_questions)}",
-                text=followup_text,
+        return [
+            DynamicQuestion(
+                id=f"followup_{next(self._followup_ids)}",
+                text=text,
                 context=f"Follow-up to: {current_question.text[:50]}...",
                 module_source=current_question.module_source,
                 config_target=current_question.config_target,
                 priority=current_question.priority + 1  # Slightly higher priority
             )
-        except Exception as e:
-            print(f"LLM follow-up generation failed: {e}")
-            return None
+            for text in texts[:MAX_FOLLOWUPS]
+            if len(text) >= 10
+        ]
 
-    def _use_llm_to_refine_questions(self, gathered_context: str) -> list[DynamicQuestion]:
-        """Use LLM to identify gaps and generate additional questions."""
+    def _use_llm_to_generate_followups(self, response: str, current_question: DynamicQuestion) -> list[DynamicQuestion]:
+        """
+        Use LLM to generate contextual follow-up questions, all in one call.
+
+        Asking for the whole batch at once sends the prompt once, instead of
+        once per follow-up; answers to these follow-ups then need no LLM call.
+        """
         if not self.llm_manager:
             return []
 
+        try:
+            # The provider stops decoding at the sentinel instead of running on
+            # with an explanation nobody reads
+            result = self.llm_manager.complete(
+                self._followups_prompt(response, current_question),
+                max_tokens=TOKENS_PER_QUESTION * MAX_FOLLOWUPS,
+                stop=["NO_FOLLOWUP"],
+            )
+            return self._parse_followups(result.content, current_question)
+        except Exception as e:
+            print(f"LLM follow-up generation failed: {e}")
+            return []
+
+    def _refine_prompt(self, gathered_context: str, detected_modules: Optional[list[str]] = None) -> str:
         # Get list of modules we've identified
-        detected_modules = list(set(self.context.current_focus_modules))
+        if detected_modules is None:
+            detected_modules = list(set(self.context.current_focus_modules))
 
-        prompt = f"""You are an Odoo ERP implementation consultant. Based on the interview so far:
+        return f"""You are an Odoo ERP implementation consultant. Based on the interview so far:
 
 Client: {self.context.client_name}
 Industry: {self.context.industry}
@@ -624,40 +540,82 @@ Information gathered:
 What critical configuration information is still missing for setting up these Odoo modules?
 Focus on practical setup needs, not general business questions.
 
-Generate 1-3 specific questions that would help configure Odoo correctly.
+Generate 1-{MAX_REFINED_QUESTIONS} specific questions that would help configure Odoo correctly.
 Format each question on a new line, prefixed with "Q: "
 
 Only output questions, no explanations."""
 
+    def _parse_refined(self, content: str) -> list[DynamicQuestion]:
+        questions = []
+        for i, line in enumerate(content.strip().split("\n")):
+            if line.startswith("Q: "):
+                q_text = line[3:].strip()
+                if len(q_text) > 10:
+                    questions.append(DynamicQuestion(
+                        id=f"llm_refined_{len(self.asked_questions)}_{i}",
+                        text=q_text,
+                        context="LLM-identified gap in configuration requirements",
+                        module_source="llm_analysis",
+                        config_target="configuration_gap",
+                        priority=6
+                    ))
+        return questions
+
+    def _use_llm_to_refine_questions(
+        self,
+        gathered_context: str,
+        detected_modules: Optional[list[str]] = None,
+    ) -> list[DynamicQuestion]:
+        """Use LLM to identify gaps and generate additional questions."""
+        if not self.llm_manager:
+            return []
+
         try:
-            result = self.llm_manager.complete(prompt, max_tokens=300)
-            lines = result.content.strip().split("\n")
-
-            questions = []
-            for i, line in enumerate(lines):
-                if line.startswith("Q: "):
-                    q_text = line[3:].strip()
-                    if len(q_text) > 10:
-                        questions.append(DynamicQuestion(
-                            id=f"llm_refined_{len(self.asked_questions)}_{i}",
-                            text=q_text,
-                            context="LLM-identified gap in configuration requirements",
-                            module_source="llm_analysis",
-                            config_target="configuration_gap",
-                            priority=6
-                        ))
-
-            return questions
+            result = self.llm_manager.complete(
+                self._refine_prompt(gathered_context, detected_modules),
+                max_tokens=TOKENS_PER_QUESTION * MAX_REFINED_QUESTIONS,
+            )
+            return self._parse_refined(result.content)
         except Exception as e:
             print(f"LLM refinement failed: {e}")
             return []
 
+    def _batch_llm_tasks(self, prompts: list[str], max_tokens: int) -> Optional[list[str]]:
+        """
+        Answer several independent prompts with a single LLM call.
+
+        The tasks are numbered in one prompt and the model replies with a JSON
+        array holding one answer string per task. Returns None if the call
+        fails or the reply is not such an array; callers then fall back to
+        one call per prompt.
+        """
+        tasks = "\n\n".join(
+            f"=== TASK {i} ===\n{prompt}" for i, prompt in enumerate(prompts, start=1)
+        )
+        prompt = (
+            f"Complete each of the {len(prompts)} tasks below independently.\n"
+            f"Respond ONLY with a JSON array of {len(prompts)} strings; string i is "
+            f"your complete answer to TASK i, in exactly the format that task asks for.\n\n"
+            f"{tasks}"
+        )
+        try:
+            result = self.llm_manager.complete(prompt, max_tokens=max_tokens)
+            content = result.content.strip()
+            answers = json.loads(content[content.index("["):content.rindex("]") + 1])
+        except Exception as e:
+            print(f"Batched LLM call failed: {e}")
+            return None
+        if len(answers) != len(prompts) or not all(isinstance(a, str) for a in answers):
+            return None
+        return answers
+
     def process_response(self, response: str, question: DynamicQuestion) -> dict:
         """Process a response and update the interview context."""
         # Record the response
         question.response = response
         question.asked = True
         self.asked_questions.append(question)
+        self._asked_ids.add(question.id)
 
         # Detect signals
         new_signals = self._detect_signals(response)
@@ -665,24 +623,12 @@ Only output questions, no explanations."""
             self.context.detected_signals[signal] = self.context.detected_signals.get(signal, 0) + count
 
         # Map signals to modules
-        signal_to_module = {
-            "sales": ["sale_management", "crm"],
-            "crm": ["crm"],
-            "ecommerce": ["sale_management", "website_sale"],
-            "inventory": ["stock"],
-            "purchase": ["purchase"],
-            "accounting": ["account"],
-            "manufacturing": ["mrp"],
-            "hr": ["hr"],
-            "project": ["project"],
-            "support": ["helpdesk"],
-        }
-
         for signal in new_signals:
-            if signal in signal_to_module:
-                for module in signal_to_module[signal]:
-                    if module not in self.context.current_focus_modules:
-                        self.context.current_focus_modules.append(module)
+            for module in SIGNAL_TO_MODULE.get(signal, ()):
+                if module not in self._focus_modules:
+                    self._focus_modules.add(module)
+                    self.context.current_focus_modules.append(module)
+                    self._modules_version += 1
 
         # Store response
         self.context.responses.append({
@@ -691,48 +637,181 @@ Only output questions, no explanations."""
             "response": response,
             "module": question.module_source,
             "config_target": question.config_target,
-            "timestamp": datetime.now().isoformat(),
+            "t_offset_ns": time.monotonic_ns() - self._t0_mono_ns,
             "signals_detected": new_signals
         })
 
+        self._journal_response(question, response, new_signals)
+
         # Generate module-specific questions for newly detected modules
         new_module_questions = self._generate_module_questions(self.context.current_focus_modules)
+        queued_ids = {eq.id for _, _, eq in self._queue}
         for q in new_module_questions:
-            if not any(eq.id == q.id for eq in self.question_queue):
-                self.question_queue.append(q)
-
-        # Try to generate LLM follow-up
-        followup = self._use_llm_to_generate_followup(response, question)
-        if followup:
-            # Insert at front of queue for immediate asking
-            self.question_queue.insert(0, followup)
+            if q.id not in queued_ids:
+                queued_ids.add(q.id)
+                self._enqueue([q])
+
+        # Try to generate LLM follow-ups. A follow-up's own answer gets none:
+        # its batch was generated together and is already queued
+        wants_followups = bool(self.llm_manager) and not question.id.startswith("followup_")
+        if wants_followups and not new_signals and len(response.split()) < SHORT_ANSWER_MIN_WORDS:
+            self.followups_skipped += 1
+            wants_followups = False
+        # Refinement get_next_question is about to need (unless already prefetched)
+        needs_refinement = (not self._prefetch_usable() and bool(self.llm_manager)
+                            and len(self._queue) < 3 and len(self.asked_questions) > 2)
+        followups = []
+
+        if self.batch_llm_calls and wants_followups and needs_refinement:
+            # One request for both tasks, to save rate-limited calls
+            modules = list(set(self.context.current_focus_modules))
+            answers = self._batch_llm_tasks([
+                self._followups_prompt(response, question),
+                self._refine_prompt(self._gathered_context(), modules),
+            ], max_tokens=TOKENS_PER_QUESTION * (MAX_FOLLOWUPS + MAX_REFINED_QUESTIONS) + 50)  # + JSON framing
+            if answers is not None:
+                followups = self._parse_followups(answers[0], question)
+                refined: Future = Future()
+                refined.set_result(self._parse_refined(answers[1]))
+                self._set_prefetch(refined)
+                wants_followups = needs_refinement = False
+
+        if needs_refinement:
+            # Runs alongside the follow-up request below instead of after it
+            future = _LLM_POOL.submit(
+                self._use_llm_to_refine_questions,
+                self._gathered_context(),
+                list(set(self.context.current_focus_modules)),
+            )
+            self._set_prefetch(future)
 
-        # Sort queue by priority
-        self.question_queue.sort(key=lambda q: -q.priority)
+        if wants_followups:
+            followups = self._use_llm_to_generate_followups(response, question)
+        # Ahead of their priority peers for immediate asking, in the LLM's order
+        self._enqueue(followups, front=True)
 
         return {
             "signals_detected": new_signals,
             "modules_identified": self.context.current_focus_modules,
-            "questions_in_queue": len(self.question_queue),
-            "followup_generated": followup is not None
+            "questions_in_queue": len(self._queue),
+            "followup_generated": bool(followups)
+        }
+
+    def _response_time(self, record: dict) -> str:
+        """ISO wall-clock time of a context.responses record."""
+        return (self._t0_wall + timedelta(microseconds=record["t_offset_ns"] // 1000)).isoformat()
+
+    def _exported_response(self, record: dict) -> dict:
+        """A context.responses record with its offset turned into an ISO "timestamp"."""
+        return {
+            ("timestamp" if k == "t_offset_ns" else k): (self._response_time(record) if k == "t_offset_ns" else v)
+            for k, v in record.items()
         }
 
+    def _journal_response(self, question: DynamicQuestion, response: str, signals: dict):
+        """Append one answer to the journal file (opened on the first answer)."""
+        record = {
+            "question_id": question.id,
+            "q": question.text,
+            "a": response,
+            "signals": signals,
+            "ts": time.time(),
+        }
+        if orjson is not None:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = (json.dumps(record) + "\n").encode()
+        if self._journal_fd is None:
+            self._journal_fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(self._journal_fd, line)
+
+    def _gathered_context(self) -> str:
+        """The last few answers, as context for LLM question refinement."""
+        return "\n".join([
+            f"Q: {r['question']}\nA: {r['response']}"
+            for r in self.context.responses[-5:]
+        ])
+
+    def prefetch_questions(self, executor: Executor) -> None:
+        """
+        Start LLM question refinement in the background while the client answers.
+
+        Call this after showing a question. If the queue is about to run low, the
+        refinement get_next_question would do next is started now on `executor`,
+        from the answers given so far; get_next_question then uses its result
+        instead of waiting on the LLM.
+        """
+        if not self.llm_manager or self._prefetch_usable():
+            return  # An unused refinement still pending is kept instead
+        # Same test as get_next_question, once the pending answer is recorded
+        if len(self._queue) < 3 and len(self.asked_questions) + 1 > 2:
+            future = executor.submit(
+                self._use_llm_to_refine_questions,
+                self._gathered_context(),
+                list(set(self.context.current_focus_modules)),
+            )
+            self._set_prefetch(future)
+
+    def _set_prefetch(self, future: Future):
+        """Record a refinement started now, replacing (and cancelling) an older one."""
+        if self._prefetched is not None:
+            self._prefetched[1].cancel()
+        self._prefetched = (len(self.context.responses), future)
+
+    def _prefetch_usable(self) -> bool:
+        """Whether a prefetched refinement is pending and recent enough to use."""
+        return (self._prefetched is not None
+                and len(self.context.responses) - self._prefetched[0] <= PREFETCH_MAX_MISSED_ANSWERS)
+
     def get_next_question(self) -> Optional[DynamicQuestion]:
         """Get the next question to ask."""
-        # If queue is running low, try to generate more with LLM
-        if len(self.question_queue) < 3 and len(self.asked_questions) > 2:
-            gathered = "\n".join([
-                f"Q: {r['question']}\nA: {r['response']}"
-                for r in self.context.responses[-5:]
-            ])
-            refined_questions = self._use_llm_to_refine_questions(gathered)
-            self.question_queue.extend(refined_questions)
-            self.question_queue.sort(key=lambda q: -q.priority)
-
-        if not self.question_queue:
+        # If queue is running low, try to generate more with LLM. Otherwise a
+        # prefetched refinement is kept for when it does (e.g. after follow-ups)
+        if len(self._queue) < 3 and len(self.asked_questions) > 2:
+            usable = self._prefetch_usable()
+            prefetched, self._prefetched = self._prefetched, None
+            if usable:
+                refined_questions = prefetched[1].result()
+            else:
+                if prefetched is not None:
+                    prefetched[1].cancel()  # Stale; stop it if it has not started
+                refined_questions = self._use_llm_to_refine_questions(self._gathered_context())
+            self._enqueue(refined_questions)
+
+        if not self._queue:
             return None
 
-        return self.question_queue.pop(0)
+        entry = heapq.heappop(self._queue)
+        if entry[2].depends_on:
+            entry = self._pop_ready(entry)
+        return entry[2]
+
+    def _pop_ready(self, entry: tuple[int, int, DynamicQuestion]) -> tuple[int, int, DynamicQuestion]:
+        """
+        From entry (just popped) onwards in priority order, pop the first
+        question with no dependency still queued; the ones passed over go back.
+        If every remaining question waits on another (a cycle), priority wins.
+        """
+        pending = {q.id for _, _, q in self._queue}
+        pending.add(entry[2].id)
+        blocked = []
+        while not pending.isdisjoint(entry[2].depends_on):
+            blocked.append(entry)
+            if not self._queue:
+                entry = blocked.pop(0)
+                break
+            entry = heapq.heappop(self._queue)
+        for b in blocked:
+            heapq.heappush(self._queue, b)
+        return entry
+
+    def modules_text(self) -> str:
+        """Comma-separated recommended modules, rebuilt only after they change."""
+        version, text = self._modules_text
+        if version != self._modules_version:
+            text = ", ".join(self.context.current_focus_modules)
+            self._modules_text = (self._modules_version, text)
+        return text
 
     def get_interview_summary(self) -> dict:
         """Get a summary of the interview for the next agent."""
@@ -747,39 +826,59 @@ Only output questions, no explanations."""
                 for r in self.context.responses
                 if r.get("config_target")
             },
-            "responses": self.context.responses
+            "responses": [self._exported_response(r) for r in self.context.responses]
         }
 
-    def save_interview(self) -> str:
-        """Save the interview results."""
+    def save_interview(self, compress: bool = False) -> str:
+        """
+        Save the interview results; saving again overwrites the same file.
+
+        With compress=True the summary is written as zstd-compressed JSON
+        (.json.zst), which needs the zstandard package.
+        """
+        if compress and zstandard is None:
+            raise ImportError("Compressed saves need zstandard: pip install zstandard")
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        filepath = self.output_dir / f"adaptive-interview-{timestamp}.json"
+        filepath = self.summary_path
+        asked = {(aq.id, aq.module_source) for aq in self.asked_questions}
+        defaults = load_module_config_knowledge(DEFAULT_FALLBACK_PATH)
 
         output = {
             "project_id": f"odoo-impl-{timestamp}",
             **self.get_interview_summary(),
             "raw_responses": {
-                q.module_source: [
+                source: [
                     {
                         "question_id": r["question_id"],
                         "question": r["question"],
                         "response": r["response"],
-                        "timestamp": r["timestamp"]
+                        "timestamp": self._response_time(r)
                     }
                     for r in self.context.responses
-                    if any(aq.id == r["question_id"] and aq.module_source == q.module_source
-                           for aq in self.asked_questions)
+                    if (r["question_id"], source) in asked
                 ]
-                for q in self.asked_questions
+                for source in dict.fromkeys(q.module_source for q in self.asked_questions)
             },
             "module_config_requirements": {
-                module: MODULE_CONFIG_KNOWLEDGE.get(module, {})
+                module: defaults.get(module, {})
                 for module in self.context.current_focus_modules
             }
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        # Indented unless compressed; orjson when installed
+        if orjson is not None:
+            data = orjson.dumps(output, default=str, option=0 if compress else orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(output, default=str, indent=None if compress else 2).encode()
+        if compress:
+            filepath = filepath.with_suffix(".json.zst")
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        filepath.write_bytes(data)
+
+        # The summary now holds every answer; the journal is complete
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
+            self._journal_fd = None
 
         return str(filepath)
 
@@ -829,7 +928,7 @@ def run_adaptive_interview(client_name: str, industry: str):
     print("Interview Summary")
     print(f"{'='*60}")
     print(f"Questions asked: {summary['questions_asked']}")
-    print(f"Recommended modules: {', '.join(summary['recommended_modules']) or 'None detected'}")
+    print(f"Recommended modules: {agent.modules_text() or 'None detected'}")
     print(f"Saved to: {filepath}")
 
     return agent
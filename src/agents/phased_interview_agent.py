@@ -21,6 +21,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 
@@ -28,8 +29,14 @@ from ..llm.manager import LLMManager, LLMManagerConfig
 from ..signals import detect_signals as shared_detect_signals, SIGNAL_TO_INTERVIEW_DOMAIN, DOMAIN_TO_MODULES
 
 
+@lru_cache(maxsize=1)
 def get_phased_llm_manager() -> LLMManager:
-    """Get LLM manager for phased interview (free/open-source only)."""
+    """
+    Get LLM manager for phased interview (free/open-source only).
+
+    Built once and shared by every agent: setting it up probes Groq and Ollama
+    (and may try to start Ollama), which is too slow to repeat per session.
+    """
     config = LLMManagerConfig(
         provider_priority=["groq", "ollama"],
         default_models={
@@ -119,27 +126,25 @@ class InterviewState:
     def get_progress(self) -> dict:
         """Get progress info for UI."""
         if self.phase == InterviewPhase.SCOPING:
-            total_scoping = len(SCOPING_QUESTIONS)
             return {
                 "phase": "Scoping",
                 "phase_progress": self.scoping_index,
-                "phase_total": total_scoping,
-                "overall_percent": int((self.scoping_index / total_scoping) * 30),  # Scoping = 30%
+                "phase_total": _SCOPING_TOTAL,
+                "overall_percent": (self.scoping_index * 30) // _SCOPING_TOTAL,  # Scoping = 30%
                 "domains_pending": [],
                 "domains_completed": [],
                 "current_domain": None
             }
         elif self.phase == InterviewPhase.DOMAIN_EXPERT:
-            domain_progress = len(self.completed_domains)
-            domain_total = len(self.active_domains)
+            completed = set(self.completed_domains)
             base_percent = 30  # After scoping
-            domain_percent = int((domain_progress / max(domain_total, 1)) * 60)  # Domains = 60%
+            domain_percent = (len(completed) * 60) // max(len(self.active_domains), 1)  # Domains = 60%
             return {
                 "phase": f"Expert: {self.current_domain.title() if self.current_domain else 'Unknown'}",
                 "phase_progress": self.current_domain_index,
-                "phase_total": len(DOMAIN_EXPERT_QUESTIONS.get(self.current_domain, [])),
+                "phase_total": _DOMAIN_QUESTION_COUNTS.get(self.current_domain, 0),
                 "overall_percent": base_percent + domain_percent,
-                "domains_pending": [d for d in self.active_domains if d not in self.completed_domains],
+                "domains_pending": [d for d in self.active_domains if d not in completed],
                 "domains_completed": self.completed_domains,
                 "current_domain": self.current_domain
             }
@@ -207,6 +212,8 @@ SCOPING_QUESTIONS = [
     ),
 ]
 
+_SCOPING_TOTAL = len(SCOPING_QUESTIONS)
+
 # Vague response indicators - triggers follow-up
 _VAGUE_INDICATORS = {"maybe", "i think", "not sure", "depends", "sometimes", "i guess", "possibly", "probably", "sort of"}
 _MIN_USEFUL_LENGTH = 15  # Responses shorter than this trigger follow-up
@@ -506,6 +513,24 @@ DOMAIN_EXPERT_QUESTIONS = {
 }
 
 
+# Question counts per domain, read on every progress update
+_DOMAIN_QUESTION_COUNTS = {domain: len(qs) for domain, qs in DOMAIN_EXPERT_QUESTIONS.items()}
+
+
+def _load_industry_defaults() -> dict[str, list[str]]:
+    """Load the industry -> default domains table once at import."""
+    path = Path(__file__).parent.parent / "knowledge" / "industry_defaults.json"
+    try:
+        data = json.loads(path.read_text())
+    except Exception as e:
+        print(f"Warning: Could not load industry defaults from {path}: {e}")
+        return {}
+    return {k: v for k, v in data.items() if not k.startswith("_")}
+
+
+INDUSTRY_DEFAULT_DOMAINS = _load_industry_defaults()
+
+
 # Signal detection now uses shared module (src/signals.py)
 # Kept here as a reference for domain expert mapping
 _INTERVIEW_DOMAINS = ["sales", "inventory", "finance", "purchase", "manufacturing", "hr", "project", "ecommerce"]
@@ -692,8 +717,11 @@ class PhasedInterviewAgent:
                 self.state.detected_signals[signal] = self.state.detected_signals.get(signal, 0) + count
                 detected_domains.add(signal)
 
-        # Set active domains (at minimum: sales, finance)
-        self.state.active_domains = list(detected_domains) if detected_domains else ["sales"]
+        # Set active domains; with no signals, fall back to the industry's usual domains
+        if detected_domains:
+            self.state.active_domains = list(detected_domains)
+        else:
+            self.state.active_domains = list(INDUSTRY_DEFAULT_DOMAINS.get(self.state.industry, ["sales"]))
 
         # Always include finance/accounting
         if "finance" not in self.state.active_domains:
@@ -781,13 +809,16 @@ class PhasedInterviewAgent:
                     if signal not in self.state.completed_domains:
                         self.state.active_domains.append(signal)
 
+        # Progress is unchanged by follow-up bookkeeping, so compute it once
+        progress = self.state.get_progress()
+
         # Check if response is vague/short and generate follow-up
-        follow_up = self._maybe_follow_up(response_text, question_info)
+        follow_up = self._maybe_follow_up(response_text, question_info, progress)
 
         result = {
             "signals_detected": signals,
             "phase": self.state.phase.value,
-            "progress": self.state.get_progress(),
+            "progress": progress,
             "domains_active": self.state.active_domains,
             "recommended_modules": self.state.recommended_modules,
         }
@@ -814,7 +845,9 @@ class PhasedInterviewAgent:
             if any(kw in text_lower for kw in keywords):
                 self._mentioned_topics[topic] = response_text[:100]
 
-    def _maybe_follow_up(self, response_text: str, question_info: dict) -> Optional[dict]:
+    def _maybe_follow_up(
+        self, response_text: str, question_info: dict, progress: Optional[dict] = None
+    ) -> Optional[dict]:
         """Generate a follow-up question if the response is vague or too short."""
         question_id = question_info.get("id", "unknown")
         # Use the base question ID (before any _followup_ suffix) for counting
@@ -853,7 +886,7 @@ class PhasedInterviewAgent:
                 "domain": question_info.get("domain"),
                 "context": f"Follow-up to: {question_info.get('text', '')[:60]}",
                 "is_follow_up": True,
-                "progress": self.state.get_progress()
+                "progress": progress if progress is not None else self.state.get_progress()
             }
             return self._pending_follow_up
 
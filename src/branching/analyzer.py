@@ -110,6 +110,11 @@ class ResponseAnalyzer:
         "airtable": "spreadsheet", "notion": "general"
     }
 
+    # A complete answer at least this long that hits this many domain keywords
+    # already covers the question; follow-ups would only re-ask it
+    THOROUGH_MIN_WORDS = 40
+    THOROUGH_MIN_KEYWORDS = 3
+
     # Pain point indicators
     PAIN_POINT_PATTERNS = [
         r"(?:it'?s?\s+)?(?:a\s+)?(?:real\s+)?(?:pain|nightmare|mess|disaster|problem)",
@@ -191,8 +196,11 @@ class ResponseAnalyzer:
             response_lower, domain, detected_keywords
         )
 
-        # If LLM is enabled, enhance analysis
-        if self.use_llm and self.llm_manager:
+        # If LLM is enabled, enhance analysis. Its suggested follow-ups are only
+        # used for vague or partial answers, so the call is skipped otherwise
+        if self.use_llm and self.llm_manager and quality in (
+            ResponseQuality.VAGUE, ResponseQuality.PARTIAL
+        ):
             return self._enhance_with_llm(
                 ResponseAnalysis(
                     quality=quality,
@@ -222,6 +230,14 @@ class ResponseAnalyzer:
             skip_future_questions=skip_questions
         )
 
+    def is_thorough(self, analysis: ResponseAnalysis) -> bool:
+        """Check if a response is detailed enough to move on without follow-ups."""
+        return (
+            analysis.quality == ResponseQuality.COMPLETE
+            and analysis.word_count >= self.THOROUGH_MIN_WORDS
+            and len(analysis.detected_keywords) >= self.THOROUGH_MIN_KEYWORDS
+        )
+
     def _is_skip_signal(self, response: str) -> bool:
         """Check if response indicates user wants to skip."""
         for pattern in self.SKIP_SIGNALS:
@@ -288,7 +288,25 @@ class BranchingEngine:
                 reason="User requested to skip"
             )
 
-        # Priority 3: Process high-priority triggers
+        # Priority 3: A thorough answer moves straight on. Its triggers still
+        # flag for review and skip questions, but ask nothing further
+        if self.analyzer.is_thorough(analysis):
+            for trigger, matched_text in triggered_actions:
+                if trigger.action == TriggerAction.FLAG_FOR_REVIEW:
+                    self.state.add_flag(
+                        flag=trigger.description or trigger.follow_up_question,
+                        domain=domain,
+                        context=matched_text
+                    )
+                elif trigger.action == TriggerAction.SKIP_QUESTIONS:
+                    for q_id in trigger.target_questions:
+                        self.state.skip_questions.add(q_id)
+            return NextAction(
+                action_type=ActionType.NEXT_QUESTION,
+                reason="Thorough response, moving to next question"
+            )
+
+        # Priority 4: Process high-priority triggers
         for trigger, matched_text in triggered_actions:
             if trigger.priority <= 2:  # High priority triggers
 
@@ -324,7 +342,7 @@ class BranchingEngine:
                         skip_question_ids=trigger.target_questions
                     )
 
-        # Priority 4: Handle response quality issues
+        # Priority 5: Handle response quality issues
         if analysis.quality == ResponseQuality.VAGUE:
             if analysis.suggested_follow_ups:
                 return NextAction(
@@ -350,7 +368,7 @@ class BranchingEngine:
                     reason="Response was incomplete"
                 )
 
-        # Priority 5: Process lower-priority triggers
+        # Priority 6: Process lower-priority triggers
         for trigger, matched_text in triggered_actions:
             if trigger.priority > 2:
 
@@ -369,7 +387,7 @@ class BranchingEngine:
                         reason=f"Probe deeper: '{matched_text}'"
                     )
 
-        # Priority 6: Check if we have pending follow-ups now
+        # Priority 7: Check if we have pending follow-ups now
         if self.state.has_follow_ups():
             follow_up = self.state.pop_follow_up()
             return NextAction(
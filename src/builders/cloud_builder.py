@@ -6,15 +6,14 @@ Supports free-tier cloud options for users without Docker installed.
 """
 
 import asyncio
-import json
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
 from typing import Optional, Callable
-import urllib.request
-import urllib.parse
+
+from .odoo_builder import LOG_BUFFER_SIZE, log_tail
 
 
 class CloudProvider(Enum):
@@ -48,7 +47,13 @@ class CloudTask:
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
-    logs: list[str] = field(default_factory=list)
+    logs: deque = field(default_factory=lambda: deque(maxlen=LOG_BUFFER_SIZE))
+    log_count: int = 0  # Total lines ever logged, so clients can tell which are new
+
+    def add_log(self, line: str):
+        """Append a log line, evicting the oldest once the buffer is full."""
+        self.logs.append(line)
+        self.log_count += 1
 
     def to_dict(self) -> dict:
         return {
@@ -62,7 +67,8 @@ class CloudTask:
             "started_at": self.started_at,
             "completed_at": self.completed_at,
             "error_message": self.error_message,
-            "logs": self.logs[-10:],
+            "logs": log_tail(self.logs),
+            "log_count": self.log_count,
         }
 
 
@@ -176,7 +182,7 @@ class CloudOdooBuilder:
     def _log(self, task: CloudTask, message: str):
         """Add log message to task."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        task.logs.append(f"[{timestamp}] {message}")
+        task.add_log(f"[{timestamp}] {message}")
         print(f"[{task.name}] {message}")
         self._notify_progress()
 
@@ -499,6 +505,11 @@ class CloudOdooBuilder:
         """Get complete setup instructions as a dictionary."""
         return self._generate_setup_instructions()
 
+    def stop(self):
+        """Mark the deployment as stopped; nothing runs locally to clean up."""
+        self.state.status = CloudTaskStatus.FAILED
+        self.state.completed_at = datetime.now().isoformat()
+
     def get_state(self) -> CloudBuildState:
         """Get current build state."""
         return self.state
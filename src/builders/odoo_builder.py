@@ -16,6 +16,7 @@ import re
 import subprocess
 import time
 import unicodedata
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -45,6 +46,15 @@ class TaskType(Enum):
     FINAL_CONFIG = "final_config"
 
 
+LOG_BUFFER_SIZE = 500  # Log lines kept per task; older lines are dropped
+LOG_SNAPSHOT_SIZE = 50  # Log lines included in each progress snapshot (covers a batch of saves)
+
+
+def log_tail(logs: deque) -> list[str]:
+    """The last LOG_SNAPSHOT_SIZE lines, indexed from the right so the buffer isn't copied."""
+    return [logs[i] for i in range(-min(LOG_SNAPSHOT_SIZE, len(logs)), 0)]
+
+
 @dataclass
 class BuildTask:
     """A single build task."""
@@ -57,13 +67,18 @@ class BuildTask:
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
-    logs: list[str] = field(default_factory=list)
+    logs: deque = field(default_factory=lambda: deque(maxlen=LOG_BUFFER_SIZE))
+    log_count: int = 0  # Total lines ever logged, so clients can tell which are new
 
     # For module tasks
     module_name: Optional[str] = None
 
+    def add_log(self, line: str):
+        """Append a log line, evicting the oldest once the buffer is full."""
+        self.logs.append(line)
+        self.log_count += 1
+
     def to_dict(self) -> dict:
-        ct = self.get_current_task()
         return {
             "task_id": self.task_id,
             "task_type": self.task_type.value,
@@ -74,7 +89,8 @@ class BuildTask:
             "started_at": self.started_at,
             "completed_at": self.completed_at,
             "error_message": self.error_message,
-            "logs": self.logs[-10:],  # Last 10 log entries
+            "logs": log_tail(self.logs),
+            "log_count": self.log_count,
             "module_name": self.module_name,
         }
 
@@ -175,7 +191,7 @@ class OdooBuilder:
     def _log(self, task: BuildTask, message: str):
         """Add log message to task."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        task.logs.append(f"[{timestamp}] {message}")
+        task.add_log(f"[{timestamp}] {message}")
         print(f"[{task.name}] {message}")
         self._notify_progress()
 
@@ -299,26 +315,40 @@ list_db = True
 """
 
     async def _run_command(self, cmd: list[str], task: BuildTask, cwd: Optional[Path] = None) -> tuple[bool, str]:
-        """Run a shell command and return success status and output."""
+        """
+        Run a command without blocking the event loop and return success status and output.
+
+        The child process is killed if the command times out or the build task is cancelled.
+        """
+        proc = None
         try:
             self._log(task, f"Running: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=cwd or self.work_dir,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            if result.returncode != 0:
-                self._log(task, f"Error: {result.stderr}")
-                return False, result.stderr
-            return True, result.stdout
-        except subprocess.TimeoutExpired:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)  # 5 minute timeout
+            if proc.returncode != 0:
+                error = stderr.decode(errors="replace")
+                self._log(task, f"Error: {error}")
+                return False, error
+            return True, stdout.decode(errors="replace")
+        except asyncio.TimeoutError:
             self._log(task, "Command timed out")
             return False, "Command timed out"
         except Exception as e:
             self._log(task, f"Exception: {str(e)}")
             return False, str(e)
+        finally:
+            # Reached with the process still running only on timeout or cancellation
+            if proc is not None and proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
 
     async def _setup_docker(self, task: BuildTask) -> bool:
         """Set up Docker environment."""
@@ -407,15 +437,10 @@ list_db = True
             task.progress = int((i / max_retries) * 50)
             self._notify_progress()
 
-            try:
-                import urllib.request
-                req = urllib.request.Request(f"http://localhost:{self.state.odoo_port}/web/database/selector")
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    if response.status == 200:
-                        self._log(task, "Odoo is ready!")
-                        break
-            except Exception:
-                pass
+            selector_url = f"http://localhost:{self.state.odoo_port}/web/database/selector"
+            if await asyncio.to_thread(self._url_responds, selector_url):
+                self._log(task, "Odoo is ready!")
+                break
 
             await asyncio.sleep(2)
         else:
@@ -505,6 +530,17 @@ list_db = True
         sanitized = re.sub(r"_+", "_", sanitized).strip("_")
         return sanitized or "user"
 
+    @staticmethod
+    def _url_responds(url: str, timeout: int = 5) -> bool:
+        """Return True if a GET on url answers 200. Blocking — call via asyncio.to_thread."""
+        import urllib.request
+        try:
+            req = urllib.request.Request(url)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.status == 200
+        except Exception:
+            return False
+
     def _connect_rpc(self, max_retries=10, retry_delay=3):
         """Create an authenticated XML-RPC connection with retry and caching."""
         if self._rpc is not None:
@@ -561,16 +597,16 @@ list_db = True
         self._notify_progress()
 
         try:
-            rpc = self._connect_rpc()
+            rpc = await asyncio.to_thread(self._connect_rpc)
             task.progress = 50
             self._notify_progress()
 
             self._log(task, f"Applying settings: {list(module_cfg.settings.keys())}")
-            config_id = rpc._execute("res.config.settings", "create", [module_cfg.settings])
+            config_id = await asyncio.to_thread(rpc._execute, "res.config.settings", "create", [module_cfg.settings])
             task.progress = 70
             self._notify_progress()
 
-            rpc._execute("res.config.settings", "set_values", [[config_id]])
+            await asyncio.to_thread(rpc._execute, "res.config.settings", "set_values", [[config_id]])
             task.progress = 100
             self._log(task, "Settings applied successfully")
         except Exception as e:
@@ -600,7 +636,7 @@ list_db = True
             return True
 
         try:
-            rpc = self._connect_rpc()
+            rpc = await asyncio.to_thread(self._connect_rpc)
             task.progress = 20
             self._notify_progress()
 
@@ -621,13 +657,13 @@ list_db = True
                         continue
                     module_part, name_part = parts
                     try:
-                        data_ids = rpc._execute(
-                            "ir.model.data", "search",
+                        data_ids = await asyncio.to_thread(
+                            rpc._execute, "ir.model.data", "search",
                             [[("module", "=", module_part), ("name", "=", name_part)]],
                         )
                         if data_ids:
-                            data_records = rpc._execute(
-                                "ir.model.data", "read", [data_ids], fields=["res_id"],
+                            data_records = await asyncio.to_thread(
+                                rpc._execute, "ir.model.data", "read", [data_ids], fields=["res_id"],
                             )
                             if data_records:
                                 rec = data_records[0] if isinstance(data_records, list) else data_records
@@ -649,7 +685,7 @@ list_db = True
                         }
                         if group_ids:
                             user_vals["groups_id"] = [(4, gid) for gid in group_ids]
-                        rpc._execute("res.users", "create", [user_vals])
+                        await asyncio.to_thread(rpc._execute, "res.users", "create", [user_vals])
                         self._log(task, f"    Created user: {login}")
                     except Exception as e:
                         if "already exists" in str(e).lower() or "unique" in str(e).lower():
@@ -678,7 +714,7 @@ list_db = True
         self._log(task, f"Industry: {self.spec.company.industry}")
 
         try:
-            rpc = self._connect_rpc()
+            rpc = await asyncio.to_thread(self._connect_rpc)
             task.progress = 30
             self._notify_progress()
 
@@ -687,13 +723,13 @@ list_db = True
             # Look up currency (include inactive — most are inactive by default)
             if self.spec.company.currency:
                 self._log(task, f"Setting currency: {self.spec.company.currency}")
-                currency_ids = rpc._execute(
-                    "res.currency", "search",
+                currency_ids = await asyncio.to_thread(
+                    rpc._execute, "res.currency", "search",
                     [[("name", "=", self.spec.company.currency)]],
                     context={"active_test": False},
                 )
                 if currency_ids:
-                    rpc._execute("res.currency", "write", [[currency_ids[0]], {"active": True}])
+                    await asyncio.to_thread(rpc._execute, "res.currency", "write", [[currency_ids[0]], {"active": True}])
                     company_vals["currency_id"] = currency_ids[0]
             task.progress = 50
             self._notify_progress()
@@ -701,8 +737,8 @@ list_db = True
             # Look up country
             if self.spec.company.country:
                 self._log(task, f"Setting country: {self.spec.company.country}")
-                country_ids = rpc._execute(
-                    "res.country", "search",
+                country_ids = await asyncio.to_thread(
+                    rpc._execute, "res.country", "search",
                     [[("code", "=", self.spec.company.country)]],
                 )
                 if country_ids:
@@ -711,13 +747,13 @@ list_db = True
             self._notify_progress()
 
             # Write company record (id=1 is the default company)
-            rpc._execute("res.company", "write", [[1], company_vals])
+            await asyncio.to_thread(rpc._execute, "res.company", "write", [[1], company_vals])
             self._log(task, "Company settings applied")
 
             # Set admin user timezone
             if self.spec.company.timezone:
                 self._log(task, f"Setting admin timezone: {self.spec.company.timezone}")
-                rpc._execute("res.users", "write", [[rpc.uid], {"tz": self.spec.company.timezone}])
+                await asyncio.to_thread(rpc._execute, "res.users", "write", [[rpc.uid], {"tz": self.spec.company.timezone}])
 
             task.progress = 100
             self._log(task, "Final configuration complete!")
@@ -276,7 +276,7 @@ class RailwayOdooBuilder:
 
     def _log(self, task: BuildTask, message: str):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        task.logs.append(f"[{timestamp}] {message}")
+        task.add_log(f"[{timestamp}] {message}")
         print(f"[{task.name}] {message}")
         self._notify_progress()
 
@@ -8,6 +8,7 @@ Supports multiple free LLM providers:
 """
 
 from .base import LLMProvider, LLMResponse, LLMConfig
+from .cache import ResponseCache
 from .groq_provider import GroqProvider
 from .ollama_provider import OllamaProvider
 from .manager import LLMManager
@@ -18,5 +19,6 @@ __all__ = [
     "LLMConfig",
     "GroqProvider",
     "OllamaProvider",
-    "LLMManager"
+    "LLMManager",
+    "ResponseCache"
 ]
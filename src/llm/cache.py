@@ -0,0 +1,103 @@
+"""
+On-disk cache for LLM responses.
+
+Repeated runs with the same answers (development, demos, tests against a live
+provider) send the same prompts again. The cache serves those from a local
+SQLite file instead of paying Groq/Ollama latency and rate-limit quota.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base import LLMResponse, Message
+
+DEFAULT_CACHE_DIR = "./.llm_cache"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class ResponseCache:
+    """
+    Persistent LLM response cache keyed by provider, model, prompt and parameters.
+
+    Usage:
+        manager = LLMManager(cache=ResponseCache())
+        manager.complete("...")  # Calls the provider
+        manager.complete("...")  # Served from disk
+
+    Safe to share between threads (e.g. question prefetching).
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            cache_dir: Directory holding the SQLite file (created if missing)
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.ttl_seconds = ttl_seconds
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path / "responses.sqlite3", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        messages: List[Message],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Stable hash of everything that determines the response."""
+        payload = json.dumps({
+            "provider": provider,
+            "model": model,
+            "messages": [[m.role, m.content] for m in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "params": params or {},
+        }, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response, or None if missing or expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return LLMResponse(**json.loads(row[0]))
+
+    def set(self, key: str, response: LLMResponse):
+        """Store a response (without the provider's raw payload)."""
+        data = {
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "usage": response.usage,
+            "finish_reason": response.finish_reason,
+        }
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time() + self.ttl_seconds)
+            )
+            self._db.commit()
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
@@ -152,6 +152,8 @@ class GroqProvider(LLMProvider):
             "temperature": temperature or self.config.temperature,
             "max_tokens": max_tokens or self.config.max_tokens
         }
+        if kwargs.get("stop"):
+            payload["stop"] = kwargs["stop"]
 
         response = requests.post(
             f"{self.config.base_url}/chat/completions",
@@ -190,7 +192,7 @@ class GroqProvider(LLMProvider):
             messages: List of conversation messages
             temperature: Override default temperature (0-2)
             max_tokens: Override default max tokens
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (e.g. stop: list of stop sequences)
 
         Returns:
             LLMResponse with the model's response
@@ -17,6 +17,7 @@ from .base import (
     ProviderStatus,
     PROVIDER_INFO
 )
+from .cache import ResponseCache
 from .groq_provider import GroqProvider, create_groq_provider
 from .ollama_provider import OllamaProvider, create_ollama_provider
 
@@ -66,10 +67,16 @@ class LLMManager:
     2. Automatically switch on rate limits
     3. Track usage across providers
     4. Prefer local (Ollama) when cloud is limited
+    5. Serve repeated requests from `cache`, if one is given
     """
 
-    def __init__(self, config: Optional[LLMManagerConfig] = None):
+    def __init__(
+        self,
+        config: Optional[LLMManagerConfig] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         self.config = config or LLMManagerConfig()
+        self.cache = cache
         self._providers: Dict[str, LLMProvider] = {}
         self._usage: Dict[str, ProviderUsage] = {}
         self._current_provider: Optional[str] = None
@@ -230,6 +237,20 @@ class LLMManager:
 
         llm = self._providers[target_provider]
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(
+                target_provider,
+                llm.model,
+                messages,
+                temperature if temperature is not None else llm.config.temperature,
+                max_tokens if max_tokens is not None else llm.config.max_tokens,
+                kwargs
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = llm.chat(
                 messages=messages,
@@ -240,6 +261,8 @@ class LLMManager:
             self._update_usage(target_provider, response)
             usage = self._usage.get(target_provider, ProviderUsage())
             usage.successes += 1
+            if cache_key is not None:
+                self.cache.set(cache_key, response)
             return response
 
         except Exception as e:
@@ -12,8 +12,11 @@ Pull a model: ollama pull mistral:7b
 """
 
 import os
+import socket
 import subprocess
+import time
 from typing import Optional, List, Dict, Any
+from urllib.parse import urlparse
 
 from .base import (
     LLMProvider,
@@ -24,6 +27,34 @@ from .base import (
 )
 
 
+# How long a server probe result is reused; every LLMManager probes on creation
+PROBE_TTL_SECONDS = 30.0
+
+_probe_results: Dict[str, tuple] = {}  # host -> (checked_at, reachable)
+
+
+def is_server_reachable(host: str, timeout: float = 0.2) -> bool:
+    """
+    Check whether anything accepts TCP connections at the Ollama host.
+
+    Much cheaper than the HTTP health check when Ollama is down, and cached
+    for PROBE_TTL_SECONDS so repeated provider setup doesn't probe again.
+    """
+    checked = _probe_results.get(host)
+    if checked and time.monotonic() - checked[0] < PROBE_TTL_SECONDS:
+        return checked[1]
+
+    url = urlparse(host)
+    try:
+        with socket.create_connection((url.hostname or "localhost", url.port or 11434), timeout=timeout):
+            reachable = True
+    except OSError:
+        reachable = False
+
+    _probe_results[host] = (time.monotonic(), reachable)
+    return reachable
+
+
 class OllamaProvider(LLMProvider):
     """
     Ollama LLM Provider for local model inference.
@@ -74,6 +105,9 @@ class OllamaProvider(LLMProvider):
 
     def _check_availability(self):
         """Check if Ollama is running and model is available."""
+        if not is_server_reachable(self.host):
+            self._status = ProviderStatus.NOT_CONFIGURED
+            return
         try:
             import requests
             response = requests.get(
@@ -144,7 +178,7 @@ class OllamaProvider(LLMProvider):
             messages: List of conversation messages
             temperature: Override default temperature
             max_tokens: Override default max tokens
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (e.g. stop: list of stop sequences)
 
         Returns:
             LLMResponse with the model's response
@@ -171,6 +205,8 @@ class OllamaProvider(LLMProvider):
                 "num_predict": max_tokens or self.config.max_tokens
             }
         }
+        if kwargs.get("stop"):
+            payload["options"]["stop"] = kwargs["stop"]
 
         try:
             response = requests.post(
@@ -263,8 +299,8 @@ class OllamaProvider(LLMProvider):
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            import time
             time.sleep(2)  # Wait for server to start
+            _probe_results.clear()  # The earlier "not running" result is stale
             return True
         except Exception:
             return False
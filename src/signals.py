@@ -195,19 +195,21 @@ FALSE_POSITIVE_CONTEXTS = {
 
 NEGATION_WINDOW = 8  # words before the match to scan for negation
 
+# Compiled once at import, so each indicator set is checked with one search
+# instead of a substring test per word
+_NEGATION_RE = re.compile("|".join(re.escape(w) for w in NEGATION_WORDS))
+_FUTURE_RE = re.compile("|".join(re.escape(w) for w in FUTURE_WORDS))
 
-# ── Core detection logic ─────────────────────────────────────────────────────
+# Union of every domain pattern. One search tells whether a text can contain
+# any signal at all; short answers ("no", "about 12") usually can't, and then
+# the per-pattern scan is skipped entirely
+_ANY_SIGNAL_RE = re.compile("|".join(
+    re.escape(p)
+    for p in sorted({p for ps in SIGNAL_PATTERNS.values() for p in ps}, key=len, reverse=True)
+))
 
-def _split_sentences(text: str) -> list[str]:
-    """Split text into sentences for per-sentence analysis."""
-    # Split on sentence-ending punctuation, keeping the delimiter
-    parts = re.split(r'(?<=[.!?])\s+', text)
-    # Also split on semicolons and newlines
-    sentences = []
-    for part in parts:
-        sentences.extend(re.split(r'[;\n]+', part))
-    return [s.strip() for s in sentences if s.strip()]
 
+# ── Core detection logic ─────────────────────────────────────────────────────
 
 _CLAUSE_BOUNDARIES = {"but", "however", "although", "though", "yet", "whereas", "while", "instead"}
 
@@ -220,7 +222,7 @@ def _check_negation(text_lower: str, match_start: int) -> bool:
     # Get the text before the match
     prefix = text_lower[:match_start]
     # Get the last N words
-    words_before = prefix.split()[-NEGATION_WINDOW:]
+    words_before = prefix.rsplit(None, NEGATION_WINDOW)[-NEGATION_WINDOW:]
 
     # Truncate at the last clause boundary (if any)
     for i in range(len(words_before) - 1, -1, -1):
@@ -230,10 +232,7 @@ def _check_negation(text_lower: str, match_start: int) -> bool:
 
     prefix_text = " ".join(words_before)
 
-    for neg in NEGATION_WORDS:
-        if neg in prefix_text:
-            return True
-    return False
+    return _NEGATION_RE.search(prefix_text) is not None
 
 
 def _check_future(text_lower: str, match_start: int) -> bool:
@@ -243,10 +242,7 @@ def _check_future(text_lower: str, match_start: int) -> bool:
     window_end = min(len(text_lower), match_start + 60)
     window = text_lower[window_start:window_end]
 
-    for fut in FUTURE_WORDS:
-        if fut in window:
-            return True
-    return False
+    return _FUTURE_RE.search(window) is not None
 
 
 def detect_signals(text: str) -> SignalResult:
@@ -261,7 +257,8 @@ def detect_signals(text: str) -> SignalResult:
     """
     result = SignalResult()
     text_lower = text.lower()
-    sentences = _split_sentences(text_lower)
+    if _ANY_SIGNAL_RE.search(text_lower) is None:
+        return result
 
     for domain, patterns in SIGNAL_PATTERNS.items():
         for pattern in patterns:
@@ -335,6 +332,9 @@ def detect_signals_multi(responses: list[str]) -> SignalResult:
         Aggregated SignalResult
     """
     combined = SignalResult()
+    # Patterns never contain a NUL, so no match can span two responses
+    if _ANY_SIGNAL_RE.search("\0".join(responses).lower()) is None:
+        return combined
 
     for response in responses:
         result = detect_signals(response)
@@ -7,6 +7,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Faster registry parsing when installed
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class ModuleDefinition:
@@ -31,7 +36,8 @@ class ModuleRegistry:
     @classmethod
     def from_json(cls, path: str | Path) -> "ModuleRegistry":
         path_obj = Path(path)
-        data = json.loads(path_obj.read_text())
+        raw = path_obj.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         modules: dict[str, ModuleDefinition] = {}
         for item in data:
             modules[item["technical_name"]] = ModuleDefinition(
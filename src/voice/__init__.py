@@ -13,10 +13,11 @@ Components:
 from .text_to_speech import TextToSpeech, ELEVENLABS_VOICES
 
 try:
-    from .speech_to_text import SpeechToText, transcribe_audio_file
+    from .speech_to_text import SpeechToText, StreamingTranscriber, transcribe_audio_file
     from .voice_agent import VoiceInterviewAgent
     __all__ = [
         "SpeechToText",
+        "StreamingTranscriber",
         "TextToSpeech",
         "ELEVENLABS_VOICES",
         "VoiceInterviewAgent",
@@ -3,13 +3,16 @@ Speech-to-Text using faster-whisper.
 
 Provides local, offline speech recognition with support for:
 - Microphone input (real-time)
+- Transcription while recording (StreamingTranscriber)
 - Audio file transcription
 - Multiple languages
 """
 
 import os
 import tempfile
+import threading
 import wave
+from collections import deque
 from pathlib import Path
 from typing import Optional, Callable
 from dataclasses import dataclass
@@ -17,6 +20,13 @@ from dataclasses import dataclass
 import numpy as np
 
 
+def as_float32(audio: np.ndarray) -> np.ndarray:
+    """Audio as Whisper takes it: float32, with int16 PCM scaled into [-1, 1]."""
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) / 32768
+    return audio.astype(np.float32, copy=False)
+
+
 @dataclass
 class TranscriptionResult:
     """Result from speech-to-text transcription."""
@@ -42,13 +52,18 @@ class SpeechToText:
     """
 
     AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large-v3"]
+    ENGLISH_ONLY_MODELS = {"tiny", "base", "small", "medium"}  # Have a smaller-vocab ".en" variant
+    CONTEXT_RESPONSES = 2  # Recent answers carried into the decoding prompt
+    PROMPT_MAX_WORDS = 150  # Keeps the prompt inside Whisper's ~224-token window
 
     def __init__(
         self,
         model_size: str = "base",
         device: str = "auto",
         compute_type: str = "auto",
-        language: str = "en"
+        language: str = "en",
+        beam_size: int = 1,
+        cpu_threads: Optional[int] = None
     ):
         """
         Initialize the speech-to-text engine.
@@ -58,13 +73,49 @@ class SpeechToText:
             device: Device to use (auto, cpu, cuda)
             compute_type: Computation type (auto, int8, float16, float32)
             language: Default language for transcription
+            beam_size: Beam width; 1 is greedy decoding, much faster for short answers
+            cpu_threads: CPU threads for CTranslate2 (default: half the cores)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.language = language
+        self.beam_size = beam_size
+        self.cpu_threads = cpu_threads if cpu_threads is not None else max(1, (os.cpu_count() or 2) // 2)
+        self.topic = ""
+        self._prior_context: deque[str] = deque(maxlen=self.CONTEXT_RESPONSES)
         self._model = None
 
+    def set_topic(self, topic: str):
+        """
+        Set what the next answer is about, e.g. the domain and question asked.
+
+        It leads the decoding prompt, which helps Whisper spell domain terms
+        and product names it would otherwise mishear.
+        """
+        self.topic = topic or ""
+
+    def remember(self, text: str):
+        """Keep a transcript as context for the next ones."""
+        if text and text.strip():
+            self._prior_context.append(text.strip())
+
+    def context_prompt(self, text: str = "") -> Optional[str]:
+        """
+        Build the initial prompt: topic, recent answers, then `text`.
+
+        Only the last PROMPT_MAX_WORDS words are kept, so the most recent
+        context survives truncation.
+        """
+        words = " ".join([self.topic, *self._prior_context, text]).split()
+        return " ".join(words[-self.PROMPT_MAX_WORDS:]) or None
+
+    def _model_name(self) -> str:
+        """Model to load: the English-only variant when transcribing English."""
+        if self.language == "en" and self.model_size in self.ENGLISH_ONLY_MODELS:
+            return f"{self.model_size}.en"
+        return self.model_size
+
     def _load_model(self):
         """Lazy load the Whisper model."""
         if self._model is None:
@@ -80,21 +131,50 @@ class SpeechToText:
                     self.compute_type = "float16" if self.device == "cuda" else "int8"
 
                 self._model = WhisperModel(
-                    self.model_size,
+                    self._model_name(),
                     device=self.device,
-                    compute_type=self.compute_type
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=1
                 )
                 print(f"✓ Whisper model loaded on {self.device}")
 
             except Exception as e:
                 raise RuntimeError(f"Failed to load Whisper model: {e}")
 
+    def warm_up(self):
+        """
+        Load the model and run one throwaway transcription.
+
+        The first decode pays for model loading, thread-pool start-up and buffer
+        allocation; doing it up front keeps that off the first real answer.
+        """
+        self._load_model()
+        silence = np.zeros(16000, dtype=np.float32)  # 1 s at 16 kHz
+        # VAD would drop pure silence before decoding, so it is off here;
+        # segments are lazy and only decode when consumed
+        segments, _ = self._model.transcribe(
+            silence,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=False,
+            condition_on_previous_text=False
+        )
+        for _ in segments:
+            pass
+
     def _cuda_available(self) -> bool:
-        """Check if CUDA is available."""
+        """
+        Check if CUDA is available to CTranslate2, the runtime faster-whisper decodes with.
+
+        Asked of CTranslate2 itself (installed with faster-whisper) rather than torch:
+        importing torch just for this check costs seconds, and torch may see a GPU
+        CTranslate2 was not built for.
+        """
         try:
-            import torch
-            return torch.cuda.is_available()
-        except ImportError:
+            import ctranslate2
+            return ctranslate2.get_cuda_device_count() > 0
+        except Exception:
             return False
 
     def transcribe(
@@ -117,8 +197,7 @@ class SpeechToText:
         self._load_model()
 
         # Ensure audio is float32 and normalized
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
+        audio_data = as_float32(audio_data)
 
         if audio_data.max() > 1.0:
             audio_data = audio_data / 32768.0  # Normalize from int16
@@ -127,9 +206,11 @@ class SpeechToText:
         segments, info = self._model.transcribe(
             audio_data,
             language=language or self.language,
-            beam_size=5,
+            beam_size=self.beam_size,
+            initial_prompt=self.context_prompt(),
             vad_filter=True,  # Filter out silence
-            vad_parameters=dict(min_silence_duration_ms=500)
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False  # Answers are short; skips prompt re-decoding
         )
 
         # Combine all segments
@@ -138,6 +219,7 @@ class SpeechToText:
             text_parts.append(segment.text.strip())
 
         full_text = " ".join(text_parts)
+        self.remember(full_text)
 
         return TranscriptionResult(
             text=full_text,
@@ -146,6 +228,39 @@ class SpeechToText:
             duration=info.duration
         )
 
+    def transcribe_words(
+        self,
+        audio_data: np.ndarray,
+        prompt: Optional[str] = None
+    ) -> list[tuple[str, float, float]]:
+        """
+        Transcribe audio into (word, start, end) tuples, times in seconds.
+
+        Used by StreamingTranscriber, which re-decodes a growing buffer and needs
+        word timings to drop audio it has already committed.
+
+        Args:
+            audio_data: Audio samples as numpy array (float32, mono, 16kHz)
+            prompt: Decoding prompt, e.g. from context_prompt()
+        """
+        self._load_model()
+
+        segments, _ = self._model.transcribe(
+            audio_data,
+            language=self.language,
+            beam_size=self.beam_size,
+            initial_prompt=prompt or None,
+            word_timestamps=True,
+            condition_on_previous_text=False
+        )
+
+        return [
+            (word.word.strip(), word.start, word.end)
+            for segment in segments
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+
     def transcribe_file(self, audio_path: str) -> TranscriptionResult:
         """
         Transcribe an audio file.
@@ -161,8 +276,9 @@ class SpeechToText:
         segments, info = self._model.transcribe(
             audio_path,
             language=self.language,
-            beam_size=5,
-            vad_filter=True
+            beam_size=self.beam_size,
+            vad_filter=True,
+            condition_on_previous_text=False
         )
 
         text_parts = [segment.text.strip() for segment in segments]
@@ -176,6 +292,122 @@ class SpeechToText:
         )
 
 
+class StreamingTranscriber:
+    """
+    Transcribes speech while it is still being recorded.
+
+    Feed it audio chunks as they are captured (e.g. as MicrophoneRecorder's
+    on_chunk callback). A worker thread re-decodes the not-yet-committed audio
+    every `interval` seconds and commits the words two consecutive decodes agree
+    on (local agreement), dropping their audio from the buffer. When recording
+    stops, finish() only has to decode the short uncommitted tail.
+
+    Usage:
+        transcriber = StreamingTranscriber(stt)
+        try:
+            recorder.record_until_silence(on_chunk=transcriber.feed)
+            result = transcriber.finish()
+        finally:
+            transcriber.close()
+    """
+
+    def __init__(
+        self,
+        stt: SpeechToText,
+        sample_rate: int = 16000,
+        interval: float = 0.35,
+        min_audio: float = 1.0
+    ):
+        """
+        Args:
+            stt: Speech-to-text engine to decode with
+            sample_rate: Sample rate of the fed audio
+            interval: Seconds between decodes while recording
+            min_audio: Seconds of uncommitted audio needed before decoding
+        """
+        self.stt = stt
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.min_audio = min_audio
+
+        self._lock = threading.Lock()
+        self._pending: list[np.ndarray] = []  # Fed chunks not yet in the buffer
+        self._buffer = np.array([], dtype=np.float32)  # Uncommitted audio
+        self._committed: list[str] = []
+        self._hypothesis: list[str] = []  # Uncommitted words from the last decode
+        self._duration = 0.0
+
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="streaming-stt", daemon=True)
+        self._worker.start()
+
+    def feed(self, chunk: np.ndarray):
+        """Add captured audio. Cheap and thread-safe, so it can run in an audio callback."""
+        with self._lock:
+            self._pending.append(as_float32(chunk))
+            self._duration += len(chunk) / self.sample_rate
+
+    def _take_buffer(self) -> np.ndarray:
+        """Move fed chunks into the buffer and return it."""
+        with self._lock:
+            if self._pending:
+                self._buffer = np.concatenate([self._buffer, *self._pending])
+                self._pending = []
+            return self._buffer
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            buffer = self._take_buffer()
+            if len(buffer) < self.min_audio * self.sample_rate:
+                continue
+            try:
+                self._step(buffer)
+            except Exception as e:
+                # finish() decodes whatever is left, so a failed pass loses nothing
+                print(f"Streaming transcription error: {e}")
+
+    def _step(self, buffer: np.ndarray):
+        """Decode the buffer and commit the words this decode and the last agree on."""
+        words = self.stt.transcribe_words(buffer, prompt=self.stt.context_prompt(" ".join(self._committed)))
+
+        agreed = 0
+        for (word, _, _), previous in zip(words, self._hypothesis):
+            if word.lower() != previous.lower():
+                break
+            agreed += 1
+
+        if agreed:
+            self._committed.extend(word for word, _, _ in words[:agreed])
+            cut = int(words[agreed - 1][2] * self.sample_rate)
+            with self._lock:
+                self._buffer = self._buffer[cut:]
+
+        self._hypothesis = [word for word, _, _ in words[agreed:]]
+
+    def close(self):
+        """Stop the worker thread. Safe to call more than once."""
+        self._stop.set()
+        if self._worker.is_alive() and self._worker is not threading.current_thread():
+            self._worker.join()
+
+    def finish(self) -> TranscriptionResult:
+        """Stop streaming, decode the remaining audio, and return the full transcript."""
+        self.close()
+        buffer = self._take_buffer()
+        if len(buffer):
+            tail = self.stt.transcribe_words(buffer, prompt=self.stt.context_prompt(" ".join(self._committed)))
+            self._committed.extend(word for word, _, _ in tail)
+            self._buffer = np.array([], dtype=np.float32)
+
+        text = " ".join(self._committed)
+        self.stt.remember(text)
+        return TranscriptionResult(
+            text=text,
+            language=self.stt.language,
+            duration=self._duration
+        )
+
+
 class MicrophoneRecorder:
     """
     Records audio from the microphone.
@@ -187,7 +419,7 @@ class MicrophoneRecorder:
         self,
         sample_rate: int = 16000,
         channels: int = 1,
-        dtype: str = "float32"
+        dtype: str = "int16"
     ):
         """
         Initialize the microphone recorder.
@@ -195,13 +427,15 @@ class MicrophoneRecorder:
         Args:
             sample_rate: Audio sample rate (16000 recommended for Whisper)
             channels: Number of audio channels (1 for mono)
-            dtype: Audio data type
+            dtype: Audio data type; int16 PCM is half the size of float32
+                and is converted for Whisper when transcribed
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
         self._recording = False
         self._audio_buffer = []
+        self._arena = np.empty(0, dtype=dtype)  # Reused by record_until_silence
 
     def _check_microphone(self) -> bool:
         """Check if a microphone is available."""
@@ -219,7 +453,8 @@ class MicrophoneRecorder:
         silence_duration: float = 1.5,
         max_duration: float = 30.0,
         on_speech_start: Optional[Callable] = None,
-        on_speech_end: Optional[Callable] = None
+        on_speech_end: Optional[Callable] = None,
+        on_chunk: Optional[Callable[[np.ndarray], None]] = None
     ) -> np.ndarray:
         """
         Record audio until silence is detected.
@@ -230,9 +465,13 @@ class MicrophoneRecorder:
             max_duration: Maximum recording duration
             on_speech_start: Callback when speech starts
             on_speech_end: Callback when speech ends
+            on_chunk: Called from the audio thread with each recorded chunk,
+                e.g. StreamingTranscriber.feed; must return quickly. Chunks
+                are views into the reused buffer, valid until the next recording
 
         Returns:
-            Recorded audio as numpy array
+            Recorded audio as numpy array. This is a view into a buffer the
+            next recording reuses, so copy it to keep it past that
         """
         import sounddevice as sd
 
@@ -241,31 +480,54 @@ class MicrophoneRecorder:
 
         print("🎤 Listening... (speak now)")
 
-        audio_chunks = []
-        silence_chunks = 0
+        # Speech is written straight into one preallocated buffer: no per-chunk
+        # copies to keep around and no concatenate at the end. The buffer is
+        # kept and reused, so steady-state recording allocates nothing
+        size = int(max_duration * self.sample_rate) * self.channels
+        if len(self._arena) < size:
+            self._arena = np.empty(size, dtype=self.dtype)
+        audio = self._arena[:size]
+        filled = 0
+        silent_samples = 0  # Trailing silence since the last loud chunk, per channel
+        samples_for_silence = int(silence_duration * self.sample_rate)
         speech_started = False
-        chunks_for_silence = int(silence_duration * self.sample_rate / 1024)
-        max_chunks = int(max_duration * self.sample_rate / 1024)
+        done = threading.Event()
+        # silence_threshold is in float units, where full scale is 1.0
+        full_scale = 32768.0 if np.dtype(self.dtype) == np.int16 else 1.0
 
         def callback(indata, frames, time, status):
-            nonlocal silence_chunks, speech_started
+            nonlocal filled, silent_samples, speech_started
 
             if status:
                 print(f"Audio status: {status}")
+            if done.is_set():
+                return
 
-            chunk = indata.copy().flatten()
-            rms = np.sqrt(np.mean(chunk**2))
+            samples = indata.reshape(-1)  # View, not a copy
+            # Sum of squares as one dot product, in float so int16 can't overflow
+            level = samples.astype(np.float32, copy=False)
+            rms = np.sqrt(np.dot(level, level) / len(level)) / full_scale
 
             if rms > silence_threshold:
                 if not speech_started:
                     speech_started = True
                     if on_speech_start:
                         on_speech_start()
-                silence_chunks = 0
-                audio_chunks.append(chunk)
+                silent_samples = 0
             elif speech_started:
-                silence_chunks += 1
-                audio_chunks.append(chunk)  # Include some silence
+                silent_samples += frames  # Include some silence
+            else:
+                return
+
+            end = min(filled + len(samples), len(audio))
+            chunk = audio[filled:end]
+            chunk[:] = samples[:end - filled]
+            filled = end
+            if on_chunk:
+                on_chunk(chunk)
+
+            if filled == len(audio) or silent_samples >= samples_for_silence:
+                done.set()
 
         with sd.InputStream(
             samplerate=self.sample_rate,
@@ -274,21 +536,14 @@ class MicrophoneRecorder:
             blocksize=1024,
             callback=callback
         ):
-            # Wait for speech and silence
-            chunk_count = 0
-            while chunk_count < max_chunks:
-                sd.sleep(100)  # 100ms
-                chunk_count += 1
-
-                if speech_started and silence_chunks >= chunks_for_silence:
-                    if on_speech_end:
-                        on_speech_end()
-                    break
-
-        if not audio_chunks:
-            return np.array([], dtype=np.float32)
-
-        return np.concatenate(audio_chunks)
+            # Wait up to max_duration for speech; once it has started, the full
+            # buffer sets `done` itself, so a late start still gets its whole answer
+            if not done.wait(max_duration) and speech_started:
+                done.wait(max_duration)
+            if done.is_set() and on_speech_end:
+                on_speech_end()
+
+        return audio[:filled]
 
     def record_fixed_duration(self, duration: float = 5.0) -> np.ndarray:
         """
@@ -7,9 +7,10 @@ Falls back to pyttsx3 (OS-native) when offline or no API key is set.
 
 import io
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from dataclasses import dataclass
 
 
@@ -55,6 +56,10 @@ ELEVENLABS_VOICES = {
 DEFAULT_VOICE = "rachel"
 DEFAULT_MODEL = "eleven_multilingual_v2"
 
+# Raw output for stream_speak(): 16-bit mono PCM, played as it arrives
+PCM_SAMPLE_RATE = 24000
+PCM_FRAME_BYTES = PCM_SAMPLE_RATE // 50 * 2  # 20 ms of int16 samples
+
 
 class TextToSpeech:
     """
@@ -114,6 +119,9 @@ class TextToSpeech:
         # Determine provider
         self._use_elevenlabs = bool(self._api_key)
 
+        # Audio synthesized ahead of time by prepare(), keyed by text
+        self._audio_cache: dict[str, bytes] = {}
+
         if self._use_elevenlabs:
             print(f"   Using ElevenLabs TTS (voice: {voice_input})")
         else:
@@ -190,6 +198,62 @@ class TextToSpeech:
 
         self._play_audio(audio_data)
 
+    def _stream_elevenlabs_pcm(self, text: str):
+        """
+        Stream raw PCM from ElevenLabs straight to the speakers.
+
+        Playback starts with the first 20 ms frame instead of after the whole
+        clip has downloaded and been decoded from MP3. Errors are raised only
+        if nothing has played yet; a stream cut off mid-sentence just stops,
+        rather than being spoken again from the start.
+        """
+        import requests
+        import sounddevice as sd
+
+        url = (
+            f"https://api.elevenlabs.io/v1/text-to-speech/"
+            f"{self._elevenlabs_voice_id}/stream"
+        )
+
+        headers = {
+            "xi-api-key": self._api_key,
+            "Content-Type": "application/json",
+        }
+
+        payload = {
+            "text": text,
+            "model_id": self._elevenlabs_model,
+            "voice_settings": {
+                "stability": self._stability,
+                "similarity_boost": self._similarity_boost,
+                "style": self._style,
+                "use_speaker_boost": True,
+            },
+        }
+
+        response = requests.post(
+            url, params={"output_format": f"pcm_{PCM_SAMPLE_RATE}"},
+            json=payload, headers=headers, stream=True, timeout=30
+        )
+        response.raise_for_status()
+
+        played = False
+        pending = b""
+        # Leaving the block stops the stream after the queued audio has played
+        with sd.RawOutputStream(samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16") as out:
+            try:
+                for chunk in response.iter_content(chunk_size=PCM_FRAME_BYTES):
+                    pending += chunk
+                    whole = len(pending) & ~1  # Only complete 16-bit samples
+                    if whole:
+                        out.write(pending[:whole])
+                        pending = pending[whole:]
+                        played = True
+            except Exception as e:
+                if not played:
+                    raise
+                print(f"ElevenLabs stream interrupted: {e}")
+
     def _play_audio(self, audio_bytes: bytes):
         """Play MP3 audio bytes through the system speakers."""
         try:
@@ -325,11 +389,41 @@ class TextToSpeech:
 
     # ── Public API ──────────────────────────────────────────────
 
+    def prepare(self, texts: Iterable[str]):
+        """
+        Synthesize prompts known in advance, in a background thread.
+
+        speak() then plays them without waiting on synthesis. Only ElevenLabs
+        audio is prepared: it costs an API round-trip per prompt, while pyttsx3
+        renders locally as it speaks.
+
+        Args:
+            texts: Prompts that will be spoken later
+        """
+        if not self._use_elevenlabs:
+            return
+
+        pending = [t for t in dict.fromkeys(texts) if t and t.strip() and t not in self._audio_cache]
+        if pending:
+            threading.Thread(
+                target=self._prepare, args=(pending,), name="tts-prepare", daemon=True
+            ).start()
+
+    def _prepare(self, texts: List[str]):
+        for text in texts:
+            try:
+                self._audio_cache[text] = self.generate_audio(text)
+            except Exception as e:
+                # speak() synthesizes on demand for anything not prepared
+                print(f"ElevenLabs pre-synthesis failed: {e}")
+                return
+
     def speak(self, text: str):
         """
         Speak the given text. Blocks until complete.
 
         Uses ElevenLabs if API key is available, otherwise pyttsx3.
+        Audio prepared with prepare() is played directly.
 
         Args:
             text: Text to speak
@@ -337,6 +431,11 @@ class TextToSpeech:
         if not text or not text.strip():
             return
 
+        audio = self._audio_cache.get(text)
+        if audio:
+            self._play_audio(audio)
+            return
+
         if self._use_elevenlabs:
             try:
                 self._speak_elevenlabs_stream(text)
@@ -346,6 +445,30 @@ class TextToSpeech:
         else:
             self._speak_pyttsx3(text)
 
+    def stream_speak(self, text: str):
+        """
+        Speak the given text, starting playback while it is still being synthesized.
+
+        Blocks until complete. Falls back to speak() when the audio is already
+        prepared, when ElevenLabs is not in use, or when streaming fails before
+        any audio played.
+
+        Args:
+            text: Text to speak
+        """
+        if not text or not text.strip():
+            return
+
+        if not self._use_elevenlabs or text in self._audio_cache:
+            self.speak(text)
+            return
+
+        try:
+            self._stream_elevenlabs_pcm(text)
+        except Exception as e:
+            print(f"ElevenLabs streaming error: {e}. Falling back.")
+            self.speak(text)
+
     def speak_with_pause(self, text: str, pause_after: float = 0.5):
         """
         Speak text with a pause after.
@@ -0,0 +1,632 @@
+// Element lookups are cached: these nodes live for the whole page
+const refs = {};
+function el(id) {
+    return refs[id] ??= document.getElementById(id);
+}
+
+function cloneTemplate(id) {
+    return el(id).content.firstElementChild.cloneNode(true);
+}
+
+// State
+let sessionId = null;
+let buildId = null;
+let currentQuestion = null;
+let interviewSummary = null;
+let implementationSpec = null;
+let buildPollAbort = null;
+let buildEtag = null;
+let buildStream = null;
+let buildStreamPaused = false;
+let buildFinished = false;
+let logSeen = {};  // task_id -> log lines already shown
+const renderedTasks = new Map();  // task_id -> task row element
+let pendingLogLines = [];  // Collected from every update, drawn on the next frame
+let lastBuildState = null;  // Base that stream deltas apply to
+const MAX_LOG_LINES = 200;  // Older log lines are dropped from the DOM
+
+// Tab switching
+function switchTab(tab) {
+    document.querySelectorAll('.nav-tab').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.tab-panel').forEach(p => p.classList.remove('active'));
+
+    el('tab-' + tab).classList.add('active');
+    el('panel-' + tab).classList.add('active');
+}
+
+// ==================== INTERVIEW ====================
+async function startInterview() {
+    const clientName = el('client-name').value.trim();
+    const industry = el('industry').value;
+
+    if (!clientName) {
+        alert('Please enter a company name');
+        return;
+    }
+
+    const response = await fetch('/api/interview/start', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ client_name: clientName, industry: industry })
+    });
+
+    const data = await response.json();
+    sessionId = data.session_id;
+
+    el('setup-form').classList.add('hidden');
+    el('interview-chat').classList.remove('hidden');
+
+    addMessage('bot', `Welcome! Let's gather requirements for ${clientName}'s Odoo implementation.`);
+    await getNextQuestion();
+}
+
+async function getNextQuestion() {
+    const response = await fetch(`/api/interview/question?session_id=${sessionId}`);
+    showQuestion(await response.json());
+}
+
+function showQuestion(data) {
+    if (data.complete) {
+        showInterviewComplete(data.summary, data.spec);
+        return;
+    }
+
+    currentQuestion = data;
+
+    if (data.expert_intro) {
+        addMessage('bot', data.expert_intro, 'expert-intro');
+    }
+
+    addMessage('bot', data.question);
+    updateProgress(data.progress);
+}
+
+async function sendMessage() {
+    const input = el('user-input');
+    const message = input.value.trim();
+    if (!message || !currentQuestion) return;
+
+    input.value = '';
+    addMessage('user', message);
+
+    const response = await fetch('/api/interview/respond', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            session_id: sessionId,
+            response: message,
+            question: currentQuestion
+        })
+    });
+
+    const data = await response.json();
+    updateProgress(data.progress);
+    showQuestion(data.next);
+}
+
+async function skipQuestion() {
+    if (!currentQuestion) return;
+    addMessage('user', '[Skipped]');
+
+    const response = await fetch('/api/interview/skip', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ session_id: sessionId, question: currentQuestion })
+    });
+
+    showQuestion((await response.json()).next);
+}
+
+async function endInterview() {
+    const response = await fetch('/api/interview/end', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ session_id: sessionId })
+    });
+
+    const data = await response.json();
+    showInterviewComplete(data.summary, data.spec);
+}
+
+function showInterviewComplete(summary, spec) {
+    interviewSummary = summary;
+    implementationSpec = spec;
+
+    el('interview-chat').classList.add('hidden');
+    el('interview-complete').classList.remove('hidden');
+
+    el('modules-count').textContent = spec.modules.length;
+    el('domains-count').textContent = summary.domains_covered.length;
+    el('est-time').textContent = '~' + spec.estimated_setup_minutes;
+
+    const modulesFragment = document.createDocumentFragment();
+    for (const m of spec.modules) {
+        const tag = cloneTemplate('tpl-module');
+        tag.textContent = m.display_name;
+        modulesFragment.appendChild(tag);
+    }
+    el('recommended-modules').replaceChildren(modulesFragment);
+
+    // Enable build tab
+    el('tab-build').disabled = false;
+    el('tab-interview').classList.add('completed');
+}
+
+// Run fn on the next animation frame; a later call with the same key replaces it,
+// so several updates landing in one frame cause a single layout
+const frameTasks = new Map();
+function onNextFrame(key, fn) {
+    if (frameTasks.size === 0) requestAnimationFrame(runFrameTasks);
+    frameTasks.set(key, fn);
+}
+
+function runFrameTasks() {
+    const tasks = [...frameTasks.values()];
+    frameTasks.clear();
+    tasks.forEach(fn => fn());
+}
+
+function addMessage(type, content, extraClass = '') {
+    const messagesDiv = el('chat-messages');
+    const div = cloneTemplate('tpl-message');
+    div.classList.add(type);
+    div.querySelector('.message-avatar').textContent = type === 'bot' ? '🤖' : '👤';
+    const contentDiv = div.querySelector('.message-content');
+    if (extraClass) contentDiv.classList.add(extraClass);
+    contentDiv.textContent = content;
+    messagesDiv.appendChild(div);
+    onNextFrame('chat-scroll', () => { messagesDiv.scrollTop = messagesDiv.scrollHeight; });
+}
+
+function updateProgress(progress) {
+    if (!progress) return;
+    onNextFrame('progress', () => applyProgress(progress));
+}
+
+function applyProgress(progress) {
+    el('progress-percent').textContent = progress.overall_percent + '%';
+    el('progress-bar').style.width = progress.overall_percent + '%';
+    el('current-phase').textContent = `Phase: ${progress.phase}`;
+
+    // Update phase steps
+    const steps = ['scoping', 'domains', 'summary'];
+    steps.forEach(s => el('phase-' + s).className = 'phase-step');
+
+    if (progress.phase === 'Scoping') {
+        el('phase-scoping').classList.add('active');
+    } else if (progress.phase.startsWith('Expert')) {
+        el('phase-scoping').classList.add('completed');
+        el('phase-domains').classList.add('active');
+    } else {
+        el('phase-scoping').classList.add('completed');
+        el('phase-domains').classList.add('completed');
+        el('phase-summary').classList.add('active');
+    }
+
+    // Domain pills, swapped in one go
+    const pills = document.createDocumentFragment();
+    const addPill = (state, text) => {
+        const pill = cloneTemplate('tpl-pill');
+        pill.classList.add(state);
+        pill.textContent = text;
+        pills.appendChild(pill);
+    };
+    if (progress.current_domain) addPill('active', progress.current_domain);
+    (progress.domains_completed || []).forEach(d => {
+        if (d !== progress.current_domain) addPill('completed', `✓ ${d}`);
+    });
+    (progress.domains_pending || []).forEach(d => addPill('pending', d));
+    el('domain-pills').replaceChildren(pills);
+}
+
+// ==================== BUILD ====================
+let buildType = 'docker';  // 'docker' or 'cloud'
+let selectedProvider = 'skysize';
+
+async function startBuild(type) {
+    buildType = type;
+    switchTab('build');
+
+    if (type === 'cloud') {
+        // Update header for cloud
+        el('build-header-title').textContent = '☁️ Cloud Deployment';
+        el('build-header-desc').textContent = 'Deploying to free cloud hosting with guided setup';
+
+        // Show provider selection
+        await loadProviders();
+        el('cloud-provider-select').classList.remove('hidden');
+    } else {
+        // Docker build
+        el('build-header-title').textContent = '🐳 Local Docker Build';
+        el('build-header-desc').textContent = 'Setting up Docker, installing modules, and configuring your system';
+        el('cloud-provider-select').classList.add('hidden');
+        await startDockerBuild();
+    }
+}
+
+async function loadProviders() {
+    const response = await fetch('/api/cloud/providers');
+    const providers = await response.json();
+
+    const cards = document.createDocumentFragment();
+    for (const p of providers) {
+        const card = cloneTemplate('tpl-provider');
+        if (p.recommended) {
+            card.style.background = '#e8f5e9';
+            card.style.borderColor = '#4CAF50';
+            card.querySelector('.provider-badge').classList.remove('hidden');
+        }
+        card.querySelector('.provider-name').textContent = p.name;
+        const features = card.querySelector('.provider-features');
+        for (const f of p.features) {
+            const li = document.createElement('li');
+            li.textContent = f;
+            features.appendChild(li);
+        }
+        card.addEventListener('click', () => selectProvider(p.id, p.signup_url));
+        cards.appendChild(card);
+    }
+    el('provider-cards').replaceChildren(cards);
+}
+
+async function selectProvider(providerId, signupUrl) {
+    selectedProvider = providerId;
+    el('cloud-provider-select').classList.add('hidden');
+
+    const response = await fetch('/api/build/start', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            session_id: sessionId,
+            build_type: 'cloud',
+            provider: providerId
+        })
+    });
+
+    const data = await response.json();
+    buildId = data.build_id;
+
+    watchBuild();
+}
+
+async function startDockerBuild() {
+    const response = await fetch('/api/build/start', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            session_id: sessionId,
+            build_type: 'docker'
+        })
+    });
+
+    const data = await response.json();
+    buildId = data.build_id;
+
+    watchBuild();
+}
+
+function confirmCloudStep() {
+    // User confirmed they completed a step - continue polling
+    el('cloud-instructions').classList.add('hidden');
+}
+
+// Prefer server push; fall back to polling if EventSource is unavailable or drops
+function watchBuild() {
+    buildFinished = false;
+    logSeen = {};
+    pendingLogLines = [];
+    renderedTasks.clear();
+    el('build-tasks').replaceChildren();
+    el('build-logs').replaceChildren();
+    el('cancel-build').classList.remove('hidden');
+    el('cancel-build').disabled = false;
+    if (!window.EventSource) {
+        longPollBuild();
+        return;
+    }
+    openBuildStream();
+}
+
+// Each open stream holds a server thread, so it is closed while the tab is
+// hidden; reopening starts with a full snapshot.
+function openBuildStream() {
+    buildStream = new EventSource(`/api/build/stream?build_id=${buildId}`);
+    buildStream.onmessage = (e) => handleBuildState(JSON.parse(e.data));
+    buildStream.addEventListener('delta', (e) => handleBuildState(applyBuildDelta(JSON.parse(e.data))));
+    buildStream.onerror = () => {
+        buildStream.close();
+        buildStream = null;
+        if (!buildFinished) longPollBuild();
+    };
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+        if (buildStream) {
+            buildStream.close();
+            buildStream = null;
+            buildStreamPaused = true;
+        }
+    } else if (buildStreamPaused) {
+        buildStreamPaused = false;
+        if (!buildFinished) openBuildStream();
+    }
+});
+
+async function cancelBuild() {
+    el('cancel-build').disabled = true;
+    await fetch('/api/build/cancel', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ build_id: buildId })
+    });
+}
+
+function stopBuildUpdates() {
+    buildFinished = true;
+    el('cancel-build').classList.add('hidden');
+    if (buildPollAbort) buildPollAbort.abort();
+    buildStreamPaused = false;
+    if (buildStream) {
+        buildStream.close();
+        buildStream = null;
+    }
+}
+
+const POLL_RETRY_MIN_MS = 1000;
+const POLL_RETRY_MAX_MS = 10000;
+const POLL_JITTER_MS = 200;
+
+// Long-poll fallback: the server holds each request until the build changes.
+// Paused while the tab is hidden; failed requests back off with jitter so
+// many open tabs don't retry in lockstep.
+async function longPollBuild() {
+    buildEtag = null;
+    buildPollAbort = new AbortController();
+    let retryMs = POLL_RETRY_MIN_MS;
+    while (!buildFinished) {
+        await whenVisible();
+        if (buildFinished) break;
+        try {
+            await pollBuildStatus(buildPollAbort.signal);
+            retryMs = POLL_RETRY_MIN_MS;
+        } catch (e) {
+            if (e.name === 'AbortError') return;
+            console.error('Poll error:', e);
+            const jitter = (Math.random() * 2 - 1) * POLL_JITTER_MS;
+            await new Promise(resolve => setTimeout(resolve, retryMs + jitter));
+            retryMs = Math.min(retryMs * 2, POLL_RETRY_MAX_MS);
+        }
+    }
+}
+
+function whenVisible() {
+    if (document.visibilityState !== 'hidden') return Promise.resolve();
+    return new Promise(resolve => {
+        document.addEventListener('visibilitychange', function onChange() {
+            if (document.visibilityState === 'hidden') return;
+            document.removeEventListener('visibilitychange', onChange);
+            resolve();
+        });
+    });
+}
+
+// Once we hold a snapshot, ask for changes since it: the server answers with a
+// delta when it still has that snapshot, else with the full state
+async function pollBuildStatus(signal) {
+    let url = `/api/build/status?build_id=${buildId}`;
+    const headers = {};
+    if (buildEtag) {
+        headers['If-None-Match'] = buildEtag;
+        url += `&since=${buildEtag.replace(/^W\//, '').replaceAll('"', '')}`;
+    }
+    const response = await fetch(url, { headers, signal });
+    if (response.status === 304) return;
+    if (!response.ok) throw new Error(`Build status HTTP ${response.status}`);
+    buildEtag = response.headers.get('ETag');
+    const body = await response.json();
+    handleBuildState(body.delta ? applyBuildDelta(body.delta) : body);
+}
+
+window.addEventListener('pagehide', () => {
+    if (buildPollAbort) buildPollAbort.abort();
+});
+
+// Merge a stream delta (changed fields, plus changed_tasks by task_id) into the last state
+function applyBuildDelta(delta) {
+    const { changed_tasks: changedTasks, ...fields } = delta;
+    const state = { ...lastBuildState, ...fields };
+    if (changedTasks) {
+        const byId = new Map(changedTasks.map(t => [t.task_id, t]));
+        state.tasks = state.tasks.map(t => byId.get(t.task_id) || t);
+    }
+    return state;
+}
+
+// Updates can arrive faster than the screen refreshes: collect log lines from
+// every update, but only draw the latest state once per animation frame
+function handleBuildState(state) {
+    lastBuildState = state;
+    collectLogLines(state);
+    if (state.status === 'completed' || state.status === 'failed') stopBuildUpdates();
+    onNextFrame('build', () => renderBuildState(state));
+}
+
+function renderBuildState(state) {
+    updateBuildUI(state);
+
+    // Handle cloud waiting_user status
+    if (state.current_task && state.current_task.status === 'waiting_user') {
+        const instrPanel = el('cloud-instructions');
+        instrPanel.classList.remove('hidden');
+        el('cloud-action-text').textContent = state.current_task.user_action_required || 'Please complete the required action';
+        if (state.current_task.user_action_url) {
+            el('cloud-action-url').href = state.current_task.user_action_url;
+            el('cloud-action-url').classList.remove('hidden');
+        } else {
+            el('cloud-action-url').classList.add('hidden');
+        }
+    } else {
+        el('cloud-instructions').classList.add('hidden');
+    }
+
+    if (state.status === 'completed') {
+        el('build-complete').classList.remove('hidden');
+        el('odoo-url').href = state.odoo_url || '#';
+        el('odoo-url').textContent = state.odoo_url || 'Your Odoo Instance';
+        el('final-odoo-url').href = state.odoo_url || '#';
+
+        el('tab-test').disabled = false;
+        el('tab-build').classList.add('completed');
+    }
+}
+
+function updateBuildUI(state) {
+    el('build-percent').textContent = state.overall_progress + '%';
+    el('build-progress-bar').style.width = state.overall_progress + '%';
+
+    const currentTask = state.current_task;
+    let statusText = 'Processing...';
+    if (currentTask) {
+        if (currentTask.status === 'waiting_user') {
+            statusText = `⏳ Waiting: ${currentTask.name}`;
+        } else {
+            statusText = `${currentTask.name}...`;
+        }
+    } else if (state.status === 'completed') {
+        statusText = 'Complete!';
+    }
+    el('build-status').textContent = statusText;
+
+    renderTasks(state.tasks);
+    renderLogLines();
+}
+
+// Task rows are keyed by task_id and patched in place; only new tasks create nodes
+function renderTasks(tasks) {
+    const tasksDiv = el('build-tasks');
+    const seen = new Set();
+    let prev = null;
+    for (const task of tasks) {
+        seen.add(task.task_id);
+        let row = renderedTasks.get(task.task_id);
+        if (!row) {
+            row = createTaskRow();
+            renderedTasks.set(task.task_id, row);
+        }
+        updateTaskRow(row, task);
+        const next = prev ? prev.nextSibling : tasksDiv.firstChild;
+        if (row !== next) tasksDiv.insertBefore(row, next);
+        prev = row;
+    }
+    for (const [taskId, row] of renderedTasks) {
+        if (!seen.has(taskId)) {
+            row.remove();
+            renderedTasks.delete(taskId);
+        }
+    }
+}
+
+function createTaskRow() {
+    const row = cloneTemplate('tpl-task');
+    row.parts = {
+        icon: row.querySelector('.task-icon'),
+        name: row.querySelector('.task-name'),
+        description: row.querySelector('.task-description'),
+        action: row.querySelector('.task-action'),
+        status: row.querySelector('.task-status'),
+    };
+    return row;
+}
+
+function setText(node, text) {
+    if (node.textContent !== text) node.textContent = text;
+}
+
+function setClass(node, className) {
+    if (node.className !== className) node.className = className;
+}
+
+function updateTaskRow(row, task) {
+    let icon = '⏸️';
+    let statusClass = task.status;
+
+    if (task.status === 'completed') icon = '✅';
+    else if (task.status === 'in_progress') icon = '⏳';
+    else if (task.status === 'waiting_user') { icon = '👆'; statusClass = 'in_progress'; }
+    else if (task.status === 'failed') icon = '❌';
+
+    const { parts } = row;
+    setClass(row, `build-task ${statusClass}`);
+    setText(parts.icon, icon);
+    setText(parts.name, task.name);
+    setText(parts.description, task.description);
+    setText(parts.action, task.user_action_required ? `👆 ${task.user_action_required}` : '');
+    parts.action.classList.toggle('hidden', !task.user_action_required);
+    setClass(parts.status, `task-status ${statusClass}`);
+    setText(parts.status, task.status.replace('_', ' '));
+}
+
+// Queue only lines not seen yet; log_count is each task's running total
+function collectLogLines(state) {
+    for (const task of state.tasks) {
+        const logs = task.logs || [];
+        const total = task.log_count ?? logs.length;
+        const unseen = total - (logSeen[task.task_id] || 0);
+        if (unseen <= 0) continue;
+        pendingLogLines.push(...logs.slice(Math.max(0, logs.length - unseen)));
+        logSeen[task.task_id] = total;
+    }
+}
+
+function renderLogLines() {
+    if (pendingLogLines.length === 0) return;
+    const logsDiv = el('build-logs');
+    const fragment = document.createDocumentFragment();
+    for (const log of pendingLogLines.slice(-MAX_LOG_LINES)) {
+        const entry = document.createElement('div');
+        entry.className = 'log-entry';
+        entry.textContent = log;
+        fragment.appendChild(entry);
+    }
+    pendingLogLines = [];
+    logsDiv.appendChild(fragment);
+    while (logsDiv.childElementCount > MAX_LOG_LINES) logsDiv.firstElementChild.remove();
+    logsDiv.scrollTop = logsDiv.scrollHeight;
+}
+
+// ==================== TEST ====================
+const TEST_TYPES = ['connection', 'modules', 'company', 'users'];
+
+function showTestPending(testType) {
+    el(`test-${testType}-result`).replaceChildren(cloneTemplate('tpl-test-pending'));
+}
+
+function showTestResult(testType, data) {
+    const result = cloneTemplate('tpl-test-result');
+    result.style.color = data.success ? '#4CAF50' : '#f44336';
+    result.textContent = `${data.success ? '✅' : '❌'} ${data.message}`;
+    el(`test-${testType}-result`).replaceChildren(result);
+}
+
+async function runTest(testType) {
+    showTestPending(testType);
+    try {
+        const response = await fetch(`/api/test/${testType}?build_id=${buildId}`);
+        showTestResult(testType, await response.json());
+    } catch (e) {
+        showTestResult(testType, { success: false, message: `Error: ${e.message}` });
+    }
+}
+
+// One request; the server probes the instance concurrently
+async function runAllTests() {
+    TEST_TYPES.forEach(showTestPending);
+    try {
+        const response = await fetch(`/api/test/all?build_id=${buildId}`);
+        const results = await response.json();
+        TEST_TYPES.forEach(t => showTestResult(t, results[t]));
+    } catch (e) {
+        TEST_TYPES.forEach(t => showTestResult(t, { success: false, message: `Error: ${e.message}` }));
+    }
+}
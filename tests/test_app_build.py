@@ -0,0 +1,244 @@
+"""
+Tests for app.py's build API (/api/build/*).
+
+Uses the Flask test client with in-process state — no Redis, Docker or Odoo needed.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app as webapp
+
+
+def _clear_state():
+    with webapp.state_lock:
+        webapp.sessions.clear()
+        webapp.builds.clear()
+        webapp.build_futures.clear()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(webapp, "redis_client", None)
+    webapp.app.config["TESTING"] = True
+    _clear_state()
+    with webapp.app.test_client() as client:
+        yield client
+    _clear_state()
+
+
+def _state(build_id, status="running", progress=0, tasks=()):
+    return {
+        "build_id": build_id,
+        "status": status,
+        "overall_progress": progress,
+        "tasks": list(tasks),
+        "odoo_url": None,
+        "build_type": "docker",
+    }
+
+
+class TestBuildStatusLongPoll:
+    def test_matching_etag_gets_304(self, client):
+        webapp._save_build("b1", _state("b1", status="completed", progress=100))
+        first = client.get("/api/build/status?build_id=b1")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        # A finished build is answered at once instead of being held
+        again = client.get("/api/build/status?build_id=b1", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+        assert again.data == b""
+
+    def test_changed_snapshot_is_sent_in_full(self, client):
+        webapp._save_build("b1", _state("b1", status="completed", progress=100))
+        response = client.get("/api/build/status?build_id=b1", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json["overall_progress"] == 100
+
+    def test_running_build_is_held_until_it_changes(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "BUILD_LONG_POLL_SECONDS", 5)
+        webapp._save_build("b1", _state("b1", progress=10))
+        etag = client.get("/api/build/status?build_id=b1").headers["ETag"]
+
+        timer = threading.Timer(0.1, webapp._save_build, ("b1", _state("b1", progress=20)))
+        timer.start()
+        response = client.get("/api/build/status?build_id=b1", headers={"If-None-Match": etag})
+        timer.join()
+
+        assert response.status_code == 200
+        assert response.json["overall_progress"] == 20
+        assert response.headers["ETag"] != etag
+
+    def test_unchanged_running_build_times_out_with_304(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "BUILD_LONG_POLL_SECONDS", 0.1)
+        webapp._save_build("b1", _state("b1", progress=10))
+        etag = client.get("/api/build/status?build_id=b1").headers["ETag"]
+
+        response = client.get("/api/build/status?build_id=b1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_unknown_build_is_rejected(self, client):
+        assert client.get("/api/build/status?build_id=nope").status_code == 400
+
+
+class TestBuildStatusDelta:
+    def test_since_known_etag_gets_delta(self, client):
+        task = {"task_id": "t1", "status": "pending", "progress": 0}
+        webapp._save_build("b1", _state("b1", progress=10, tasks=[task]))
+        etag = client.get("/api/build/status?build_id=b1").headers["ETag"].strip('"')
+
+        webapp._save_build("b1", _state("b1", progress=40, tasks=[{**task, "status": "running"}]))
+        response = client.get(f"/api/build/status?build_id=b1&since={etag}")
+
+        assert response.json == {
+            "since": etag,
+            "delta": {
+                "overall_progress": 40,
+                "changed_tasks": [{"task_id": "t1", "status": "running", "progress": 0}],
+            },
+        }
+
+    def test_since_etag_out_of_history_gets_full_snapshot(self, client):
+        webapp._save_build("b1", _state("b1", progress=0))
+        etag = client.get("/api/build/status?build_id=b1").headers["ETag"].strip('"')
+
+        for progress in range(1, webapp.BUILD_DELTA_HISTORY + 2):
+            webapp._save_build("b1", _state("b1", progress=progress))
+        response = client.get(f"/api/build/status?build_id=b1&since={etag}")
+
+        assert "delta" not in response.json
+        assert response.json["overall_progress"] == webapp.BUILD_DELTA_HISTORY + 1
+
+    def test_since_current_etag_gets_full_snapshot(self, client):
+        webapp._save_build("b1", _state("b1", progress=10))
+        etag = client.get("/api/build/status?build_id=b1").headers["ETag"].strip('"')
+
+        response = client.get(f"/api/build/status?build_id=b1&since={etag}")
+        assert response.json["overall_progress"] == 10
+
+
+class TestBuildStream:
+    def test_full_snapshot_then_deltas_until_finished(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "BUILD_STREAM_KEEPALIVE_SECONDS", 5)
+        webapp._save_build("b1", _state("b1", progress=10))
+
+        timer = threading.Timer(0.1, webapp._save_build, ("b1", _state("b1", status="completed", progress=100)))
+        timer.start()
+        response = client.get("/api/build/stream?build_id=b1")
+        body = response.get_data(as_text=True)
+        timer.join()
+
+        assert response.mimetype == "text/event-stream"
+        first, second = [e for e in body.split("\n\n") if e and not e.startswith(":")]
+        assert webapp.app.json.loads(first.removeprefix("data: "))["overall_progress"] == 10
+        event, data = second.split("\n")
+        assert event == "event: delta"
+        assert webapp.app.json.loads(data.removeprefix("data: ")) == {
+            "status": "completed", "overall_progress": 100,
+        }
+
+    def test_unknown_build_is_rejected(self, client):
+        assert client.get("/api/build/stream?build_id=nope").status_code == 400
+
+
+class TestStateBounds:
+    def test_least_recently_used_session_is_dropped(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "MAX_SESSIONS", 2)
+        monkeypatch.setattr(webapp, "PhasedInterviewAgent", MagicMock())
+
+        def start():
+            return client.post("/api/interview/start", json={"client_name": "Acme"}).json["session_id"]
+
+        first, second = start(), start()
+        assert webapp._get_session(first) is not None  # Now more recent than second
+        third = start()
+
+        assert list(webapp.sessions) == [first, third]
+        assert second not in webapp.sessions
+
+    def test_least_recently_used_finished_build_is_dropped(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "MAX_BUILDS", 2)
+        webapp._save_build("old", _state("old", status="completed"))
+        webapp._save_build("new", _state("new", status="completed"))
+        client.get("/api/build/status?build_id=old")  # Reading refreshes it
+
+        webapp._prune_builds()
+        assert list(webapp.builds) == ["old"]
+
+    def test_queued_and_running_builds_are_kept(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "MAX_BUILDS", 2)
+        webapp._save_build("running", _state("running"))
+        webapp._save_build("done", _state("done", status="completed"))
+        webapp.build_futures["running"] = MagicMock()
+
+        webapp._prune_builds()
+        assert list(webapp.builds) == ["running"]
+
+
+def _wait_until_finished(build_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while build_id in webapp.build_futures and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert build_id not in webapp.build_futures
+
+
+class StubBuilder:
+    """Builds until cancelled; stop() marks it failed like the real builders."""
+
+    def __init__(self, build_id):
+        self.state = MagicMock()
+        self.state.to_dict.side_effect = lambda: _state(build_id, status=self.status)
+        self.status = "running"
+        self.stopped = False
+        self.on_progress = None
+
+    async def build(self):
+        await asyncio.Event().wait()
+
+    def stop(self):
+        self.stopped = True
+        self.status = "failed"
+
+
+class TestBuildCancel:
+    def test_cancelling_queued_build_marks_it_failed(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "build_slots", asyncio.Semaphore(0))  # No free slot
+        make_builder = MagicMock()
+        webapp._save_build("b1", _state("b1", status="pending"))
+        webapp._submit_build("b1", make_builder)
+
+        response = client.post("/api/build/cancel", json={"build_id": "b1"})
+        assert response.json == {"cancelled": True}
+        _wait_until_finished("b1")
+
+        assert webapp._load_build("b1")["status"] == "failed"
+        make_builder.assert_not_called()
+
+    def test_cancelling_running_build_stops_builder(self, client, monkeypatch):
+        monkeypatch.setattr(webapp, "build_slots", asyncio.Semaphore(1))
+        builder = StubBuilder("b1")
+        webapp._save_build("b1", _state("b1", status="pending"))
+        webapp._submit_build("b1", lambda: builder)
+
+        deadline = time.monotonic() + 5
+        while "b1" not in webapp.builders and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.post("/api/build/cancel", json={"build_id": "b1"})
+        _wait_until_finished("b1")
+
+        assert builder.stopped
+        assert webapp._load_build("b1")["status"] == "failed"
+        assert "b1" not in webapp.builders
+
+    def test_cancelling_unknown_build_is_rejected(self, client):
+        assert client.post("/api/build/cancel", json={"build_id": "nope"}).status_code == 400
@@ -172,6 +172,20 @@ class TestSessionManagement:
         )
         assert resp.status_code == 400
 
+    def test_respond_and_next_returns_next_question(self, client):
+        sid = _start(client, "FusedCo")
+        q = client.get(f"/api/question?session_id={sid}").get_json()
+        resp = client.post(
+            "/api/respond_and_next",
+            json={"session_id": sid, "response": _ANSWERS[0], "question": q},
+            content_type="application/json",
+        )
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert "progress" in data
+        assert data["next"]["complete"] is False
+        assert data["next"]["id"] != q["id"]
+
     def test_skip_question_returns_skipped_true(self, client):
         sid = _start(client, "SkipCo")
         q = client.get(f"/api/question?session_id={sid}").get_json()
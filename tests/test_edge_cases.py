@@ -8,11 +8,19 @@ against adversarial and boundary-condition inputs.
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
+from src.branching.analyzer import ResponseAnalyzer, ResponseQuality
+from src.branching.engine import BranchingEngine, ActionType
 from src.signals import detect_signals, detect_signals_multi, SignalStrength
-from src.agents.phased_interview_agent import PhasedInterviewAgent, SCOPING_QUESTIONS
+from src.agents.phased_interview_agent import (
+    INDUSTRY_DEFAULT_DOMAINS,
+    InterviewPhase,
+    PhasedInterviewAgent,
+    SCOPING_QUESTIONS,
+)
 from src.schemas.implementation_spec import create_spec_from_interview
 from src.swarm.normalizer import normalize_interview
 from src.swarm.registry import ModuleRegistry
@@ -96,6 +104,14 @@ class TestSignalNegation:
         result = detect_signals(long_text)
         assert result.is_confirmed("sales")
 
+    def test_batch_without_any_signal(self):
+        result = detect_signals_multi(["no", "about 12", "yes, twice a week"])
+        assert result.matches == [] and result.evidence == {}
+
+    def test_batch_does_not_match_across_responses(self):
+        # "we" + "bshop" must not join into "webshop"
+        assert detect_signals_multi(["we", "bshop"]).matches == []
+
 
 # ═══════════════════════════════════════════════════════════════
 # INTERVIEW FLOW EDGE CASES
@@ -173,6 +189,26 @@ class TestInterviewEdgeCases:
         result = agent.process_response("", q)
         assert result is not None
 
+    @staticmethod
+    def _finish_scoping_without_signals(agent):
+        while agent.state.phase != InterviewPhase.DOMAIN_EXPERT:
+            agent.process_response("Nothing special to add here, honestly.", agent.get_next_question())
+
+    def test_no_signals_uses_industry_default_domains(self):
+        """With signal-free scoping answers, domains come from the industry table."""
+        assert INDUSTRY_DEFAULT_DOMAINS["Manufacturing"] == ["sales", "inventory", "purchase", "manufacturing"]
+        agent = PhasedInterviewAgent("Quiet Works", "Manufacturing")
+        self._finish_scoping_without_signals(agent)
+
+        assert agent.state.detected_signals == {}
+        assert agent.state.active_domains == ["sales", "inventory", "finance", "purchase", "manufacturing"]
+
+    def test_no_signals_unlisted_industry_falls_back_to_sales(self):
+        agent = PhasedInterviewAgent("Quiet Co", "Aerospace")
+        self._finish_scoping_without_signals(agent)
+
+        assert agent.state.active_domains == ["sales", "finance"]
+
     def test_scoping_questions_expanded(self):
         """Verify we now have 9 scoping questions including tools and timeline."""
         assert len(SCOPING_QUESTIONS) == 9
@@ -201,6 +237,37 @@ class TestInterviewEdgeCases:
                 "Should not get more than 2 follow-ups per question"
 
 
+class TestBranchingEdgeCases:
+    """Test when the branching engine asks follow-ups."""
+
+    THOROUGH_ANSWER = (
+        "Our reps log every lead in a shared spreadsheet, then move qualified opportunities "
+        "through a four stage pipeline. We send each quotation as a PDF from Word, and any "
+        "discount above ten percent needs approval from the sales director before the quote "
+        "goes out to the customer, which usually happens within two days."
+    )
+
+    def _engine(self, llm):
+        return BranchingEngine(analyzer=ResponseAnalyzer(use_llm=True, llm_manager=llm), llm_manager=llm)
+
+    def test_thorough_answer_skips_follow_ups_and_llm(self):
+        llm = MagicMock()
+        analysis, action = self._engine(llm).process_response(
+            self.THOROUGH_ANSWER, "How do you sell?", "sc_01", "sales_crm"
+        )
+        assert analysis.quality == ResponseQuality.COMPLETE
+        assert action.action_type == ActionType.NEXT_QUESTION
+        llm.complete.assert_not_called()
+
+    def test_short_answer_still_gets_follow_up(self):
+        llm = MagicMock()
+        _, action = self._engine(llm).process_response(
+            "We give a discount to big customers and track leads", "How do you sell?", "sc_01", "sales_crm"
+        )
+        assert action.action_type == ActionType.ASK_FOLLOW_UP
+        assert llm.complete.called
+
+
 # ═══════════════════════════════════════════════════════════════
 # PRD GENERATION EDGE CASES
 # ═══════════════════════════════════════════════════════════════
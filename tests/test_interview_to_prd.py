@@ -11,10 +11,14 @@ These tests run without LLM providers by using the deterministic signal detectio
 and mocking the LLM manager where adaptive follow-ups are needed.
 """
 
+import asyncio
 import json
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -34,6 +38,7 @@ from src.agents.adaptive_interview_agent import (
     InterviewContext,
     MODULE_CONFIG_KNOWLEDGE,
 )
+from src.adaptive_cli import run_batch_interviews
 from src.schemas.implementation_spec import (
     ImplementationSpec,
     CompanySetup,
@@ -290,6 +295,16 @@ class TestAdaptiveInterviewAgent:
             assert len(agent.question_queue) == 4
             assert agent.question_queue[0].id == "disc_01"
 
+    def test_question_queue_is_read_only_and_replaceable(self, tmp_path):
+        agent = AdaptiveInterviewAgent(
+            "TestCorp", "Retail", llm_manager=None, output_dir=str(tmp_path),
+        )
+        with pytest.raises(AttributeError):
+            agent.question_queue.append(agent.question_queue[0])
+
+        agent.question_queue = agent.question_queue[2:]
+        assert [q.id for q in agent.question_queue] == ["disc_03", "disc_04"]
+
     def test_manufacturing_signals_detected(self):
         agent = _run_adaptive_interview(
             MANUFACTURING_RESPONSES, "MetalWorks Inc", "Manufacturing"
@@ -350,7 +365,7 @@ class TestAdaptiveInterviewAgent:
             MANUFACTURING_RESPONSES, "MetalWorks Inc", "Manufacturing"
         )
         # The queue should contain module-specific questions beyond the initial 4 discovery
-        all_question_ids = [q.id for q in agent.asked_questions + agent.question_queue]
+        all_question_ids = [q.id for q in [*agent.asked_questions, *agent.question_queue]]
         mrp_questions = [qid for qid in all_question_ids if qid.startswith("mrp_")]
         assert len(mrp_questions) > 0, "Expected MRP-specific questions after detecting manufacturing signals"
 
@@ -383,6 +398,44 @@ class TestAdaptiveInterviewAgent:
             assert data["client_name"] == "TestCorp"
             assert "recommended_modules" in data
             assert "raw_responses" in data
+            answered_at = datetime.fromisoformat(data["raw_responses"]["discovery"][0]["timestamp"])
+            assert abs((answered_at - datetime.now()).total_seconds()) < 60
+            [saved] = data["responses"]
+            assert datetime.fromisoformat(saved["timestamp"]) == answered_at
+            assert "t_offset_ns" not in saved
+
+    def test_compressed_save_roundtrip(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        agent = AdaptiveInterviewAgent(
+            "TestCorp", "Retail",
+            llm_manager=_make_mock_llm_manager(),
+            output_dir=str(tmp_path),
+        )
+        agent.process_response("We sell clothes online via our webshop", agent.get_next_question())
+        path = agent.save_interview(compress=True)
+
+        assert path.endswith(".json.zst")
+        data = json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(Path(path).read_bytes()))
+        assert data["client_name"] == "TestCorp"
+        assert "website_sale" in data["recommended_modules"]
+
+    def test_answers_journaled_before_save(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=_make_mock_llm_manager(),
+                output_dir=tmpdir,
+            )
+            for answer in ["We sell clothes online via our webshop", "Stock counts are wrong"]:
+                agent.process_response(answer, agent.get_next_question())
+
+            records = [json.loads(line) for line in agent.journal_path.read_text().splitlines()]
+            assert [r["a"] for r in records] == [
+                "We sell clothes online via our webshop", "Stock counts are wrong"
+            ]
+            assert records[0]["question_id"] == "disc_01"
+            assert "ecommerce" in records[0]["signals"]
+            agent.save_interview()
 
     def test_llm_followup_injected_at_front_of_queue(self):
         """When the LLM generates a follow-up, it should be inserted at the front."""
@@ -406,6 +459,234 @@ class TestAdaptiveInterviewAgent:
             assert next_q is not None
             assert "production capacity" in next_q.text.lower() or next_q.id.startswith("followup_")
 
+    def test_llm_followups_batched_in_one_call(self):
+        """Several follow-ups from one LLM call are queued in order; answering one asks nothing more."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            mock_llm.complete.return_value = LLMResponse(
+                content="Q: How many production lines do you run?\nQ: Do you track lot numbers?",
+                model="mock",
+                provider="mock",
+            )
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Manufacturing",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+            )
+            q = agent.get_next_question()  # disc_01
+            result = agent.process_response(MANUFACTURING_RESPONSES["disc_01"], q)
+            assert result["followup_generated"] is True
+            assert mock_llm.complete.call_count == 1
+
+            first = agent.get_next_question()
+            assert first.text == "How many production lines do you run?"
+            agent.process_response("Three lines", first)
+            assert mock_llm.complete.call_count == 1
+            assert agent.get_next_question().text == "Do you track lot numbers?"
+
+    def test_module_questions_wait_for_their_dependencies(self, tmp_path):
+        def area(name, questions, depends_on=()):
+            return {"area": name, "questions": questions, "config_fields": ["x"],
+                    "context": name, "depends_on": list(depends_on)}
+
+        knowledge = tmp_path / "knowledge.json"
+        knowledge.write_text(json.dumps({"stock": {"name": "Inventory", "setup_areas": [
+            area("routes", ["Do you buy or make to order?"], depends_on=["warehouses"]),
+            area("warehouses", ["How many warehouses?", "Any bins or shelves?"]),
+            area("loop_a", ["Loop A?"], depends_on=["loop_b"]),
+            area("loop_b", ["Loop B?"], depends_on=["loop_a"]),
+        ]}}))
+        agent = AdaptiveInterviewAgent(
+            "TestCorp", "Retail", llm_manager=None,
+            output_dir=str(tmp_path), config_knowledge_path=str(knowledge),
+        )
+        agent.question_queue = agent._generate_module_questions(["stock"])
+
+        asked = []
+        while (q := agent.get_next_question()) is not None:
+            asked.append(q.text)
+        # A cycle waits until nothing else is ready, then goes by priority
+        assert asked == [
+            "How many warehouses?", "Any bins or shelves?", "Do you buy or make to order?",
+            "Loop A?", "Loop B?",
+        ]
+
+    def test_fully_asked_module_is_skipped(self, tmp_path):
+        agent = AdaptiveInterviewAgent(
+            "TestCorp", "Retail", llm_manager=None, output_dir=str(tmp_path),
+        )
+        for q in agent._generate_module_questions(["purchase"]):
+            agent.process_response("Not applicable", q)
+
+        assert agent._generate_module_questions(["purchase", "crm"])[0].module_source == "crm"
+        assert agent._exhausted_modules == {"purchase"}
+
+    def test_followup_generation_stops_at_sentinel(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            # What a provider returns when decoding halts at the stop sequence
+            mock_llm.complete.return_value = LLMResponse(content="", model="mock", provider="mock")
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+            )
+            result = agent.process_response(
+                "We handle that by hand in a shared spreadsheet today", agent.get_next_question()
+            )
+            assert result["followup_generated"] is False
+            assert mock_llm.complete.call_args.kwargs["stop"] == ["NO_FOLLOWUP"]
+
+    def test_short_answer_skips_llm_followups(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+            )
+            result = agent.process_response("no", agent.get_next_question())
+            assert result["followup_generated"] is False
+            agent.process_response("about twelve people", agent.get_next_question())
+            mock_llm.complete.assert_not_called()
+            assert agent.followups_skipped == 2
+
+    def test_prefetched_refinement_used_by_next_question(self):
+        """Refinement started while the client answers should feed get_next_question."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=_make_mock_llm_manager(),
+                output_dir=tmpdir,
+            )
+            for _ in range(2):
+                agent.process_response("Not applicable", agent.get_next_question())
+            agent.question_queue = agent.question_queue[:1]
+            question = agent.get_next_question()
+
+            refined = DynamicQuestion(
+                id="llm_refined_x", text="Which payment terms do you offer?",
+                context="", module_source="llm_analysis", config_target="configuration_gap", priority=6,
+            )
+            with patch.object(agent, "_use_llm_to_refine_questions", return_value=[refined]) as refine:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    agent.prefetch_questions(executor)
+                    agent.process_response("Not applicable", question)
+                    agent.question_queue = []
+                    assert agent.get_next_question() is refined
+            refine.assert_called_once()
+
+    def test_refinement_kept_while_followups_fill_the_queue(self):
+        """A refinement started before follow-ups refill the queue is used later, not redone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+            )
+            for _ in range(2):
+                agent.process_response("Not applicable", agent.get_next_question())
+            agent.question_queue = agent.question_queue[:1]
+            question = agent.get_next_question()
+
+            def complete(prompt, **kwargs):
+                if "just answered" in prompt:
+                    content = "Q: Who approves refunds?\nQ: How fast are refunds paid?\nQ: Do refunds need a receipt?"
+                else:
+                    content = "Q: Which payment terms do you give wholesale buyers?"
+                return LLMResponse(content=content, model="mock", provider="mock")
+
+            mock_llm.complete.reset_mock()
+            mock_llm.complete.side_effect = complete
+            agent.process_response("We handle that by hand in a shared spreadsheet today", question)
+
+            assert mock_llm.complete.call_count == 2  # Refinement started alongside the follow-ups
+
+            # The follow-ups lifted the queue, so the refinement waits for it to run low again
+            first = agent.get_next_question()
+            agent.process_response("Not applicable", first)
+            second = agent.get_next_question()
+
+            assert [first.text, second.text] == ["Who approves refunds?", "How fast are refunds paid?"]
+            assert "Which payment terms do you give wholesale buyers?" in [q.text for q in agent.question_queue]
+            assert mock_llm.complete.call_count == 2  # Used, not discarded and requested again
+
+    def test_refinement_runs_alongside_followup_generation(self):
+        """Without a prefetch, process_response overlaps refinement with the follow-up call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+            )
+            for _ in range(2):
+                agent.process_response("Not applicable", agent.get_next_question())
+            agent.question_queue = agent.question_queue[:1]
+            question = agent.get_next_question()
+
+            # Each call only returns once the other one is in flight too
+            both_in_flight = threading.Barrier(2, timeout=5)
+
+            def complete(prompt, **kwargs):
+                both_in_flight.wait()
+                return LLMResponse(content="NO_FOLLOWUP", model="mock", provider="mock")
+
+            mock_llm.complete.reset_mock()
+            mock_llm.complete.side_effect = complete
+            agent.process_response("We handle that by hand in a shared spreadsheet today", question)
+            agent.get_next_question()
+
+            assert not both_in_flight.broken
+            assert mock_llm.complete.call_count == 2
+
+    def test_batched_mode_gets_followups_and_refinement_in_one_call(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_llm = _make_mock_llm_manager()
+            agent = AdaptiveInterviewAgent(
+                "TestCorp", "Retail",
+                llm_manager=mock_llm,
+                output_dir=tmpdir,
+                batch_llm_calls=True,
+            )
+            for _ in range(2):
+                agent.process_response("Not applicable", agent.get_next_question())
+            agent.question_queue = agent.question_queue[:1]
+            question = agent.get_next_question()
+
+            mock_llm.complete.reset_mock()
+            mock_llm.complete.return_value = LLMResponse(content=json.dumps([
+                "Q: Do you offer store credit on returns?",
+                "Q: Which payment terms do you give wholesale buyers?",
+            ]), model="mock", provider="mock")
+            agent.process_response("Returns are handled case by case", question)
+
+            assert agent.get_next_question().text == "Do you offer store credit on returns?"
+            assert [q.text for q in agent.question_queue] == [
+                "Which payment terms do you give wholesale buyers?"
+            ]
+            assert mock_llm.complete.call_count == 1
+
+    def test_batch_interviews_run_from_answer_files(self, tmp_path):
+        (tmp_path / "shop.txt").write_text("We sell clothes online via our webshop\nskip\n\nWe count stock weekly\n")
+        (tmp_path / "factory.txt").write_text("We manufacture furniture in our factory\ndone\nnever read\n")
+        llm = _make_mock_llm_manager()
+        agents = [
+            AdaptiveInterviewAgent("TestCorp", "Retail", llm_manager=llm, output_dir=str(tmp_path / name))
+            for name in ("shop", "factory")
+        ]
+
+        paths = asyncio.run(run_batch_interviews(
+            agents, [str(tmp_path / "shop.txt"), str(tmp_path / "factory.txt")]
+        ))
+
+        shop, factory = (json.loads(Path(p).read_text()) for p in paths)
+        assert shop["questions_asked"] == 2
+        assert "website_sale" in shop["recommended_modules"]
+        assert factory["questions_asked"] == 1
+        assert "mrp" in factory["recommended_modules"]
+
 
 # ---------------------------------------------------------------------------
 # 3. Signal detection and normalizer tests
@@ -822,6 +1103,14 @@ class TestModuleConfigKnowledge:
         for key in expected:
             assert key in MODULE_CATALOG, f"MODULE_CATALOG missing '{key}'"
 
+    def test_missing_external_json_falls_back_to_bundled_defaults(self, tmp_path):
+        agent = AdaptiveInterviewAgent(
+            "Acme", "Retail", llm_manager=_make_mock_llm_manager(),
+            output_dir=str(tmp_path), config_knowledge_path=str(tmp_path / "missing.json"),
+        )
+        assert agent.module_config_knowledge == MODULE_CONFIG_KNOWLEDGE
+        assert "sale_management" in agent.module_config_knowledge
+
 
 # ---------------------------------------------------------------------------
 # 7. Shared context / project creation tests
@@ -0,0 +1,70 @@
+"""
+Tests for the on-disk LLM response cache and its use by LLMManager.
+
+No provider is contacted: the manager gets a mock provider.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.base import LLMConfig, LLMResponse, ProviderStatus
+from src.llm.cache import ResponseCache
+from src.llm.manager import LLMManager
+
+
+def _manager(cache):
+    provider = MagicMock()
+    provider.model = "mistral:latest"
+    provider.config = LLMConfig(provider_name="ollama", model="mistral:latest")
+    provider.status = ProviderStatus.AVAILABLE
+    provider.chat.return_value = LLMResponse(
+        content="What is your lead time?", model="mistral:latest", provider="ollama",
+        usage={"total_tokens": 12}, raw_response=object()
+    )
+    with patch.object(LLMManager, "_initialize_providers"):
+        manager = LLMManager(cache=cache)
+    manager._providers["ollama"] = provider
+    manager._current_provider = "ollama"
+    return manager, provider
+
+
+def test_repeated_prompt_is_served_from_cache(tmp_path):
+    manager, provider = _manager(ResponseCache(cache_dir=str(tmp_path)))
+
+    first = manager.complete("Ask about purchasing", max_tokens=150)
+    second = manager.complete("Ask about purchasing", max_tokens=150)
+
+    assert provider.chat.call_count == 1
+    assert second.content == first.content
+    assert second.usage == {"total_tokens": 12}
+
+
+def test_cache_persists_across_managers(tmp_path):
+    manager, _ = _manager(ResponseCache(cache_dir=str(tmp_path)))
+    manager.complete("Ask about purchasing")
+
+    manager, provider = _manager(ResponseCache(cache_dir=str(tmp_path)))
+    assert manager.complete("Ask about purchasing").content == "What is your lead time?"
+    provider.chat.assert_not_called()
+
+
+def test_different_parameters_miss_and_expired_entries_are_ignored(tmp_path):
+    manager, provider = _manager(ResponseCache(cache_dir=str(tmp_path), ttl_seconds=-1))
+
+    manager.complete("Ask about purchasing", max_tokens=150)
+    manager.complete("Ask about purchasing", max_tokens=150)  # Expired immediately
+    manager.complete("Ask about purchasing", max_tokens=300)
+
+    assert provider.chat.call_count == 3
+
+
+def test_no_cache_always_calls_provider():
+    manager, provider = _manager(None)
+
+    manager.complete("Ask about purchasing")
+    manager.complete("Ask about purchasing")
+
+    assert provider.chat.call_count == 2
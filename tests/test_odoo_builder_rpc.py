@@ -69,7 +69,7 @@ def _make_task(task_type, module_name=None):
 
 def _run(coro):
     """Helper to run an async function synchronously."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 @pytest.fixture
@@ -337,3 +337,57 @@ class TestStop:
         result = _run(builder.build())
 
         assert result.status == TaskStatus.FAILED
+
+
+# ── task logs ──
+
+
+class TestTaskLogs:
+    def test_log_buffer_is_bounded(self):
+        from src.builders.odoo_builder import LOG_BUFFER_SIZE
+
+        task = _make_task(TaskType.FINAL_CONFIG)
+        for i in range(LOG_BUFFER_SIZE + 25):
+            task.add_log(f"line {i}")
+
+        assert len(task.logs) == LOG_BUFFER_SIZE
+        assert task.log_count == LOG_BUFFER_SIZE + 25
+
+    def test_state_to_dict_includes_log_tail_and_count(self):
+        from src.builders.odoo_builder import LOG_SNAPSHOT_SIZE
+
+        spec = _make_spec()
+        builder = OdooBuilder(spec, work_dir="/tmp/test-odoo-build")
+        task = _make_task(TaskType.FINAL_CONFIG)
+        builder.state.tasks = [task]
+        for i in range(LOG_SNAPSHOT_SIZE + 5):
+            builder._log(task, f"line {i}")
+
+        data = builder.state.to_dict()["tasks"][0]
+        assert data["log_count"] == LOG_SNAPSHOT_SIZE + 5
+        assert len(data["logs"]) == LOG_SNAPSHOT_SIZE
+        assert data["logs"][0].endswith("line 5")
+        assert data["logs"][-1].endswith(f"line {LOG_SNAPSHOT_SIZE + 4}")
+
+
+# ── _run_command ──
+
+
+class TestRunCommand:
+    def test_returns_stdout_on_success(self):
+        builder = OdooBuilder(_make_spec(), work_dir="/tmp/test-odoo-build")
+        task = _make_task(TaskType.DOCKER_SETUP)
+
+        ok, output = _run(builder._run_command(["sh", "-c", "echo ready"], task))
+
+        assert ok is True
+        assert output.strip() == "ready"
+
+    def test_returns_stderr_on_failure(self):
+        builder = OdooBuilder(_make_spec(), work_dir="/tmp/test-odoo-build")
+        task = _make_task(TaskType.DOCKER_SETUP)
+
+        ok, output = _run(builder._run_command(["sh", "-c", "echo boom >&2; exit 3"], task))
+
+        assert ok is False
+        assert output.strip() == "boom"
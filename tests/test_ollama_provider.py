@@ -0,0 +1,78 @@
+"""
+Tests for the Ollama server probe and its cache.
+
+No Ollama server is needed: probes go to a closed local port or a patched socket.
+"""
+
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm import ollama_provider
+from src.llm.base import ProviderStatus
+from src.llm.ollama_provider import OllamaProvider, is_server_reachable
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    ollama_provider._probe_results.clear()
+    yield
+    ollama_provider._probe_results.clear()
+
+
+@pytest.fixture
+def closed_host():
+    """URL of a local port nothing listens on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_unreachable_host_is_not_configured_without_http_call(closed_host):
+    with patch("requests.get") as get:
+        provider = OllamaProvider(host=closed_host)
+
+    assert provider.status == ProviderStatus.NOT_CONFIGURED
+    get.assert_not_called()
+
+
+def test_probe_result_is_reused_within_ttl():
+    with patch.object(ollama_provider.socket, "create_connection", side_effect=OSError) as connect:
+        assert is_server_reachable("http://ollama.test:11434") is False
+        assert is_server_reachable("http://ollama.test:11434") is False
+        assert connect.call_count == 1
+
+        with patch.object(ollama_provider, "PROBE_TTL_SECONDS", 0):
+            is_server_reachable("http://ollama.test:11434")
+        assert connect.call_count == 2
+
+
+def test_starting_server_clears_probe_cache():
+    with patch.object(ollama_provider.socket, "create_connection", side_effect=OSError):
+        assert is_server_reachable("http://ollama.test:11434") is False
+
+    with patch.object(ollama_provider.subprocess, "Popen"), patch.object(ollama_provider.time, "sleep"):
+        assert OllamaProvider.start_ollama_server() is True
+    assert ollama_provider._probe_results == {}
+
+    with patch.object(ollama_provider.socket, "create_connection", return_value=MagicMock()):
+        assert is_server_reachable("http://ollama.test:11434") is True
+
+
+def test_cli_provider_detection_uses_the_shared_probe(monkeypatch):
+    from src.adaptive_cli import _detect_providers
+
+    monkeypatch.setenv("OLLAMA_HOST", "http://ollama.test:11434")
+    _detect_providers.cache_clear()
+    try:
+        with patch.object(ollama_provider, "is_server_reachable", return_value=True) as probe:
+            assert _detect_providers()["ollama_up"] is True
+        probe.assert_called_once_with("http://ollama.test:11434")
+    finally:
+        _detect_providers.cache_clear()
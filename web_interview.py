@@ -25,8 +25,14 @@ import asyncio
 from pathlib import Path
 from datetime import datetime
 from flask import Flask, render_template_string, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
 import secrets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load .env file
 _env_path = Path(__file__).resolve().parent / ".env"
 if _env_path.exists():
@@ -42,7 +48,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.agents.phased_interview_agent import PhasedInterviewAgent, get_total_interview_estimate
 from src.schemas.implementation_spec import create_spec_from_interview
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; falls back to Flask's encoder for odd types."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    # jsonify and request.json both go through app.json
+    app.json = OrjsonProvider(app)
 app.secret_key = secrets.token_hex(16)
 
 # Store agents per session
@@ -69,14 +88,22 @@ def _load_demo_outcome():
         _DEMO_OUTCOME = json.loads(_p.read_text())
     return _DEMO_OUTCOME
 
-# Try to load whisper for server-side transcription
-try:
-    from src.voice.speech_to_text import SpeechToText
-    import numpy as np
-    WHISPER_AVAILABLE = True
-    whisper_model = None  # Lazy load
-except ImportError:
-    WHISPER_AVAILABLE = False
+# Whisper for server-side transcription is loaded on first use; importing it
+# pulls in numpy and the model runtime, which most sessions never need
+WHISPER_AVAILABLE = (
+    _ilu.find_spec("numpy") is not None and _ilu.find_spec("faster_whisper") is not None
+)
+whisper_model = None
+
+
+def _get_whisper():
+    """Return the shared SpeechToText model, loading it on first call."""
+    global whisper_model
+    if whisper_model is None:
+        from src.voice.speech_to_text import SpeechToText
+        print("Loading Whisper model (first request)...")
+        whisper_model = SpeechToText(model_size="base", language="en")
+    return whisper_model
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -1759,26 +1786,19 @@ def start_interview():
     })
 
 
-@app.route('/api/question', methods=['GET'])
-def get_question():
-    session_id = request.args.get('session_id')
-
-    if session_id not in agents:
-        return jsonify({'error': 'Invalid session'}), 400
-
-    agent = agents[session_id]['agent']
-
+def _next_question_payload(agent):
+    """Next question for the agent, or the summary once the interview is complete."""
     question_data = agent.get_next_question()
 
     if question_data is None or agent.is_complete():
         summary = agent.get_summary()
         agent.save_interview()
-        return jsonify({
+        return {
             'complete': True,
             'summary': summary
-        })
+        }
 
-    return jsonify({
+    return {
         'complete': False,
         'id': question_data['id'],
         'question': question_data['text'],
@@ -1787,7 +1807,19 @@ def get_question():
         'context': question_data.get('context'),
         'expert_intro': question_data.get('expert_intro'),
         'progress': question_data['progress']
-    })
+    }
+
+
+@app.route('/api/question', methods=['GET'])
+def get_question():
+    session_id = request.args.get('session_id')
+
+    if session_id not in agents:
+        return jsonify({'error': 'Invalid session'}), 400
+
+    agent = agents[session_id]['agent']
+
+    return jsonify(_next_question_payload(agent))
 
 
 @app.route('/api/respond', methods=['POST'])
@@ -1811,6 +1843,29 @@ def respond():
     })
 
 
+@app.route('/api/respond_and_next', methods=['POST'])
+def respond_and_next():
+    """Record a response and return the next question in one round-trip."""
+    data = request.json
+    session_id = data.get('session_id')
+    response_text = data.get('response', '')
+    question_info = data.get('question', {})
+
+    if session_id not in agents:
+        return jsonify({'error': 'Invalid session'}), 400
+
+    agent = agents[session_id]['agent']
+
+    result = agent.process_response(response_text, question_info)
+
+    return jsonify({
+        'signals_detected': result.get('signals_detected', {}),
+        'progress': result.get('progress', {}),
+        'domains_active': result.get('domains_active', []),
+        'next': _next_question_payload(agent)
+    })
+
+
 @app.route('/api/skip', methods=['POST'])
 def skip_question():
     data = request.json
@@ -1891,8 +1946,6 @@ def demo_outcome():
 @app.route('/api/transcribe', methods=['POST'])
 def transcribe_audio():
     """Transcribe audio using Whisper (server-side)."""
-    global whisper_model
-
     data = request.json
     audio_b64 = data.get('audio', '')
 
@@ -1911,13 +1964,8 @@ def transcribe_audio():
             f.write(audio_bytes)
             temp_path = f.name
 
-        # Lazy load whisper model
-        if whisper_model is None:
-            print("Loading Whisper model (first request)...")
-            whisper_model = SpeechToText(model_size="base", language="en")
-
         # Transcribe
-        result = whisper_model.transcribe_file(temp_path)
+        result = _get_whisper().transcribe_file(temp_path)
 
         # Clean up
         Path(temp_path).unlink(missing_ok=True)